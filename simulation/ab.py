@@ -0,0 +1,98 @@
+"""Common-random-numbers A/B comparison of two rule variants.
+
+Every seed is played twice, once under each variant, by games that split their
+randomness into separate dice, shuffle and choice streams (Game(split_streams=True)).
+Both games of a pair therefore roll the same dice and shuffle the same way for
+as long as the rules let them, and the noise that the variants share cancels
+out of the paired differences. Run from the simulation directory:
+
+    python ab.py a.toml b.toml -n 20000 -p 4 -w 4
+
+A variant file (TOML or JSON) holds Rules fields, e.g. attack_scaling = 1.5 or a
+[card_counts] table; an empty file, or "default", is the standard game.
+"""
+import argparse
+import multiprocessing
+import random
+
+from simulation import Game, Rules, DEFAULT_RULES, _compact_result, _seed_ranges
+from stats import PairedStats
+from sweep import load_sweep
+
+
+def load_rules(path):
+    """Rules from a variant file, or the standard rules for "default"."""
+    if path == "default":
+        return DEFAULT_RULES
+    return Rules.from_dict(load_sweep(path))
+
+
+def _play_pairs(task):
+    """Plays a (start_seed, count, num_players, rules_a, rules_b) range of paired games."""
+    start_seed, count, num_players, rules_a, rules_b = task
+    stats = PairedStats()
+    for seed in range(start_seed, start_seed + count):
+        results = []
+        for rules in (rules_a, rules_b):
+            game = Game(num_players=num_players, silent_deck=True, seed=seed, rules=rules, split_streams=True)
+            results.append(_compact_result(seed, game.run_simulation()))
+        stats.add(*results)
+    return stats
+
+
+def run_ab(rules_a, rules_b, num_simulations=1000, num_players=4, workers=1, seed=None):
+    """Plays seeds seed .. seed + num_simulations - 1 under both variants and prints the paired report."""
+    if seed is None:
+        seed = random.randrange(2**32)
+    print(f"--- Comparing {num_simulations} Paired Simulations (seed {seed}) ---")
+    chunk_size = max(1, min(1000, num_simulations // (workers * 4)))
+    tasks = (task[:3] + (rules_a, rules_b) for task in _seed_ranges(seed, num_simulations, num_players, chunk_size))
+
+    stats = PairedStats()
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            for chunk_stats in pool.imap_unordered(_play_pairs, tasks):
+                stats.merge(chunk_stats)
+    else:
+        for task in tasks:
+            stats.merge(_play_pairs(task))
+
+    stats.report()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two Chicken Die! rule variants with common random numbers.")
+    parser.add_argument("variant_a", help="Rules file for variant A (.toml or .json), or 'default'.")
+    parser.add_argument("variant_b", help="Rules file for variant B (.toml or .json), or 'default'.")
+    parser.add_argument(
+        "-n", "--num-simulations",
+        type=int,
+        default=1000,
+        help="The number of seeds to play under both variants."
+    )
+    parser.add_argument(
+        "-p", "--num-players",
+        type=int,
+        default=4,
+        help="The number of players in the game."
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes to spread simulations across."
+    )
+    parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed of the first pair; pair i uses seed + i. Random if omitted."
+    )
+    args = parser.parse_args()
+    run_ab(load_rules(args.variant_a), load_rules(args.variant_b), num_simulations=args.num_simulations,
+           num_players=args.num_players, workers=args.workers, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Engine throughput benchmarks with JSON baselines.
+
+Run from the simulation directory:
+
+    python -m benchmarks run -o baseline.json
+    python -m benchmarks compare baseline.json --threshold 0.10
+
+`run` measures games/sec and turns/sec for fixed seeds at several player counts,
+the cost per call of every card handler in Game.card_dispatcher and of
+roll_chicken_die, how many lookahead rollouts per second a RolloutStrategy
+gets through (clone, play out, score), and by how much recording a TurnTrace
+slows games down, which should stay under 10% for the default row. `compare`
+re-runs the suite and flags every metric that got slower than the baseline by
+more than the threshold.
+"""
+import gc
+import platform
+import time
+
+from simulation import Game, DEFAULT_STRATEGY
+from rollout import RolloutStrategy
+from traces import TurnTrace, DEFAULT_COLUMNS, ALL_COLUMNS
+
+PLAYER_COUNTS = (2, 4, 8, 32)
+
+
+def _games_for(num_players, scale):
+    return max(2, int(scale * 400 / num_players))
+
+
+def bench_engine(num_players, num_games, repeats=3):
+    """Best-of-repeats games/sec and turns/sec for seeds 0..num_games-1, setup included."""
+    best = None
+    for _ in range(repeats):
+        turns = 0
+        start = time.perf_counter()
+        for seed in range(num_games):
+            turns += Game(num_players=num_players, silent_deck=True, seed=seed).run_simulation()["turns"]
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, turns)
+    elapsed, turns = best
+    return {"games_per_sec": num_games / elapsed, "turns_per_sec": turns / elapsed}
+
+
+def _fresh_games(count, num_players=4):
+    # Advance each game a few turns so hands, supplies and flocks are realistic
+    games = []
+    for seed in range(count):
+        game = Game(num_players=num_players, silent_deck=True, seed=seed)
+        for _ in range(3):
+            game.turn += 1
+            game.take_turn(game.players[game.turn % num_players])
+        games.append(game)
+    return games
+
+
+def bench_handlers(calls=300, repeats=3):
+    """Best-of-repeats nanoseconds per call for each card handler and roll_chicken_die.
+
+    Every call runs on its own freshly set-up game (seeded, so the same states are
+    used on every run), and only the handler calls themselves are timed.
+    """
+    names = list(Game(silent_deck=True, seed=0).card_dispatcher) + ["roll_chicken_die"]
+    results = {}
+    for name in names:
+        best = None
+        for _ in range(repeats):
+            games = _fresh_games(calls)
+            if name == "roll_chicken_die":
+                targets = [(game.roll_chicken_die, game.players[0]) for game in games]
+            else:
+                targets = [(game.card_dispatcher[name], game.players[0]) for game in games]
+            # Like timeit, keep the collector out of the timed loop
+            gc.disable()
+            try:
+                start = time.perf_counter_ns()
+                for handler, player in targets:
+                    handler(player)
+                elapsed = time.perf_counter_ns() - start
+            finally:
+                gc.enable()
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best / calls
+    return results
+
+
+def bench_rollouts(num_games, repeats=3):
+    """Best-of-repeats rollouts/sec of a RolloutStrategy in seat 1 of seeded 4-player games."""
+    best = None
+    for _ in range(repeats):
+        rollouts = 0
+        start = time.perf_counter()
+        for seed in range(num_games):
+            strategy = RolloutStrategy(rollouts=40, seed=seed)
+            strategies = [strategy] + [DEFAULT_STRATEGY] * 3
+            Game(num_players=4, silent_deck=True, seed=seed, strategies=strategies).run_simulation()
+            rollouts += strategy.total_rollouts
+        rate = rollouts / (time.perf_counter() - start)
+        best = rate if best is None else max(best, rate)
+    return {"rollouts_per_sec": best}
+
+
+def bench_tracing(num_games, repeats=3):
+    """Best-of-repeats percentage by which a TurnTrace slows seeded 4-player games, for the default and the full row.
+
+    The untraced and traced runs of each seed alternate (in alternating order), so
+    drift in the machine's speed over the run hits every mode alike. The traced
+    time includes converting the trace to columns at the end.
+    """
+    modes = {"untraced": None, "overhead_pct": DEFAULT_COLUMNS, "full_row_overhead_pct": ALL_COLUMNS}
+    best = dict.fromkeys(modes)
+    for _ in range(repeats):
+        traces = {mode: None if columns is None else TurnTrace(4, columns) for mode, columns in modes.items()}
+        elapsed = dict.fromkeys(modes, 0.0)
+        order = list(modes)
+        for seed in range(num_games):
+            order.reverse()
+            for mode in order:
+                start = time.perf_counter()
+                Game(num_players=4, silent_deck=True, seed=seed, trace=traces[mode]).run_simulation()
+                elapsed[mode] += time.perf_counter() - start
+        for mode, trace in traces.items():
+            if trace is not None:
+                start = time.perf_counter()
+                trace.columns()
+                elapsed[mode] += time.perf_counter() - start
+        for mode, total in elapsed.items():
+            best[mode] = total if best[mode] is None else min(best[mode], total)
+    untraced = best.pop("untraced")
+    return {mode: 100 * (total / untraced - 1) for mode, total in best.items()}
+
+
+def run_suite(scale=1.0, repeats=3):
+    """Runs every benchmark and returns the results as a JSON-ready dict."""
+    engine = {}
+    for num_players in PLAYER_COUNTS:
+        engine[f"{num_players}_players"] = bench_engine(num_players, _games_for(num_players, scale), repeats)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "scale": scale,
+        },
+        "engine": engine,
+        "handlers_ns_per_call": bench_handlers(max(10, int(300 * scale)), repeats),
+        "lookahead": bench_rollouts(max(1, int(10 * scale)), repeats),
+        "tracing": bench_tracing(max(10, int(400 * scale)), repeats),
+    }
+
+
+def compare(baseline, current, threshold=0.10):
+    """Lists (metric, baseline, current, slowdown) for every metric slower by more than threshold.
+
+    Rates (games/sec, turns/sec, rollouts/sec) are slower when lower, handler timings
+    and tracing overheads when higher; slowdown is the relative increase in time per
+    unit of work.
+    """
+    regressions = []
+    for config, metrics in baseline.get("engine", {}).items():
+        for metric, old in metrics.items():
+            new = current.get("engine", {}).get(config, {}).get(metric)
+            if new:
+                slowdown = old / new - 1
+                if slowdown > threshold:
+                    regressions.append((f"engine.{config}.{metric}", old, new, slowdown))
+    for metric, old in baseline.get("lookahead", {}).items():
+        new = current.get("lookahead", {}).get(metric)
+        if new:
+            slowdown = old / new - 1
+            if slowdown > threshold:
+                regressions.append((f"lookahead.{metric}", old, new, slowdown))
+    for metric, old in baseline.get("tracing", {}).items():
+        new = current.get("tracing", {}).get(metric)
+        if new is not None:
+            slowdown = (100 + new) / (100 + old) - 1
+            if slowdown > threshold:
+                regressions.append((f"tracing.{metric}", old, new, slowdown))
+    for name, old in baseline.get("handlers_ns_per_call", {}).items():
+        new = current.get("handlers_ns_per_call", {}).get(name)
+        if new and old:
+            slowdown = new / old - 1
+            if slowdown > threshold:
+                regressions.append((f"handlers_ns_per_call.{name}", old, new, slowdown))
+    return regressions
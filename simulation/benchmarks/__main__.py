@@ -0,0 +1,73 @@
+import argparse
+import json
+import sys
+
+from benchmarks import run_suite, compare
+
+
+def _print_results(results):
+    print("Engine throughput:")
+    for config, metrics in results["engine"].items():
+        print(f"  {config}: {metrics['games_per_sec']:.1f} games/sec, {metrics['turns_per_sec']:.0f} turns/sec")
+    if "lookahead" in results:
+        print(f"Lookahead: {results['lookahead']['rollouts_per_sec']:.0f} rollouts/sec")
+    if "tracing" in results:
+        tracing = results["tracing"]
+        print(f"Tracing overhead: {tracing['overhead_pct']:+.1f}% default row, "
+              f"{tracing['full_row_overhead_pct']:+.1f}% full row")
+    print("Handler cost per call:")
+    for name, ns in sorted(results["handlers_ns_per_call"].items(), key=lambda item: -item[1]):
+        print(f"  {name}: {ns / 1000:.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Chicken Die! engine.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run the suite and optionally save a JSON baseline.")
+    run_parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    compare_parser = subparsers.add_parser("compare", help="Run the suite and compare it against a baseline.")
+    compare_parser.add_argument("baseline", help="JSON file written by 'run -o'.")
+    compare_parser.add_argument(
+        "-t", "--threshold",
+        type=float,
+        default=0.10,
+        help="Flag metrics more than this fraction slower than the baseline."
+    )
+    for sub in (run_parser, compare_parser):
+        sub.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiply the number of games and handler calls (use < 1 for a quick run)."
+        )
+        sub.add_argument("--repeats", type=int, default=3, help="Keep the best of this many repeats.")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        # Use the baseline's workload so the numbers are comparable
+        results = run_suite(scale=baseline["meta"]["scale"], repeats=args.repeats)
+    else:
+        results = run_suite(scale=args.scale, repeats=args.repeats)
+    _print_results(results)
+
+    if args.command == "run":
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+            print(f"Baseline written to {args.output}")
+        return 0
+
+    regressions = compare(baseline, results, args.threshold)
+    if not regressions:
+        print(f"\nNo slowdowns above {args.threshold:.0%} against {args.baseline}.")
+        return 0
+    print(f"\nSlowdowns above {args.threshold:.0%} against {args.baseline}:")
+    for metric, old, new, slowdown in regressions:
+        print(f"  {metric}: {old:.1f} -> {new:.1f} ({slowdown:+.1%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
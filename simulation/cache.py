@@ -0,0 +1,81 @@
+"""SQLite store of merged SimulationStats, so re-runs only play the games they are missing.
+
+Results are stored per configuration and seed range. A configuration is any
+JSON-ready dict that fully determines the games for a given seed (simulation.py
+uses the player count, the Rules and ENGINE_VERSION); it is stored under the
+SHA-256 of its canonical JSON. Each stored segment is the merged aggregate of the
+games seeded start .. stop - 1.
+
+plan() splits a requested seed range into the aggregate of stored segments that
+lie inside it and the gaps that still need playing; store() records a gap once
+it has been played, so the next run over the same range plays nothing.
+"""
+import hashlib
+import json
+import sqlite3
+
+from stats import SimulationStats
+
+
+def config_key(config):
+    """SHA-256 of the canonical JSON of a configuration dict."""
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """Seed-range segments of merged aggregates in one SQLite file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS configs (key TEXT PRIMARY KEY, config TEXT NOT NULL)")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS segments ("
+                " key TEXT NOT NULL, start INTEGER NOT NULL, stop INTEGER NOT NULL, stats TEXT NOT NULL,"
+                " PRIMARY KEY (key, start, stop))")
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def plan(self, config, seed, count):
+        """Returns (cached stats, gaps) for seeds seed .. seed + count - 1 under config.
+
+        cached merges the stored segments that lie wholly inside the range (taken in
+        seed order, skipping any that overlap one already taken); gaps is the list of
+        (start_seed, count) ranges that are not covered by them.
+        """
+        stop = seed + count
+        rows = self.db.execute(
+            "SELECT start, stop, stats FROM segments WHERE key = ? AND start >= ? AND stop <= ?"
+            " ORDER BY start, stop DESC",
+            (config_key(config), seed, stop))
+        cached = SimulationStats()
+        gaps = []
+        position = seed
+        for start, end, stats in rows:
+            if start < position:
+                continue
+            if start > position:
+                gaps.append((position, start - position))
+            cached.merge(SimulationStats.from_dict(json.loads(stats)))
+            position = end
+        if position < stop:
+            gaps.append((position, stop - position))
+        return cached, gaps
+
+    def store(self, config, seed, count, stats):
+        """Records the aggregate of the games seeded seed .. seed + count - 1."""
+        key = config_key(config)
+        with self.db:
+            self.db.execute("INSERT OR IGNORE INTO configs VALUES (?, ?)",
+                            (key, json.dumps(config, sort_keys=True)))
+            self.db.execute("INSERT OR REPLACE INTO segments VALUES (?, ?, ?, ?)",
+                            (key, seed, seed + count, json.dumps(stats.to_dict())))
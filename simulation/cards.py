@@ -0,0 +1,169 @@
+"""The card registry: every Chicken Die! card defined once, compiled into lookup tables.
+
+REGISTRY lists one CardSpec per card: its name, type, base count, how the count
+scales with the number of players, the flock kind it becomes when played (the
+specialty chickens), the Game method that resolves it and whether it is a
+predator (a Dino Chicken cannot be killed by one). At import the registry is
+compiled into the interned Card objects and into tuples indexed by card id or
+flock kind, so the engine's hot paths look a card's properties up with a single
+index instead of building name mappings:
+
+    CARD_FLOCK_KIND[card.id]    flock kind a played card joins, or -1
+    CARD_HANDLERS[card.id]      name of the Game method that resolves it, or None
+    CARD_PREDATOR[card.id]      whether its kills spare Dino Chickens
+    SPECIALTY_NAMES[kind]       card name of a specialty flock kind, or None
+"""
+from typing import NamedTuple
+
+# Flock kinds, in the order Player.flock lists them. Players store their flock as
+# an integer array indexed by these constants.
+FLOCK_KEYS = (
+    "Chicks",
+    "Hens",
+    "Dino Chickens",
+    "Flying Chickens",
+    "Mad Scientist Chickens",
+    "Robo-Hens",
+    "Decoy Chickens",
+    "Punk Rock Chicks",
+)
+CHICKS, HENS, DINO, FLYING, MAD, ROBO, DECOY, PUNK = range(len(FLOCK_KEYS))
+FLOCK_INDEX = {key: i for i, key in enumerate(FLOCK_KEYS)}
+
+# How a card's count grows with the number of players (see simulation._deck_card_ids)
+FIXED = "fixed" # Never scaled
+PLAYERS = "players" # Scaled by num_players / Rules.base_players
+ATTACK = "attack" # Scaled like PLAYERS, and by Rules.attack_scaling
+
+
+class CardSpec(NamedTuple):
+    name: str
+    card_type: str
+    count: int # Copies in a deck for Rules.base_players players
+    scaling: str = PLAYERS
+    flock_kind: int = -1 # Flock kind the card becomes when played, -1 if none
+    handler: str = None # Game method resolving the card, None if playing it has no effect
+    predator: bool = False
+
+
+REGISTRY = (
+    # 1. Specialty Chicken Cards
+    CardSpec("Dino Chicken", "Specialty Chicken", 1, FIXED, DINO),
+    CardSpec("Flying Chicken", "Specialty Chicken", 1, FIXED, FLYING),
+    CardSpec("Mad Scientist Chicken", "Specialty Chicken", 1, FIXED, MAD),
+    CardSpec("Robo-Hen", "Specialty Chicken", 1, FIXED, ROBO),
+    CardSpec("Decoy Chicken", "Specialty Chicken", 1, FIXED, DECOY),
+    CardSpec("Punk Rock Chick", "Specialty Chicken", 1, FIXED, PUNK),
+    # 2. Protection Cards
+    CardSpec("Immunity", "Protection", 3),
+    CardSpec("Chicken Wire", "Protection", 2),
+    CardSpec("Cock Block", "Protection", 3),
+    # 3. Attack Cards
+    CardSpec("Coyote Attack", "Attack", 2, ATTACK, handler="_play_coyote_attack", predator=True),
+    CardSpec("Chicken Blaster", "Attack", 3, ATTACK, handler="_play_chicken_blaster", predator=True),
+    CardSpec("Die-Die-Die!", "Attack", 2, ATTACK, handler="_play_die_die_die"),
+    CardSpec("Hen Swap", "Attack", 2, ATTACK, handler="_play_hen_swap"),
+    CardSpec("3-Egg Omelette", "Attack", 2, ATTACK, handler="_play_omelette"),
+    CardSpec("Infertility", "Attack", 1, ATTACK, handler="_play_infertility"),
+    CardSpec("Eat Mor Chikin", "Attack", 2, ATTACK, handler="_play_eat_mor_chikin", predator=True),
+    # 4. Instant Effect Cards
+    CardSpec("Chicken Bomb", "Instant Effect", 3, handler="_play_chicken_bomb"),
+    CardSpec("Demotion", "Instant Effect", 1, handler="_play_demotion"),
+    CardSpec("Foster Farms", "Instant Effect", 1, handler="_play_foster_farms"),
+    CardSpec("Bird Flu", "Instant Effect", 1, handler="_play_bird_flu"),
+    CardSpec("Fox on the Loose", "Instant Effect", 1, handler="_play_fox_on_the_loose"),
+    CardSpec("Chicken Assassin", "Instant Effect", 1, handler="_play_chicken_assassin"),
+    # 5. Personal Growth Cards
+    CardSpec("Feeding Frenzy", "Personal Growth", 1, handler="_play_feeding_frenzy"),
+    CardSpec("Incubator", "Personal Growth", 1, handler="_play_incubator"),
+    CardSpec("Farm to Table", "Personal Growth", 1, handler="_play_farm_to_table"),
+    CardSpec("Resurrection", "Personal Growth", 1, handler="_play_resurrection"),
+    # 6. Turn Altering Cards
+    CardSpec("Take it or Leave it", "Turn Altering", 2),
+    CardSpec("End Your Turn", "Turn Altering", 2, handler="_play_end_your_turn"),
+    CardSpec("Reverse", "Turn Altering", 1, handler="_play_reverse"),
+)
+
+# Card types in registry order; card.type_id indexes this tuple
+CARD_TYPES = tuple(dict.fromkeys(spec.card_type for spec in REGISTRY))
+CARD_TYPE_INDEX = {card_type: i for i, card_type in enumerate(CARD_TYPES)}
+_REGISTERED_TYPES = {spec.name: spec.card_type for spec in REGISTRY} # Card name -> its card type
+
+
+class Card:
+    """An action card.
+
+    Cards are interned flyweights: there is one Card per card name, shared by every
+    deck and hand, and card.id is its index in CARDS (and in REGISTRY). Decks and
+    discard piles store only the ids.
+    """
+    __slots__ = ("id", "name", "card_type", "type_id")
+    _interned = {}
+
+    def __new__(cls, name, card_type):
+        registered_type = _REGISTERED_TYPES.get(name)
+        if registered_type is None:
+            raise ValueError(f"{name!r} is not a card in the registry")
+        if card_type != registered_type:
+            raise ValueError(f"{name!r} is a {registered_type!r} card, not {card_type!r}")
+        card = cls._interned.get(name)
+        if card is None:
+            card = object.__new__(cls)
+            card.id = len(CARDS)
+            card.name = name
+            card.card_type = card_type
+            card.type_id = CARD_TYPES.index(card_type)
+            CARDS.append(card)
+            cls._interned[name] = card
+        return card
+
+    def __repr__(self):
+        return f"Card(name='{self.name}', type='{self.card_type}')"
+
+    def __reduce__(self):
+        # Copies and unpickled cards resolve to the interned flyweight
+        return (Card, (self.name, self.card_type))
+
+
+# --- Compiled tables ---
+
+CARDS = [] # Indexed by card id
+for spec in REGISTRY:
+    Card(spec.name, spec.card_type)
+CARDS_BY_NAME = {card.name: card for card in CARDS}
+
+CARD_SCALING = tuple(spec.scaling for spec in REGISTRY)
+CARD_FLOCK_KIND = tuple(spec.flock_kind for spec in REGISTRY)
+CARD_HANDLERS = tuple(spec.handler for spec in REGISTRY)
+CARD_PREDATOR = tuple(spec.predator for spec in REGISTRY)
+# Card ids of each type, ascending, indexed by type_id
+CARD_IDS_BY_TYPE = tuple(tuple(card.id for card in CARDS if card.type_id == i) for i in range(len(CARD_TYPES)))
+
+# Specialty chickens by flock kind; killed ones go to the graveyard under their card name
+SPECIALTY_NAMES = tuple(next((spec.name for spec in REGISTRY if spec.flock_kind == kind), None)
+                        for kind in range(len(FLOCK_KEYS)))
+SPECIALTY_KINDS = tuple(kind for kind, name in enumerate(SPECIALTY_NAMES) if name is not None)
+SPECIALTY_KIND_BY_NAME = {SPECIALTY_NAMES[kind]: kind for kind in SPECIALTY_KINDS}
+
+# Cards the engine names directly, bound once so handlers need no name lookup
+COCK_BLOCK = CARDS_BY_NAME["Cock Block"]
+IMMUNITY = CARDS_BY_NAME["Immunity"]
+COYOTE_ATTACK = CARDS_BY_NAME["Coyote Attack"]
+CHICKEN_BLASTER = CARDS_BY_NAME["Chicken Blaster"]
+EAT_MOR_CHIKIN = CARDS_BY_NAME["Eat Mor Chikin"]
+FARM_TO_TABLE = CARDS_BY_NAME["Farm to Table"]
+DIE_DIE_DIE = CARDS_BY_NAME["Die-Die-Die!"]
+HEN_SWAP = CARDS_BY_NAME["Hen Swap"]
+BIRD_FLU = CARDS_BY_NAME["Bird Flu"]
+THREE_EGG_OMELETTE = CARDS_BY_NAME["3-Egg Omelette"]
+INFERTILITY = CARDS_BY_NAME["Infertility"]
+DEMOTION = CARDS_BY_NAME["Demotion"]
+FOSTER_FARMS = CARDS_BY_NAME["Foster Farms"]
+FOX_ON_THE_LOOSE = CARDS_BY_NAME["Fox on the Loose"]
+CHICKEN_ASSASSIN = CARDS_BY_NAME["Chicken Assassin"]
+CHICKEN_BOMB = CARDS_BY_NAME["Chicken Bomb"]
+END_YOUR_TURN = CARDS_BY_NAME["End Your Turn"]
+REVERSE = CARDS_BY_NAME["Reverse"]
+
+# The registry as plain {"name", "type", "count"} entries
+DECK_COMPOSITION = [{"name": spec.name, "type": spec.card_type, "count": spec.count} for spec in REGISTRY]
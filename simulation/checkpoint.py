@@ -0,0 +1,86 @@
+"""Periodic, atomic checkpoints of a batch run, so it can be resumed after a crash.
+
+A batch run merges chunk aggregates in seed order, so its progress is always a
+contiguous prefix of its seed range: the games seeded seed .. next_seed - 1 are
+done and merged into one SimulationStats, and every later game is still to be
+played. Since each game depends only on its seed, a checkpoint holds the run's
+arguments, next_seed and the merged aggregate, and resuming plays next_seed
+onwards into that aggregate, ending with the same numbers as an uninterrupted
+run.
+
+Checkpoints are JSON, written to a temporary file in the same directory and then
+renamed over the old one, so a kill at any moment leaves either the previous or
+the new checkpoint intact.
+"""
+import json
+import os
+import tempfile
+import time
+
+from stats import SimulationStats
+
+CHECKPOINT_FORMAT = 1
+
+
+def save_checkpoint(path, state):
+    """Atomically replaces the checkpoint at path with state (a JSON-ready dict)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_checkpoint(path, engine_version=None):
+    """Reads a checkpoint; returns (run arguments, next_seed, SimulationStats, complete).
+
+    With engine_version, a checkpoint written by another engine version raises a
+    ValueError: its seeds would play out differently, so the resumed run would mix
+    two engines' games into one aggregate.
+    """
+    with open(path) as f:
+        state = json.load(f)
+    if state.get("format") != CHECKPOINT_FORMAT:
+        raise ValueError(f"{path} is not a checkpoint this version can resume")
+    if engine_version is not None and state.get("engine_version") != engine_version:
+        raise ValueError(f"{path} was written by engine version {state.get('engine_version')}, "
+                         f"not the current version {engine_version}; start the run afresh")
+    return state["run"], state["next_seed"], SimulationStats.from_dict(state["stats"]), state["complete"]
+
+
+class Checkpointer:
+    """Writes a checkpoint at most every interval seconds while a run progresses."""
+
+    def __init__(self, path, run, interval=60.0, engine_version=None):
+        self.path = path
+        self.run = run
+        self.interval = interval
+        self.engine_version = engine_version
+        self.next_seed = None
+        self.stats = None
+        self.last_save = time.monotonic()
+
+    def update(self, next_seed, stats):
+        """Records progress after a merge and saves if the interval has passed."""
+        self.next_seed, self.stats = next_seed, stats
+        if time.monotonic() - self.last_save >= self.interval:
+            self.save()
+
+    def save(self, complete=False):
+        if self.stats is None:
+            return
+        save_checkpoint(self.path, {
+            "format": CHECKPOINT_FORMAT,
+            "engine_version": self.engine_version,
+            "run": self.run,
+            "next_seed": self.next_seed,
+            "stats": self.stats.to_dict(),
+            "complete": complete,
+        })
+        self.last_save = time.monotonic()
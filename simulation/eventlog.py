@@ -0,0 +1,321 @@
+"""Compact binary event logs for post-hoc analysis of many games.
+
+BinaryEventLog is an event sink that packs the game events into fixed-width
+records and appends them to a file; read_events maps the file into a NumPy
+structured array without copying it, so millions of games can be filtered with
+array expressions instead of being re-simulated:
+
+    events = read_events("games.evlog")
+    kills = events[events["event"] == CHICKEN_KILLED]
+    coyote_kills = kills[kills["card"] == CARDS_BY_NAME["Coyote Attack"].id]
+
+Every record is EVENT_DTYPE (18 bytes, little-endian):
+
+    game    uint64  the game's seed
+    turn    uint16  turn number (0 before the first turn)
+    event   uint8   CARD_PLAYED, TARGET_CHOSEN, DIE_ROLLED, ... (EVENT_NAMES)
+    actor   int8    seat of the player acting: who played the card, or who rolled
+    target  int8    seat of the player affected, -1 if none
+    card    int8    card id of the card responsible, -1 if none (e.g. the Chicken Die step)
+    roll    int8    die roll responsible, 0 if none
+    kind    int8    flock kind affected (FLOCK_KEYS index), -1 if none
+    delta   int16   change to that flock kind, or eggs moved, or 1/0 for an applied die outcome,
+                    or the turns without progress when a game ends as a stalemate
+
+FLOCK_CHANGE records are the complete ledger of every flock: each game starts
+with one per opening chicken kind at turn 0, and every later gain, loss,
+promotion, demotion and swap follows, so summing the deltas of a game by
+target and kind gives its flocks at any turn. CHICKEN_KILLED records repeat
+the -1 of a kill to say which card (or roll) killed which chicken of whom;
+like the other changes, kills are attributed to the card being resolved and
+the die roll that caused them. The file starts with a 16-byte header; records are
+appended after it, so logs of several runs can share a file. Run from the
+simulation directory to log a batch of seeded games and summarize the log:
+
+    python eventlog.py games.evlog -n 10000 -p 4 -w 4 -s 0
+"""
+import argparse
+import multiprocessing
+import random
+import struct
+
+import numpy as np
+
+from cards import CARDS, CARDS_BY_NAME, SPECIALTY_KIND_BY_NAME, CHICKS, HENS
+from events import (
+    GameStarted, PlayerTurn, TurnStarted, CardPlayed, TargetChosen, DieRolled, DieOutcome, ChickenKilled,
+    FlockChanged, HensSwapped, HenMadeInfertile, ChickBought, EggsCollected, EggsDestroyed, AttackBlocked,
+    FoxVisits, GameOver, GameStalled,
+)
+from simulation import Game, _seed_ranges
+
+MAGIC = b"CHKDIE-EVLOG\x00\x00\x00\x02" # Format version in the last byte
+RECORD = struct.Struct("<QHBbbbbbh")
+EVENT_DTYPE = np.dtype([
+    ("game", "<u8"), ("turn", "<u2"), ("event", "u1"), ("actor", "i1"), ("target", "i1"),
+    ("card", "i1"), ("roll", "i1"), ("kind", "i1"), ("delta", "<i2"),
+])
+assert EVENT_DTYPE.itemsize == RECORD.size
+
+# Record types
+EVENT_NAMES = ("card_played", "target_chosen", "die_rolled", "die_outcome", "chicken_killed", "flock_change",
+               "eggs", "attack_blocked", "game_over", "infertile_hen")
+(CARD_PLAYED, TARGET_CHOSEN, DIE_ROLLED, DIE_OUTCOME, CHICKEN_KILLED, FLOCK_CHANGE,
+ EGGS, ATTACK_BLOCKED, GAME_OVER, INFERTILE_HEN) = range(len(EVENT_NAMES))
+
+_FOX = CARDS_BY_NAME["Fox on the Loose"].id
+_CHICKEN_KINDS = dict(SPECIALTY_KIND_BY_NAME, Chick=CHICKS, Hen=HENS)
+
+
+def _seat(player):
+    return player.seat if player is not None else -1
+
+
+def _card_id(card):
+    return card.id if card is not None else -1
+
+
+class BinaryEventLog:
+    """Appends packed event records to a file, buffered in blocks of buffer_records.
+
+    Set game to the seed of each game before playing it; the log tracks the turn,
+    the acting player and the card and roll being resolved from the events. With
+    no path the records stay in memory until taken with take().
+    """
+    enabled = True
+
+    def __init__(self, path=None, buffer_records=65536):
+        self.path = path
+        self.file = None
+        if path is not None:
+            self.file = open(path, "a+b")
+            if self.file.tell() == 0:
+                self.file.write(MAGIC)
+            else:
+                self.file.seek(0)
+                header = self.file.read(len(MAGIC))
+                if header != MAGIC:
+                    self.file.close()
+                    raise ValueError(f"{path} is not an event log this version can append to")
+        self.buffer = bytearray()
+        self.buffer_bytes = buffer_records * RECORD.size
+        self.records = 0
+        self.game = 0
+        self._reset_context(0, -1)
+        self._handlers = {
+            GameStarted: lambda e: self._reset_context(0, -1),
+            PlayerTurn: self._player_turn,
+            TurnStarted: self._turn_started,
+            CardPlayed: self._card_played,
+            TargetChosen: lambda e: self._record(TARGET_CHOSEN, e.player.seat, e.target.seat, e.card.id),
+            DieRolled: self._die_rolled,
+            DieOutcome: lambda e: self._record(DIE_OUTCOME, self._actor, e.player.seat, self._card,
+                                               e.roll, -1, int(e.applied)),
+            ChickenKilled: self._chicken_killed,
+            FlockChanged: lambda e: self._record(FLOCK_CHANGE, self._actor, e.player.seat, self._card,
+                                                 self._roll, e.kind, e.delta),
+            HensSwapped: lambda e: self._record(TARGET_CHOSEN, e.player.seat, e.target.seat, self._card),
+            HenMadeInfertile: lambda e: self._record(INFERTILE_HEN, e.player.seat, e.target.seat, self._card,
+                                                     0, HENS, 1),
+            ChickBought: self._chick_bought,
+            EggsCollected: lambda e: self._record(EGGS, e.player.seat, e.player.seat, _card_id(e.card),
+                                                  0, -1, e.amount),
+            EggsDestroyed: lambda e: self._record(EGGS, e.player.seat, e.target.seat, self._card,
+                                                  0, -1, -e.amount),
+            AttackBlocked: lambda e: self._record(ATTACK_BLOCKED, _seat(e.attacker), e.player.seat, e.card.id),
+            FoxVisits: self._fox_visits,
+            GameOver: lambda e: self._record(GAME_OVER, -1, _seat(e.winner), -1),
+            GameStalled: lambda e: self._record(GAME_OVER, -1, -1, -1, 0, -1, e.quiet_turns),
+        }
+
+    def _reset_context(self, turn, actor):
+        self.turn = turn
+        self._actor = actor
+        self._card = -1
+        self._roll = 0
+        self._fox_rolls = 0
+
+    def emit(self, event):
+        handler = self._handlers.get(type(event))
+        if handler is not None:
+            handler(event)
+
+    def _record(self, event, actor, target, card, roll=0, kind=-1, delta=0):
+        self.buffer += RECORD.pack(self.game, self.turn, event, actor, target, card, roll, kind, delta)
+        self.records += 1
+        if len(self.buffer) >= self.buffer_bytes and self.file is not None:
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+
+    def _turn_started(self, e):
+        self._reset_context(e.turn, -1)
+
+    def _player_turn(self, e):
+        self._reset_context(self.turn, e.player.seat)
+
+    def _card_played(self, e):
+        self._actor, self._card, self._roll = e.player.seat, e.card.id, 0
+        self._record(CARD_PLAYED, e.player.seat, -1, e.card.id)
+
+    def _chick_bought(self, e):
+        # Spending eggs comes after playing cards, so no card is responsible
+        self._actor, self._card, self._roll = e.player.seat, -1, 0
+
+    def _fox_visits(self, e):
+        # The next two rolls without a card are this player's Fox on the Loose rolls
+        self._fox_rolls = 2
+
+    def _die_rolled(self, e):
+        if e.card is None:
+            if self._fox_rolls:
+                self._fox_rolls -= 1
+                self._card = _FOX
+            else: # The Chicken Die step
+                self._actor, self._card = e.player.seat, -1
+        self._roll = e.roll
+        self._record(DIE_ROLLED, self._actor, e.player.seat, self._card, e.roll)
+
+    def _chicken_killed(self, e):
+        card = e.card.id if e.card is not None else self._card
+        self._record(CHICKEN_KILLED, self._actor, e.player.seat, card, self._roll, _CHICKEN_KINDS[e.chicken], -1)
+
+    def write(self, records):
+        """Appends already packed records, e.g. a chunk logged in another process."""
+        self.flush()
+        self.file.write(records)
+        self.records += len(records) // RECORD.size
+
+    def take(self):
+        """The records buffered so far, as bytes, emptying the buffer."""
+        records, self.buffer = bytes(self.buffer), bytearray()
+        return records
+
+    def flush(self):
+        if self.file is None:
+            return
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+        self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_events(path):
+    """Maps an event log into a read-only structured array of EVENT_DTYPE records (no copy)."""
+    with open(path, "rb") as f:
+        header = f.read(len(MAGIC))
+        size = f.seek(0, 2)
+    if header != MAGIC:
+        raise ValueError(f"{path} is not an event log this version can read")
+    if size == len(MAGIC):
+        return np.empty(0, dtype=EVENT_DTYPE)
+    count = (size - len(MAGIC)) // RECORD.size # Ignore a partly written last record
+    return np.memmap(path, dtype=EVENT_DTYPE, mode="r", offset=len(MAGIC), shape=(count,))
+
+
+def kills_by_card(events):
+    """{card id (-1: the Chicken Die step): chickens killed} over a record array."""
+    kills = events[events["event"] == CHICKEN_KILLED]
+    cards, counts = np.unique(kills["card"], return_counts=True)
+    return dict(zip(cards.tolist(), counts.tolist()))
+
+
+def _log_games(task):
+    """Plays a (start_seed, count, num_players) range of games and returns their packed records."""
+    start_seed, count, num_players = task[:3]
+    log = BinaryEventLog()
+    for seed in range(start_seed, start_seed + count):
+        log.game = seed
+        Game(num_players=num_players, silent_deck=True, seed=seed, events=log).run_simulation()
+    return log.take()
+
+
+def record_games(path, num_simulations=100, num_players=4, workers=1, seed=None):
+    """Appends the events of games seeded seed, seed+1, ... to the log at path; returns the records written.
+
+    Chunks are logged in worker processes and appended in seed order, so the log
+    is the same whatever the number of workers.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    chunk_size = max(1, min(1000, num_simulations // (workers * 4)))
+    tasks = _seed_ranges(seed, num_simulations, num_players, chunk_size)
+    with BinaryEventLog(path) as log:
+        if workers > 1:
+            with multiprocessing.Pool(workers) as pool:
+                for records in pool.imap(_log_games, tasks):
+                    log.write(records)
+        else:
+            for task in tasks:
+                log.write(_log_games(task))
+        return log.records
+
+
+def summarize(events):
+    """Prints record counts by type and chicken kills by the card (or roll) responsible."""
+    print(f"--- {len(events)} records, {len(np.unique(events['game']))} games ---")
+    counts = np.bincount(events["event"], minlength=len(EVENT_NAMES))
+    for name, count in zip(EVENT_NAMES, counts.tolist()):
+        print(f"  {name:<16}{count:>12}")
+    print("Chicken kills by cause:")
+    kills = kills_by_card(events)
+    for card_id, count in sorted(kills.items(), key=lambda item: -item[1]):
+        cause = CARDS[card_id].name if card_id >= 0 else "Chicken Die"
+        print(f"  {cause:<24}{count:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Log the events of seeded Chicken Die! games to a binary file.")
+    parser.add_argument("path", help="The event log to append to (created if missing).")
+    parser.add_argument(
+        "-n", "--num-simulations",
+        type=int,
+        default=100,
+        help="The number of games to log."
+    )
+    parser.add_argument(
+        "-p", "--num-players",
+        type=int,
+        default=4,
+        help="The number of players in each game."
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes to spread games across."
+    )
+    parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed of the first game; game i uses seed + i. Random if omitted."
+    )
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Only summarize the existing log at path, without playing games."
+    )
+    args = parser.parse_args()
+    if not args.summary_only:
+        record_games(args.path, num_simulations=args.num_simulations, num_players=args.num_players,
+                     workers=args.workers, seed=args.seed)
+    try:
+        events = read_events(args.path)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    summarize(events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Typed game events and the sinks that consume them.
+
+Game emits an event at every point that used to print a line of the verbose
+transcript, plus a FlockChanged for every change to a flock (including the
+opening flocks), which the transcript does not show. Events are plain
+NamedTuples holding the Player/Card objects involved; a sink decides what to do
+with them. Game only builds an event when its sink is enabled, so silent batch
+runs (NullSink) pay one attribute check per event site.
+"""
+import sys
+from typing import NamedTuple, Optional
+
+
+class GameStarted(NamedTuple):
+    pass
+
+class TurnStarted(NamedTuple):
+    turn: int
+    chick_supply: int
+    hen_supply: int
+    graveyard_size: int
+    players: list
+
+class PlayerTurn(NamedTuple):
+    player: object
+
+class EggsCollected(NamedTuple):
+    player: object
+    amount: int
+    card: Optional[object] = None # None for the Collect Eggs step
+
+class CardDrawn(NamedTuple):
+    player: object
+    card: object
+    cashed_in_eggs: bool = False
+
+class ChickBought(NamedTuple):
+    player: object
+
+class CardPlayed(NamedTuple):
+    player: object
+    card: object
+
+class TargetChosen(NamedTuple):
+    player: object
+    target: object
+    card: object
+
+class RollSkipped(NamedTuple):
+    player: object
+    card: object
+
+class ChicksPromoted(NamedTuple):
+    player: object
+    amount: int
+
+class ChicksHatched(NamedTuple):
+    player: object
+    amount: int
+
+class ChickenResurrected(NamedTuple):
+    player: object
+    chicken: str
+
+class DieRolled(NamedTuple):
+    player: object
+    roll: int
+    card: Optional[object] = None # Die-Die-Die! rolls; None for the Chicken Die step
+
+class DieOutcome(NamedTuple):
+    player: object
+    roll: int
+    applied: bool
+    card: Optional[object] = None
+
+class HensSwapped(NamedTuple):
+    player: object
+    target: object
+
+class GlobalEffect(NamedTuple):
+    player: object
+    card: object
+
+class ChickensLost(NamedTuple):
+    player: object
+    kind: str # "chicks" or "hens"
+    amount: int
+
+class EggsDestroyed(NamedTuple):
+    player: object
+    target: object
+    amount: int
+
+class HenMadeInfertile(NamedTuple):
+    player: object
+    target: object
+
+class FoxVisits(NamedTuple):
+    player: object
+
+class AttackBlocked(NamedTuple):
+    player: object
+    card: object
+    attacker: Optional[object] = None
+
+class ChickenKilled(NamedTuple):
+    player: object
+    chicken: str # "Chick", "Hen" or a specialty chicken card name
+    card: Optional[object] = None # Set when a card names the victim directly (Chicken Assassin)
+
+class NoChickenToLose(NamedTuple):
+    player: object
+
+class FlockChanged(NamedTuple):
+    player: object
+    kind: int # FLOCK_KEYS index
+    delta: int
+
+class GameOver(NamedTuple):
+    winner: Optional[object]
+    turn: int
+
+class GameStalled(NamedTuple):
+    turn: int
+    quiet_turns: int # Turns since the last progress
+    cycling: bool # Whether the game kept returning to the same state
+
+
+class NullSink:
+    """Discards every event. Game skips building events when enabled is False."""
+    enabled = False
+
+    def emit(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+NULL_SINK = NullSink()
+
+
+class ListSink:
+    """Collects events in a list, mostly for tests and post-hoc inspection."""
+    enabled = True
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def flush(self):
+        pass
+
+
+_DIE_OUTCOMES = {
+    1: ("Outcome: Collect an Egg!", None),
+    2: ("Outcome: Promote an Egg! (Egg -> Chick)", "Outcome: Promote an Egg! (No effect)"),
+    3: ("Outcome: Promote a Chick! (Chick -> Hen)", "Outcome: Promote a Chick! (No effect)"),
+    4: ("Outcome: Demote a Chick! (Chick -> Egg)", "Outcome: Demote a Chick! (No effect)"),
+    5: ("Outcome: Demote a Hen! (Hen -> Chick)", "Outcome: Demote a Hen! (No effect)"),
+    6: ("Outcome: A Chicken Dies!", "Outcome: A Chicken Dies!"),
+}
+
+_GLOBAL_EFFECTS = {
+    "Bird Flu": "Bird Flu! All standard chicks in play die.",
+    "Demotion": "A worldwide demotion! All hens become chicks.",
+    "Foster Farms": "Foster Farms! All standard hens die.",
+    "Fox on the Loose": "A fox is on the loose!",
+    "Chicken Assassin": "Chicken Assassin! Each player must lose a Specialty Chicken.",
+}
+
+_ROLL_SKIPS = {
+    "Eat Mor Chikin": "{0} skips their 'Roll the Chicken Die!' step.",
+    "End Your Turn": "{0} ends their turn early.",
+    "Reverse": "The direction of play is reversed and turn ends!",
+}
+
+
+class TextRenderer:
+    """Renders events as the verbose text transcript.
+
+    Lines are buffered and written to the stream in blocks of buffer_lines (and on
+    flush), instead of one print call per line. Events without a renderer, such as
+    FlockChanged, add no line.
+    """
+    enabled = True
+
+    def __init__(self, stream=None, buffer_lines=1000):
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer_lines = buffer_lines
+        self.lines = []
+        self._renderers = {
+            GameStarted: self._game_started,
+            TurnStarted: self._turn_started,
+            PlayerTurn: lambda e: f"It's {e.player.name}'s turn.",
+            EggsCollected: self._eggs_collected,
+            CardDrawn: self._card_drawn,
+            ChickBought: lambda e: f"{e.player.name} spends 6 eggs to get a new Chick from the supply.",
+            CardPlayed: lambda e: f"{e.player.name} plays {e.card.name}.",
+            TargetChosen: lambda e: f"{e.player.name} targets {e.target.name} with {e.card.name}.",
+            RollSkipped: lambda e: _ROLL_SKIPS[e.card.name].format(e.player.name),
+            ChicksPromoted: lambda e: f"{e.player.name} promotes {e.amount} chicks to hens!",
+            ChicksHatched: lambda e: f"{e.player.name} used Incubator to get {e.amount} chicks.",
+            ChickenResurrected: lambda e: f"{e.player.name} resurrects a {e.chicken}!",
+            DieRolled: self._die_rolled,
+            DieOutcome: self._die_outcome,
+            HensSwapped: lambda e: f"{e.player.name} swaps Hens with {e.target.name}. Now has {e.player.flock['Hens']} Hens.",
+            GlobalEffect: self._global_effect,
+            ChickensLost: lambda e: f"  {e.player.name} loses {e.amount} {e.kind}.",
+            EggsDestroyed: lambda e: f"{e.player.name} destroys {e.amount} of {e.target.name}'s eggs.",
+            HenMadeInfertile: lambda e: f"{e.player.name} makes one of {e.target.name}'s hens infertile.",
+            FoxVisits: lambda e: f"  The fox visits {e.player.name}...",
+            AttackBlocked: self._attack_blocked,
+            ChickenKilled: self._chicken_killed,
+            NoChickenToLose: lambda e: f"{e.player.name} has no chickens to lose.",
+            GameOver: self._game_over,
+            GameStalled: self._game_stalled,
+        }
+
+    def emit(self, event):
+        render = self._renderers.get(type(event))
+        if render is None:
+            return
+        self.lines.append(render(event))
+        if len(self.lines) >= self.buffer_lines:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.stream.write("\n".join(self.lines) + "\n")
+            self.lines = []
+        self.stream.flush()
+
+    def _game_started(self, e):
+        return "--- Starting Chicken Die! Simulation ---"
+
+    def _turn_started(self, e):
+        lines = [f"\n--- Turn {e.turn} ---",
+                 f"Supply: {e.chick_supply} Chicks, {e.hen_supply} Hens | Graveyard: {e.graveyard_size}"]
+        lines.extend(f"  {p}" for p in e.players)
+        return "\n".join(lines)
+
+    def _eggs_collected(self, e):
+        if e.card is None:
+            return f"{e.player.name} collects {e.amount} egg cards, now has {e.player.egg_cards}."
+        return f"{e.player.name} collects {e.amount} Egg Cards."
+
+    def _card_drawn(self, e):
+        if e.card.card_type == "Instant Effect":
+            if e.cashed_in_eggs:
+                return f"{e.player.name} drew an Instant Effect while cashing in eggs: {e.card.name}!"
+            return f"{e.player.name} drew an Instant Effect: {e.card.name}!"
+        if e.cashed_in_eggs:
+            return f"{e.player.name} spends 3 eggs to draw a card."
+        return f"{e.player.name} draws a card."
+
+    def _die_rolled(self, e):
+        if e.card is None:
+            return f"{e.player.name} rolls the Chicken Die: {e.roll}"
+        return f"  {e.player.name} rolls: {e.roll}"
+
+    def _die_outcome(self, e):
+        if e.card is not None:
+            # Die-Die-Die! only has negative outcomes
+            if e.roll == 4:
+                return "  Outcome: Demote a Chick!"
+            if e.roll == 5:
+                return "  Outcome: Demote a Hen!"
+            return f"  Outcome: {e.roll} (No effect due to Die-Die-Die! rules)"
+        applied, not_applied = _DIE_OUTCOMES[e.roll]
+        return applied if e.applied else not_applied
+
+    def _global_effect(self, e):
+        if e.card.name == "Chicken Bomb":
+            return f"{e.player.name} is hit by a Chicken Bomb!"
+        return _GLOBAL_EFFECTS[e.card.name]
+
+    def _attack_blocked(self, e):
+        if e.card.name == "Cock Block":
+            return f"{e.player.name} plays Cock Block! Attack canceled and {e.attacker.name}'s turn ends."
+        return f"{e.player.name} plays Immunity to save a chicken!"
+
+    def _chicken_killed(self, e):
+        if e.card is not None:
+            return f"  {e.player.name} loses a {e.chicken}."
+        if e.chicken == "Decoy Chicken":
+            return f"{e.player.name}'s Decoy Chicken is destroyed!"
+        return f"{e.player.name} loses a {e.chicken}."
+
+    def _game_over(self, e):
+        if e.winner:
+            return f"\n--- Game Over! ---\nWinner is {e.winner.name} after {e.turn} turns!"
+        return "\n--- Game Over! ---\nAll players lost their chickens simultaneously!"
+
+    def _game_stalled(self, e):
+        reason = "keeps returning to the same state" if e.cycling else "has stopped making progress"
+        return (f"\n--- Game Over! ---\nStalemate after {e.turn} turns: the game {reason} "
+                f"(no progress in {e.quiet_turns} turns).")
@@ -0,0 +1,94 @@
+"""Opt-in per-phase and per-card timing for Game.
+
+GameProfiler.attach(game) shadows the turn phases (take_turn, _collect_eggs,
+_draw_phase, _ai_play_cards, _ai_spend_eggs, roll_chicken_die) with timing
+wrappers on that one instance and gives it its own card_handlers table of
+counting wrappers. Games that are not attached run the plain methods, so the
+hooks cost nothing when profiling is off.
+
+Timings are inclusive: an Instant Effect drawn in _draw_phase is counted both in
+that phase and under its card handler, and the two rolls per player of Fox on the
+Loose are counted under roll_chicken_die as well as under the card.
+"""
+import time
+
+from cards import CARDS
+
+# Game methods timed as turn phases, in report order. take_turn is the whole turn.
+PHASES = (
+    ("take_turn", "Whole turn"),
+    ("_collect_eggs", "Egg collection"),
+    ("_draw_phase", "Card draw"),
+    ("_ai_play_cards", "AI card play"),
+    ("_ai_spend_eggs", "AI egg spending"),
+    ("roll_chicken_die", "Chicken Die roll"),
+)
+
+
+class GameProfiler:
+    """Accumulates call counts and perf_counter_ns totals over any number of games."""
+
+    def __init__(self):
+        self.games = 0
+        self.phase_calls = {name: 0 for name, _ in PHASES}
+        self.phase_ns = {name: 0 for name, _ in PHASES}
+        self.card_calls = {}
+        self.card_ns = {}
+
+    def attach(self, game):
+        """Instruments one game; returns it for chaining."""
+        self.games += 1
+        for name, _ in PHASES:
+            setattr(game, name, self._timed(getattr(game, name), self.phase_calls, self.phase_ns, name))
+        handlers = list(game.card_handlers)
+        for card_id, handler in enumerate(handlers):
+            if handler is not None:
+                card_name = CARDS[card_id].name
+                self.card_calls.setdefault(card_name, 0)
+                self.card_ns.setdefault(card_name, 0)
+                handlers[card_id] = self._timed(handler, self.card_calls, self.card_ns, card_name)
+        game.card_handlers = tuple(handlers)
+        return game
+
+    @staticmethod
+    def _timed(method, calls, totals, key):
+        clock = time.perf_counter_ns
+
+        def timed(*args):
+            start = clock()
+            try:
+                return method(*args)
+            finally:
+                totals[key] += clock() - start
+                calls[key] += 1
+        return timed
+
+    def merge(self, other):
+        self.games += other.games
+        for mine, theirs in ((self.phase_calls, other.phase_calls), (self.phase_ns, other.phase_ns),
+                             (self.card_calls, other.card_calls), (self.card_ns, other.card_ns)):
+            for key, value in theirs.items():
+                mine[key] = mine.get(key, 0) + value
+        return self
+
+    def report(self):
+        """Prints where turn time goes and how often each card handler fires."""
+        turns = self.phase_calls["take_turn"]
+        turn_ns = self.phase_ns["take_turn"]
+        print(f"\n--- Profile ({self.games} games, {turns} turns) ---")
+        if not turns:
+            print("No turns were played.")
+            return
+
+        print(f"{'Phase':<18}{'calls':>10}{'total ms':>12}{'ns/call':>10}{'% of turn':>11}")
+        for name, label in PHASES:
+            calls, ns = self.phase_calls[name], self.phase_ns[name]
+            per_call = ns / calls if calls else 0
+            print(f"{label:<18}{calls:>10}{ns / 1e6:>12.2f}{per_call:>10.0f}{ns / turn_ns * 100:>10.1f}%")
+
+        print(f"\n{'Card handler':<18}{'calls':>10}{'per game':>10}{'total ms':>12}{'ns/call':>10}")
+        for name in sorted(self.card_ns, key=lambda n: (-self.card_ns[n], n)):
+            calls, ns = self.card_calls[name], self.card_ns[name]
+            per_call = ns / calls if calls else 0
+            print(f"{name:<18}{calls:>10}{calls / self.games:>10.2f}{ns / 1e6:>12.2f}{per_call:>10.0f}")
+
@@ -0,0 +1,136 @@
+"""Live progress of batch runs: a status line on stderr and a JSON heartbeat file.
+
+A batch run hands its merged SimulationStats to ProgressReporter.update() after
+every chunk it merges; worker processes are never involved, so progress works the
+same for serial and multi-process runs. update() only copies a few counters. A
+background thread wakes every interval seconds, prints a status line such as
+
+    [12000/100000 games, 12.0%] 4012 games/s, 104311 turns/s, ETA 0:00:22 | P1 26.1% P2 25.3% P3 24.8% P4 23.8%
+
+and, with a heartbeat path, atomically rewrites a JSON file with the same numbers
+(see snapshot()) for schedulers and dashboards. The thread sleeps between
+reports, so it takes nothing from the engine apart from the report itself.
+"""
+import datetime
+import os
+import sys
+import threading
+import time
+
+from checkpoint import save_checkpoint
+
+
+def _format_eta(seconds):
+    if seconds is None:
+        return "?"
+    return str(datetime.timedelta(seconds=round(seconds)))
+
+
+class ProgressReporter:
+    """Reports the progress of a run every interval seconds from a background thread.
+
+    total is the number of games the run will play (None if it stops adaptively)
+    and deadline the time.monotonic() time a time budget runs out, if any; the
+    ETA is the earlier of the two. Rates count only the games played since the
+    reporter started, so a resumed run does not overstate them.
+    """
+
+    def __init__(self, total=None, interval=10.0, heartbeat_path=None, deadline=None, seed=None, stream=None):
+        self.total = total
+        self.interval = interval
+        self.heartbeat_path = heartbeat_path
+        self.deadline = deadline
+        self.seed = seed
+        self.stream = stream if stream is not None else sys.stderr
+        self.games = self.turns = 0
+        self.winner_counts = {}
+        self._start_games = self._start_turns = None
+        self._started = self._started_at = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def update(self, stats):
+        """Records the merged stats of the run so far."""
+        with self._lock:
+            self.games = stats.games
+            self.turns = stats.turns
+            self.winner_counts = dict(stats.winner_counts)
+            if self._start_games is None:
+                self._start_games, self._start_turns = stats.games, stats.turns
+
+    def start(self):
+        self._started = time.monotonic()
+        self._started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="progress", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, complete=True):
+        """Stops the thread and writes a last report, marked complete unless the run failed."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.report(complete=complete)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop(complete=exc_type is None)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.report()
+
+    def snapshot(self, complete=False):
+        """The heartbeat: a JSON-ready dict of the run's progress, rates and ETA."""
+        now = time.monotonic()
+        with self._lock:
+            games, turns, winner_counts = self.games, self.turns, dict(self.winner_counts)
+            start_games = self._start_games if self._start_games is not None else games
+            start_turns = self._start_turns if self._start_turns is not None else turns
+        elapsed = now - self._started if self._started is not None else 0.0
+        games_per_sec = (games - start_games) / elapsed if elapsed > 0 else 0.0
+        turns_per_sec = (turns - start_turns) / elapsed if elapsed > 0 else 0.0
+        etas = []
+        if self.total is not None and games_per_sec > 0:
+            etas.append(max(0, self.total - games) / games_per_sec)
+        if self.deadline is not None:
+            etas.append(max(0.0, self.deadline - now))
+        eta = 0.0 if complete else min(etas, default=None)
+        return {
+            "pid": os.getpid(),
+            "seed": self.seed,
+            "time": time.time(),
+            "started": self._started_at,
+            "elapsed": elapsed,
+            "games": games,
+            "total": self.total,
+            "turns": turns,
+            "games_per_sec": games_per_sec,
+            "turns_per_sec": turns_per_sec,
+            "eta_seconds": eta,
+            # Seats in order, then -1 for games nobody won
+            "win_distribution": {str(seat): winner_counts[seat] / games
+                                 for seat in sorted(winner_counts, key=lambda seat: (seat < 0, seat))},
+            "complete": complete,
+        }
+
+    def status_line(self, state):
+        if state["total"] is not None:
+            done = f"{state['games']}/{state['total']} games, {state['games'] / max(state['total'], 1):.1%}"
+        else:
+            done = f"{state['games']} games"
+        wins = " ".join(f"P{int(seat) + 1} {share:.1%}" if int(seat) >= 0 else f"none {share:.1%}"
+                        for seat, share in state["win_distribution"].items())
+        eta = "done" if state["complete"] else f"ETA {_format_eta(state['eta_seconds'])}"
+        return (f"[{done}] {state['games_per_sec']:.0f} games/s, {state['turns_per_sec']:.0f} turns/s, "
+                f"{eta}" + (f" | {wins}" if wins else ""))
+
+    def report(self, complete=False):
+        """Prints the status line and writes the heartbeat file."""
+        state = self.snapshot(complete)
+        print(self.status_line(state), file=self.stream, flush=True)
+        if self.heartbeat_path is not None:
+            save_checkpoint(self.heartbeat_path, state)
@@ -0,0 +1,94 @@
+"""A Monte-Carlo lookahead Strategy that scores candidate plays by rolling the game forward.
+
+At each card decision RolloutStrategy lists the distinct playable cards in hand,
+plus playing nothing, and plays out short rollouts for each of them from clones
+of the game (Game.clone with a fresh RNG, so the rollouts do not consume the
+game's own randomness). A rollout plays the candidate, finishes the turn and
+then up to horizon more turns with the rollout policy for every seat, and scores
+1 for a win, 0 for a loss and the player's share of all chickens when cut off.
+The candidate with the best mean score is played.
+
+Candidates are evaluated in rounds: in each round every candidate gets one
+rollout, and all of them use the same rollout seed, so differences between
+candidates are not drowned in the noise of the dice. Rounds continue until the
+rollout budget is spent or the time budget runs out.
+
+The draw pile of every clone is reshuffled so rollouts cannot peek at the order
+of the deck; opponents' hands are still visible to them.
+"""
+import random
+import time
+
+from simulation import CounterRandom, DefaultStrategy
+
+# Card types never chosen as a play: protection cards are played from hand when attacked,
+# and instant effects take effect when drawn, so a held copy is not a play
+_UNPLAYABLE_TYPES = ("Protection", "Instant Effect")
+
+
+class RolloutStrategy(DefaultStrategy):
+    """Picks cards by rollouts; spends eggs and picks targets like DefaultStrategy.
+
+    rollouts is the budget per decision, spread evenly over the candidates;
+    time_budget (seconds), when set, also ends a decision once exceeded, after at
+    least one full round. policy plays every seat inside the rollouts.
+    """
+
+    def __init__(self, rollouts=200, time_budget=None, horizon=20, policy=None, seed=None):
+        super().__init__()
+        self.rollouts = rollouts
+        self.time_budget = time_budget
+        self.horizon = horizon
+        self.policy = policy if policy is not None else DefaultStrategy()
+        self.rng = random.Random(seed)
+        self.total_rollouts = 0 # Across all decisions, for throughput measurements
+
+    def choose_card(self, game, player):
+        candidates = [None]
+        candidates += [card for card in player.hand.distinct() if card.card_type not in _UNPLAYABLE_TYPES]
+        if len(candidates) == 1:
+            return None
+
+        snapshot = game.snapshot(include_rng=False)
+        scores = [0.0] * len(candidates)
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        rounds = max(1, self.rollouts // len(candidates))
+        completed = 0
+        while completed < rounds:
+            if completed and deadline is not None and time.perf_counter() > deadline:
+                break
+            rollout_seed = self.rng.getrandbits(64)
+            for index, card in enumerate(candidates):
+                scores[index] += self.rollout(game, snapshot, player.seat, card, rollout_seed)
+            completed += 1
+        self.total_rollouts += completed * len(candidates)
+        # Ties go to the earlier candidate, so playing nothing wins a tie
+        best = max(range(len(candidates)), key=scores.__getitem__)
+        return candidates[best]
+
+    def rollout(self, game, snapshot, seat, card, rollout_seed):
+        """Score for the player in seat of playing card (None: no card) from snapshot."""
+        clone = game.clone(snapshot, rng=CounterRandom(rollout_seed))
+        policy = self.policy
+        clone.strategies = [policy] * len(clone.players)
+        clone.deck.shuffle()
+        player = clone.players[seat]
+
+        # Finish the current turn: the candidate, then eggs and the roll as the policy would
+        policy.begin_turn(clone, player)
+        if card is not None:
+            clone.play_card(player, card)
+        clone._ai_spend_eggs(player, policy)
+        clone._roll_phase(player)
+
+        roster = clone.roster
+        end = min(clone.turn + self.horizon, clone.rules.max_turns)
+        while len(roster.live) > 1 and clone.turn < end:
+            clone._advance_player()
+            clone.turn += 1
+            clone.take_turn(clone.players[clone.current_player_index])
+
+        live = roster.live
+        if len(live) <= 1:
+            return 1.0 if live and live[0] is player else 0.0
+        return player.total / roster.total
@@ -1,83 +1,175 @@
 import random
 import argparse
+import multiprocessing
 import time
+import functools
+import bisect
+import collections
+import operator
+import types
+from array import array
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from cards import (
+    FLOCK_KEYS, FLOCK_INDEX, CHICKS, HENS, DINO, FLYING, MAD, ROBO, DECOY, PUNK, REGISTRY,
+    CARDS, CARDS_BY_NAME, CARD_TYPES, CARD_TYPE_INDEX, CARD_IDS_BY_TYPE, CARD_SCALING, CARD_FLOCK_KIND,
+    CARD_HANDLERS, CARD_PREDATOR, SPECIALTY_NAMES, SPECIALTY_KINDS, SPECIALTY_KIND_BY_NAME, COCK_BLOCK, IMMUNITY,
+    COYOTE_ATTACK, CHICKEN_BLASTER, EAT_MOR_CHIKIN, FARM_TO_TABLE, DIE_DIE_DIE, HEN_SWAP, BIRD_FLU,
+    THREE_EGG_OMELETTE, INFERTILITY, DEMOTION, FOSTER_FARMS, FOX_ON_THE_LOOSE, CHICKEN_ASSASSIN, CHICKEN_BOMB,
+    END_YOUR_TURN, REVERSE, FIXED, ATTACK,
+)
+from stats import SimulationStats
+from profiler import GameProfiler
+from cache import ResultCache
+from checkpoint import Checkpointer, load_checkpoint
+from progress import ProgressReporter
+from stalemate import StalemateDetector
+from events import (
+    NULL_SINK, TextRenderer, GameStarted, TurnStarted, PlayerTurn, EggsCollected, CardDrawn,
+    ChickBought, CardPlayed, TargetChosen, RollSkipped, ChicksPromoted, ChicksHatched,
+    ChickenResurrected, DieRolled, DieOutcome, HensSwapped, GlobalEffect, ChickensLost,
+    EggsDestroyed, HenMadeInfertile, FoxVisits, AttackBlocked, ChickenKilled, NoChickenToLose,
+    GameOver, GameStalled, FlockChanged,
+)
+
+# Bump whenever a change to the rules or the AI changes the outcome of a seeded
+# game; cached results from other versions are then ignored.
+ENGINE_VERSION = 2
+
+class Rules(NamedTuple):
+    """Tunable game parameters; Rules() is the standard game.
+
+    card_counts holds (card name, base count) pairs that override the counts in
+    the card registry. Counts are scaled as the registry says: by num_players /
+    base_players, and Attack counts additionally by attack_scaling; specialty
+    chickens are not scaled. Rules are immutable and
+    hashable, so decks built from them can be cached.
+    """
+    card_counts: tuple = ()
+    base_players: float = 2 # The deck is balanced for 2 players initially
+    attack_scaling: float = 2.0 # Scale attack cards more aggressively to encourage player elimination
+    chick_supply: int = 50 # Increased supply for simulation
+    hen_supply: int = 50
+    egg_supply: int = 100
+    max_turns: int = 1000 # Safety break
+    # Stalemate detection (see stalemate.py); each check is off at 0
+    stalemate_window: int = 0 # End a game after this many turns without progress
+    stalemate_repeats: int = 0 # End a game once the same state recurs this often without progress
+
+    @classmethod
+    def from_dict(cls, values):
+        """Builds Rules from plain values, e.g. parsed JSON/TOML; card_counts may be a dict."""
+        values = dict(values)
+        unknown = set(values) - set(cls._fields)
+        if unknown:
+            raise ValueError(f"Unknown rule(s): {', '.join(sorted(unknown))}")
+        counts = values.get("card_counts", ())
+        counts = dict(counts.items() if isinstance(counts, Mapping) else counts)
+        unknown = set(counts) - set(CARDS_BY_NAME)
+        if unknown:
+            raise ValueError(f"Unknown card(s): {', '.join(sorted(unknown))}")
+        values["card_counts"] = tuple(sorted(counts.items()))
+        return cls(**values)
+
+    def to_dict(self):
+        values = self._asdict()
+        values["card_counts"] = dict(self.card_counts)
+        return values
+
+DEFAULT_RULES = Rules()
+
+@functools.lru_cache(maxsize=None)
+def _deck_card_ids(num_players, rules=DEFAULT_RULES):
+    """Card ids of an unshuffled deck for num_players under rules, in registry order."""
+    overrides = dict(rules.card_counts)
+
+    card_ids = array('B')
+    for card_id, spec in enumerate(REGISTRY):
+        base_count = overrides.get(spec.name, spec.count)
+        scaling = CARD_SCALING[card_id]
+        if scaling == FIXED:
+            count = base_count
+        else:
+            scaling_factor = num_players / rules.base_players
+            if scaling == ATTACK:
+                scaling_factor *= rules.attack_scaling
+            
+            # A card that is in the game at all keeps at least one copy
+            count = max(1, round(base_count * scaling_factor)) if base_count > 0 else 0
 
-class Card:
-    def __init__(self, name, card_type):
-        self.name = name
-        self.card_type = card_type
+        card_ids.extend([card_id] * count)
+    return card_ids.tobytes()
 
-    def __repr__(self):
-        return f"Card(name='{self.name}', type='{self.card_type}')"
+_MASK64 = (1 << 64) - 1
+
+def _mix64(x):
+    """SplitMix64 finalizer: a fast, well-spread hash of a 64-bit integer."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+class CounterRandom(random.Random):
+    """A random.Random driven by a SplitMix64 counter.
+
+    Unlike the Mersenne Twister, reseeding it is as cheap as setting an integer,
+    which suits streams that are reseeded every turn.
+    """
+
+    def seed(self, a=None, version=2):
+        self.state = (a if a is not None else random.getrandbits(64)) & _MASK64
+
+    def getrandbits(self, k):
+        bits, produced = 0, 0
+        while produced < k:
+            self.state = (self.state + 1) & _MASK64
+            bits = bits << 64 | _mix64(self.state)
+            produced += 64
+        return bits >> (produced - k)
+
+    def random(self):
+        return self.getrandbits(53) * (1.0 / (1 << 53))
+
+    def getstate(self):
+        return self.state
+
+    def setstate(self, state):
+        self.state = state
 
 class Deck:
-    def __init__(self, num_players=4, silent=False):
-        self.cards = []
-        self.discard_pile = []
+    def __init__(self, num_players=4, silent=False, rng=None, rules=DEFAULT_RULES, shuffle_key=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.cards = array('B') # Card ids; the top of the deck is the end
+        self.discard_pile = array('B')
         self.reshuffles = 0
-        self.build_deck(num_players, silent)
-
-    def build_deck(self, num_players=4, silent=False):
-        deck_composition = [
-            # 1. Specialty Chicken Cards
-            {"name": "Dino Chicken", "type": "Specialty Chicken", "count": 1},
-            {"name": "Flying Chicken", "type": "Specialty Chicken", "count": 1},
-            {"name": "Mad Scientist Chicken", "type": "Specialty Chicken", "count": 1},
-            {"name": "Robo-Hen", "type": "Specialty Chicken", "count": 1},
-            {"name": "Decoy Chicken", "type": "Specialty Chicken", "count": 1},
-            {"name": "Punk Rock Chick", "type": "Specialty Chicken", "count": 1},
-            # 2. Protection Cards
-            {"name": "Immunity", "type": "Protection", "count": 3},
-            {"name": "Chicken Wire", "type": "Protection", "count": 2},
-            {"name": "Cock Block", "type": "Protection", "count": 3},
-            # 3. Attack Cards
-            {"name": "Coyote Attack", "type": "Attack", "count": 2},
-            {"name": "Chicken Blaster", "type": "Attack", "count": 3},
-            {"name": "Die-Die-Die!", "type": "Attack", "count": 2},
-            {"name": "Hen Swap", "type": "Attack", "count": 2},
-            {"name": "3-Egg Omelette", "type": "Attack", "count": 2},
-            {"name": "Infertility", "type": "Attack", "count": 1},
-            {"name": "Eat Mor Chikin", "type": "Attack", "count": 2},
-            # 4. Instant Effect Cards
-            {"name": "Chicken Bomb", "type": "Instant Effect", "count": 3},
-            {"name": "Demotion", "type": "Instant Effect", "count": 1},
-            {"name": "Foster Farms", "type": "Instant Effect", "count": 1},
-            {"name": "Bird Flu", "type": "Instant Effect", "count": 1},
-            {"name": "Fox on the Loose", "type": "Instant Effect", "count": 1},
-            {"name": "Chicken Assassin", "type": "Instant Effect", "count": 1},
-            # 5. Personal Growth Cards
-            {"name": "Feeding Frenzy", "type": "Personal Growth", "count": 1},
-            {"name": "Incubator", "type": "Personal Growth", "count": 1},
-            {"name": "Farm to Table", "type": "Personal Growth", "count": 1},
-            {"name": "Resurrection", "type": "Personal Growth", "count": 1},
-            # 6. Turn Altering Cards
-            {"name": "Take it or Leave it", "type": "Turn Altering", "count": 2},
-            {"name": "End Your Turn", "type": "Turn Altering", "count": 2},
-            {"name": "Reverse", "type": "Turn Altering", "count": 1},
-        ]
-
-        base_players = 2 # The deck is balanced for 2 players initially
-
-        for card_info in deck_composition:
-            # Don't scale specialty chickens
-            if card_info["type"] == "Specialty Chicken":
-                count = card_info["count"]
-            else:
-                scaling_factor = num_players / base_players
-                # Scale attack cards more aggressively to encourage player elimination
-                if card_info["type"] == "Attack":
-                    scaling_factor *= 2.0
-                
-                count = max(1, round(card_info["count"] * scaling_factor))
-
-            for _ in range(count):
-                self.cards.append(Card(card_info["name"], card_info["type"]))
+        # With a shuffle_key, shuffles sort the cards by a hash of (key, shuffle
+        # number, card id, copy number) instead of drawing from rng. Decks with the
+        # same key but different compositions then keep their common cards in the
+        # same relative order.
+        self.shuffle_key = shuffle_key
+        self.shuffles = 0
+        self.build_deck(num_players, silent, rules)
+
+    def build_deck(self, num_players=4, silent=False, rules=DEFAULT_RULES):
+        self.cards.frombytes(_deck_card_ids(num_players, rules))
         
         if not silent:
             print(f"Deck built with {len(self.cards)} cards.")
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        if self.shuffle_key is None:
+            self.rng.shuffle(self.cards)
+            return
+        base = _mix64(self.shuffle_key ^ _mix64(self.shuffles))
+        self.shuffles += 1
+        copies = [0] * len(CARDS)
+        keyed = []
+        for card_id in self.cards:
+            keyed.append((_mix64(base ^ (card_id << 16 | copies[card_id])), card_id))
+            copies[card_id] += 1
+        keyed.sort()
+        self.cards = array('B', [card_id for _, card_id in keyed])
 
     def draw(self):
         if not self.cards:
@@ -85,41 +177,324 @@ class Deck:
                 return None # No cards left anywhere
             # Reshuffle discard pile into the deck
             self.cards = self.discard_pile
-            self.discard_pile = []
+            self.discard_pile = array('B')
             self.shuffle()
             self.reshuffles += 1
-        return self.cards.pop()
+        return CARDS[self.cards.pop()]
+
+class Hand:
+    """A player's cards as a multiset: how many of each card id are held.
+
+    counts is indexed by card id and type_counts by card type id, and both are
+    kept up to date with size on every change, so membership, removal, counting
+    and picking a card of a given type take constant time whatever the size of
+    the hand. Iteration yields the held cards in card id order, repeated by count.
+    """
+    __slots__ = ("counts", "type_counts", "size")
+
+    def __init__(self, cards=()):
+        self.counts = [0] * len(CARDS)
+        self.type_counts = [0] * len(CARD_TYPES)
+        self.size = 0
+        for card in cards:
+            self.append(card)
+
+    def append(self, card):
+        self.counts[card.id] += 1
+        self.type_counts[card.type_id] += 1
+        self.size += 1
+
+    def remove(self, card):
+        if not self.counts[card.id]:
+            raise ValueError(f"{card.name} is not in the hand")
+        self.counts[card.id] -= 1
+        self.type_counts[card.type_id] -= 1
+        self.size -= 1
+
+    def count(self, card):
+        return self.counts[card.id]
+
+    def count_of_type(self, card_type):
+        return self.type_counts[CARD_TYPE_INDEX[card_type]]
+
+    def first_of_type(self, card_type):
+        """The held card of card_type with the lowest id, or None."""
+        type_id = CARD_TYPE_INDEX[card_type]
+        if not self.type_counts[type_id]:
+            return None
+        counts = self.counts
+        for card_id in CARD_IDS_BY_TYPE[type_id]:
+            if counts[card_id]:
+                return CARDS[card_id]
+
+    def distinct(self):
+        """Each held card once, in card id order."""
+        return [CARDS[card_id] for card_id, count in enumerate(self.counts) if count]
+
+    def __contains__(self, card):
+        return self.counts[card.id] > 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for card_id, count in enumerate(self.counts):
+            card = CARDS[card_id]
+            for _ in range(count):
+                yield card
+
+    def __repr__(self):
+        return f"Hand({[card.name for card in self]})"
+
+    def __getstate__(self):
+        return tuple(self.counts), tuple(self.type_counts), self.size
+
+    def __setstate__(self, state):
+        counts, type_counts, self.size = state
+        self.counts, self.type_counts = list(counts), list(type_counts)
+
+
+class FlockView(Mapping):
+    """Dict-style view of a player's flock, keyed by the FLOCK_KEYS names.
+
+    Assigning to a key writes through to the player's flock array and keeps the
+    running total in sync.
+    """
+    __slots__ = ("_player",)
+
+    def __init__(self, player):
+        self._player = player
+
+    def __getitem__(self, key):
+        return self._player.counts[FLOCK_INDEX[key]]
+
+    def __setitem__(self, key, value):
+        self._player.set_count(FLOCK_INDEX[key], value)
+
+    def __iter__(self):
+        return iter(FLOCK_KEYS)
+
+    def __len__(self):
+        return len(FLOCK_KEYS)
 
 class Player:
+    __slots__ = ("name", "seat", "roster", "_hand", "counts", "total", "egg_cards", "infertile_hens")
+
     def __init__(self, name):
         self.name = name
-        self.hand = []
-        # flock includes: Chicks, Hens, and Specialty Chickens
-        self.flock = {
-            "Chicks": 0,
-            "Hens": 0,
-            "Dino Chickens": 0,
-            "Flying Chickens": 0,
-            "Mad Scientist Chickens": 0,
-            "Robo-Hens": 0,
-            "Decoy Chickens": 0,
-            "Punk Rock Chicks": 0
-        }
+        self.seat = 0
+        self.roster = None # The Roster tracking this player, once seated in a Game
+        self._hand = Hand()
+        # flock includes: Chicks, Hens, and Specialty Chickens, indexed by CHICKS..PUNK
+        self.counts = array('i', bytes(4 * len(FLOCK_KEYS)))
+        self.total = 0 # Running sum of counts
         self.egg_cards = 0 # Egg cards are kept in hand according to rules
         self.infertile_hens = 0
 
+    @property
+    def flock(self):
+        return FlockView(self)
+
+    @property
+    def hand(self):
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards):
+        # Any iterable of cards, e.g. a list in tests
+        self._hand = cards if isinstance(cards, Hand) else Hand(cards)
+
     def __repr__(self):
         flock_items = [f"{k.lower()}={v}" for k, v in self.flock.items() if v > 0]
         flock_str = ", ".join(flock_items) if flock_items else "empty"
         return f"Player(name='{self.name}', hand_size={len(self.hand)}, flock=({flock_str}), eggs={self.egg_cards})"
 
+    def add(self, kind, amount):
+        self.counts[kind] += amount
+        old = self.total
+        self.total = old + amount
+        roster = self.roster
+        if roster is not None:
+            roster.total += amount
+            if (old > 0) != (self.total > 0):
+                roster.update(self)
+
+    def set_count(self, kind, value):
+        self.add(kind, value - self.counts[kind])
+
     def total_chickens(self):
-        return sum(self.flock.values())
+        return self.total
+
+_seat = operator.attrgetter("seat")
+
+class Roster:
+    """Incrementally maintained aggregates over a game's players.
+
+    live holds the players that still have chickens, in seat order, and total is
+    the number of chickens across all players. Players report every flock change
+    through Player.add, so both stay current without rescanning the table; the
+    live list only changes when a player is eliminated or comes back.
+    """
+    __slots__ = ("players", "live", "total")
+
+    def __init__(self, players):
+        self.players = players
+        self.live = []
+        self.total = 0
+        for seat, player in enumerate(players):
+            player.seat = seat
+            player.roster = self
+            self.total += player.total
+            if player.total > 0:
+                self.live.append(player)
+
+    def update(self, player):
+        if player.total > 0:
+            bisect.insort(self.live, player, key=_seat)
+        else:
+            self.live.remove(player)
+
+    def random_opponent(self, player, rng):
+        """Picks uniformly among live players other than player, or returns None.
+
+        Equivalent to rng.choice(game.get_opponents(player)) without building the list.
+        """
+        live = self.live
+        if player.total > 0:
+            count = len(live) - 1
+            if count <= 0:
+                return None
+            index = rng.randrange(count)
+            # Skip over player's own slot in the seat-ordered live list
+            if index >= bisect.bisect_left(live, player.seat, key=_seat):
+                index += 1
+            return live[index]
+        if not live:
+            return None
+        return live[rng.randrange(len(live))]
+
+# Ways to spend eggs, as returned by Strategy.choose_egg_spend
+BUY_CHICK = "buy chick" # 6 eggs -> 1 Chick from the supply
+DRAW_CARD = "draw card" # 3 eggs -> 1 card
+
+class Strategy:
+    """Makes a player's decisions: which cards to play, whom to target and how to spend eggs.
+
+    Game asks the strategy of the player whose turn it is. begin_turn is called
+    once before the cards are played, choose_card until it returns None,
+    choose_target whenever a played card needs an opponent, and choose_egg_spend
+    while the player has at least 3 eggs, until it returns None. Only the acting
+    player decides during a turn, so one instance can serve several seats and keep
+    per-turn state set up in begin_turn. This base class plays nothing, spends
+    nothing and picks targets uniformly at random.
+    """
+
+    def begin_turn(self, game, player):
+        pass
+
+    def choose_card(self, game, player):
+        """The card from player.hand to play next, or None to end the Play Action Cards step."""
+        return None
+
+    def choose_target(self, game, player, card, candidates=None):
+        """The opponent card is played against, or None.
+
+        candidates lists the eligible opponents when the card restricts them
+        (Infertility); otherwise every live opponent is eligible.
+        """
+        if candidates is None:
+            return game.roster.random_opponent(player, game.choice_rng)
+        return game.choice_rng.choice(candidates)
+
+    def choose_egg_spend(self, game, player):
+        """BUY_CHICK, DRAW_CARD or None to stop spending eggs."""
+        return None
+
+
+class DefaultStrategy(Strategy):
+    """The situational AI: picks a mode (Growth, Aggressive, Defensive) at the start of
+    the turn, plays at most one card of the type that mode wants (the one with the
+    lowest card id) and cashes in eggs, buying Chicks when growing or defending."""
+
+    def __init__(self):
+        self.mode = None
+        self.played = False
+
+    def begin_turn(self, game, player):
+        self.mode = self.get_mode(game, player)
+        self.played = False
+
+    @staticmethod
+    def get_mode(game, player):
+        """Determines the AI's current mode (Growth, Aggressive, Defensive)."""
+        total_chickens = player.total
+        if total_chickens <= 2:
+            return "Growth"
+
+        average_chickens = game.roster.total / len(game.players)
+        if total_chickens > average_chickens:
+            return "Aggressive"
+
+        return "Defensive"
+
+    def choose_card(self, game, player):
+        if self.played:
+            return None
+        self.played = True
+        if self.mode == "Aggressive":
+            return player.hand.first_of_type("Attack")
+        # In defensive mode, the AI is more conservative and might hold cards.
+        # For now, we'll keep it simple and play a growth card if available.
+        return player.hand.first_of_type("Personal Growth")
+
+    def choose_egg_spend(self, game, player):
+        if player.egg_cards >= 6 and game.chick_supply > 0 and self.mode in ("Growth", "Defensive"):
+            return BUY_CHICK
+        return DRAW_CARD
+
+
+DEFAULT_STRATEGY = DefaultStrategy()
 
 class Game:
-    def __init__(self, num_players=4, silent_deck=False):
+    def __init__(self, num_players=4, silent_deck=False, seed=None, events=None, rules=DEFAULT_RULES,
+                 split_streams=False, strategies=None, trace=None):
+        # Every random decision in a game goes through this private RNG, so a game
+        # is fully determined by its seed and can be replayed exactly.
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Die rolls, deck shuffles and other random choices (targets, kill victims,
+        # ...) draw from their own streams. They are all self.rng unless
+        # split_streams is set. Then the dice and choice streams are reseeded from
+        # (seed, turn) at the start of every turn and shuffles are keyed by the seed
+        # (see Deck), so two games with the same seed but different rules share
+        # their randomness as far as the rules let them: a turn that rolls more
+        # dice in one game does not shift the rolls of every later turn. This is
+        # what common-random-numbers comparisons need.
+        self.split_streams = split_streams
+        if split_streams:
+            self._stream_key = _mix64(seed if seed is not None else self.rng.getrandbits(64))
+            self.dice_rng, self.choice_rng = CounterRandom(0), CounterRandom(0)
+            self.shuffle_rng = self.rng
+        else:
+            self.dice_rng = self.shuffle_rng = self.choice_rng = self.rng
+        # Game events go to this sink; events are only built when it is enabled
+        self.events = events if events is not None else NULL_SINK
+        self.verbose = self.events.enabled
+        # Optional per-turn state recorder (see traces.TurnTrace); None in plain runs
+        self.trace = trace
+        self.rules = rules
         self.players = [Player(f"Player {i+1}") for i in range(num_players)]
-        self.deck = Deck(num_players=num_players, silent=silent_deck)
+        # The Strategy of each seat; one Strategy is shared by every seat
+        if strategies is None:
+            strategies = DEFAULT_STRATEGY
+        if isinstance(strategies, Strategy):
+            self.strategies = [strategies] * num_players
+        else:
+            self.strategies = list(strategies)
+            if len(self.strategies) != num_players:
+                raise ValueError(f"Expected {num_players} strategies, got {len(self.strategies)}")
+        self.deck = Deck(num_players=num_players, silent=silent_deck, rng=self.shuffle_rng, rules=rules,
+                         shuffle_key=self._stream_key if split_streams else None)
         self.deck.shuffle()
         self.current_player_index = 0
         self.game_over = False
@@ -131,20 +506,18 @@ class Game:
         self.reverse_direction = False
         self.skip_roll = False
 
-        self._initialize_card_dispatcher()
-
         # Game resources
-        self.chick_supply = 50 # Increased supply for simulation
-        self.hen_supply = 50
-        self.egg_supply = 100
+        self.chick_supply = rules.chick_supply
+        self.hen_supply = rules.hen_supply
+        self.egg_supply = rules.egg_supply
         self.graveyard = []
         self.total_cards_played = 0
 
         # Deal starting hands and chickens
         for player in self.players:
             # Each player starts with 2 Chicks and 1 Hen
-            player.flock["Chicks"] = 2
-            player.flock["Hens"] = 1
+            player.set_count(CHICKS, 2)
+            player.set_count(HENS, 1)
             self.chick_supply -= 2
             self.hen_supply -= 1
 
@@ -158,16 +531,141 @@ class Game:
                 if card:
                     player.hand.append(card)
 
-    def run_simulation(self, silent=False):
-        if not silent:
-            print("--- Starting Chicken Die! Simulation ---")
+        self.roster = Roster(self.players)
+        self._watch_for_stalemates()
+
+    def _watch_for_stalemates(self):
+        # Ends the game early once it stops making progress; None unless the rules enable it
+        rules = self.rules
+        self.stalemate = None
+        if rules.stalemate_window or rules.stalemate_repeats:
+            self.stalemate = StalemateDetector(self, rules.stalemate_window, rules.stalemate_repeats)
+
+    # --- Snapshots ---
+
+    def snapshot(self, include_rng=True):
+        """Captures the mutable state of the game as a tuple of plain values.
+
+        Flocks, the deck and the discard pile are stored as bytes (piles as card
+        ids) and hands as their count vectors, next to the eggs, supplies, graveyard, turn order flags
+        and, unless include_rng is False, the RNG states. Nothing else changes
+        during a game, so restore() can rewind this game to a snapshot and clone()
+        can build a copy from one. Copying the Mersenne Twister state is most of
+        the cost, so searches that give each rollout its own RNG should skip it.
+        """
+        deck = self.deck
+        if not include_rng:
+            rng_states = None
+        elif self.split_streams:
+            rng_states = (self.rng.getstate(), self.dice_rng.getstate(), self.choice_rng.getstate())
+        else:
+            rng_states = (self.rng.getstate(),)
+        return (
+            tuple((p.counts.tobytes(), p.egg_cards, p.infertile_hens, p._hand.__getstate__())
+                  for p in self.players),
+            deck.cards.tobytes(), deck.discard_pile.tobytes(), deck.reshuffles, deck.shuffles,
+            self.current_player_index, self.game_over, self.turn, self.reverse_direction, self.skip_roll,
+            self.chick_supply, self.hen_supply, self.egg_supply, tuple(self.graveyard), self.total_cards_played,
+            rng_states,
+        )
+
+    def restore(self, snapshot):
+        """Rewinds the game to a snapshot taken from it (or from a clone of it).
+
+        The RNGs are only rewound if the snapshot includes their states.
+        """
+        (players, cards, discard_pile, reshuffles, shuffles,
+         self.current_player_index, self.game_over, self.turn, self.reverse_direction, self.skip_roll,
+         self.chick_supply, self.hen_supply, self.egg_supply, graveyard, self.total_cards_played,
+         rng_states) = snapshot
+        roster = self.roster
+        roster.total = 0
+        live = []
+        for player, (counts, egg_cards, infertile_hens, hand) in zip(self.players, players):
+            player.counts = array('i', counts)
+            player.total = total = sum(player.counts)
+            player.egg_cards = egg_cards
+            player.infertile_hens = infertile_hens
+            player._hand = restored = object.__new__(Hand)
+            restored.__setstate__(hand)
+            roster.total += total
+            if total > 0:
+                live.append(player)
+        roster.live = live
+        deck = self.deck
+        deck.cards = array('B', cards)
+        deck.discard_pile = array('B', discard_pile)
+        deck.reshuffles = reshuffles
+        deck.shuffles = shuffles
+        self.graveyard = list(graveyard)
+        if rng_states is not None:
+            self.rng.setstate(rng_states[0])
+            if self.split_streams:
+                self.dice_rng.setstate(rng_states[1])
+                self.choice_rng.setstate(rng_states[2])
+
+    def clone(self, snapshot=None, rng=None):
+        """A silent, independent copy of this game, or of this game as it was at snapshot.
+
+        With the snapshot's RNG states the copy plays on exactly as the original
+        would. Passing rng (any random.Random) instead makes every random decision
+        of the copy come from it, which is what rollouts want; it is required when
+        the snapshot has no RNG states. The copy emits no events and records no
+        trace, and only the snapshot state is copied; the rest is rebuilt without
+        going through __init__. A stalemate detector starts afresh in the copy.
+        """
+        snapshot = snapshot if snapshot is not None else self.snapshot(include_rng=rng is None)
+        if rng is None and snapshot[-1] is None:
+            raise ValueError("Cloning a snapshot without RNG states needs an rng")
+        game = object.__new__(Game)
+        game.seed = self.seed
+        game.rules = self.rules
+        game.events = NULL_SINK
+        game.verbose = False
+        game.trace = None
+        if rng is not None:
+            game.split_streams = False
+            game.rng = game.dice_rng = game.shuffle_rng = game.choice_rng = rng
+        else:
+            game.split_streams = self.split_streams
+            game.rng = random.Random(0) # State comes from the snapshot
+            if self.split_streams:
+                game._stream_key = self._stream_key
+                game.dice_rng, game.choice_rng = CounterRandom(0), CounterRandom(0)
+                game.shuffle_rng = game.rng
+            else:
+                game.dice_rng = game.shuffle_rng = game.choice_rng = game.rng
+        game.players = [Player(p.name) for p in self.players]
+        game.strategies = list(self.strategies)
+        deck = game.deck = object.__new__(Deck)
+        deck.rng = game.shuffle_rng
+        deck.shuffle_key = self.deck.shuffle_key if rng is None else None
+        game.drought_active = self.drought_active
+        game.drought_player_index = self.drought_player_index
+        game.roster = Roster(game.players)
+        game.restore(snapshot if rng is None else snapshot[:-1] + (None,))
+        game._watch_for_stalemates()
+        return game
+
+    def run_simulation(self):
+        if self.verbose:
+            self.events.emit(GameStarted())
+            # The opening flocks, as changes from an empty flock
+            for player in self.players:
+                for kind, count in enumerate(player.counts):
+                    if count:
+                        self.events.emit(FlockChanged(player, kind, count))
         
         start_time = time.time()
+        record_turn = self.trace.start(self) if self.trace is not None else None
         
         while not self.game_over:
             self.turn += 1
-            if self.turn > 1000: # Safety break
+            if self.split_streams:
+                self._reseed_streams()
+            if self.turn > self.rules.max_turns: # Safety break
                 end_time = time.time()
+                self.events.flush()
                 return {
                     "winner": "None", 
                     "turns": self.turn, 
@@ -177,26 +675,22 @@ class Game:
                     "duration": end_time - start_time
                 }
 
-            if not silent:
-                print(f"\n--- Turn {self.turn} ---")
-                print(f"Supply: {self.chick_supply} Chicks, {self.hen_supply} Hens | Graveyard: {len(self.graveyard)}")
-                for p in self.players:
-                    print(f"  {p}")
+            if self.verbose:
+                self.events.emit(TurnStarted(self.turn, self.chick_supply, self.hen_supply,
+                                             len(self.graveyard), self.players))
 
             current_player = self.players[self.current_player_index]
-            self.take_turn(current_player, silent)
+            self.take_turn(current_player)
+            if record_turn is not None:
+                record_turn()
             
-            active_players = [p for p in self.players if p.total_chickens() > 0]
+            active_players = self.roster.live
             if len(active_players) <= 1:
                 self.game_over = True
                 end_time = time.time()
                 winner = active_players[0] if active_players else None
-                if not silent:
-                    print(f"\n--- Game Over! ---")
-                    if winner:
-                        print(f"Winner is {winner.name} after {self.turn} turns!")
-                    else:
-                        print("All players lost their chickens simultaneously!")
+                if self.verbose: self.events.emit(GameOver(winner, self.turn))
+                self.events.flush()
                 return {
                     "winner": winner.name if winner else "None", 
                     "turns": self.turn, 
@@ -205,22 +699,67 @@ class Game:
                     "duration": end_time - start_time
                 }
 
-            if self.reverse_direction:
-                self.current_player_index = (self.current_player_index - 1 + len(self.players)) % len(self.players)
-            else:
-                self.current_player_index = (self.current_player_index + 1) % len(self.players)
+            if self.stalemate is not None and self.stalemate.stalled(self):
+                return self._end_in_stalemate(start_time)
+
+            self._advance_player()
         return None
 
-    def take_turn(self, player, silent=False):
-        if not silent:
-            print(f"It's {player.name}'s turn.")
+    def _end_in_stalemate(self, start_time):
+        self.game_over = True
+        end_time = time.time()
+        if self.verbose:
+            self.events.emit(GameStalled(self.turn, self.stalemate.quiet_turns(self), self.stalemate.cycling))
+        self.events.flush()
+        return {
+            "winner": "None",
+            "turns": self.turn,
+            "reason": "Stalemate",
+            "turns_to_cap": self.rules.max_turns - self.turn, # Turns left before the max_turns safety break
+            "reshuffles": self.deck.reshuffles,
+            "cards_played": self.total_cards_played,
+            "duration": end_time - start_time
+        }
+
+    def _advance_player(self):
+        if self.reverse_direction:
+            self.current_player_index = (self.current_player_index - 1 + len(self.players)) % len(self.players)
+        else:
+            self.current_player_index = (self.current_player_index + 1) % len(self.players)
+
+    def _reseed_streams(self):
+        turn_key = _mix64(self._stream_key ^ self.turn)
+        self.dice_rng.state = turn_key
+        self.choice_rng.state = _mix64(turn_key)
+
+    def take_turn(self, player):
+        if self.verbose: self.events.emit(PlayerTurn(player))
 
         # Step 1: Collect Eggs
+        self._collect_eggs(player)
+
+        # Step 2: Draw a Card
+        self._draw_phase(player)
+
+        # AI Logic for playing cards and spending eggs
+        self.perform_ai_actions(player)
+
+        # Step 5: Roll the "Chicken Die!"
+        self._roll_phase(player)
+
+    def _roll_phase(self, player):
+        if not self.skip_roll:
+            self.roll_chicken_die(player)
+        else:
+            # Reset for the next player
+            self.skip_roll = False
+
+    def _collect_eggs(self, player):
         # Hens (1), Robo-Hens (2), Punk Rock Chicks (1)
-        player.infertile_hens = min(player.infertile_hens, player.flock["Hens"])
-        hens = player.flock["Hens"] - player.infertile_hens
-        robo_hens = player.flock["Robo-Hens"]
-        punk_rock_chicks = player.flock["Punk Rock Chicks"]
+        player.infertile_hens = min(player.infertile_hens, player.counts[HENS])
+        hens = player.counts[HENS] - player.infertile_hens
+        robo_hens = player.counts[ROBO]
+        punk_rock_chicks = player.counts[PUNK]
         collected_eggs = max(0, hens) + (robo_hens * 2) + punk_rock_chicks
         
         # Draw from supply
@@ -228,386 +767,365 @@ class Game:
         player.egg_cards += actual_collected
         self.egg_supply -= actual_collected
         
-        if not silent and actual_collected > 0:
-            print(f"{player.name} collects {actual_collected} egg cards, now has {player.egg_cards}.")
+        if self.verbose and actual_collected > 0:
+            self.events.emit(EggsCollected(player, actual_collected))
 
-        # Step 2: Draw a Card
+    def _draw_phase(self, player):
         drawn_card = self.deck.draw()
         if drawn_card:
             if drawn_card.card_type == "Instant Effect":
-                if not silent: print(f"{player.name} drew an Instant Effect: {drawn_card.name}!")
-                self.play_card(player, drawn_card, silent)
+                if self.verbose: self.events.emit(CardDrawn(player, drawn_card))
+                self.play_card(player, drawn_card, from_hand=False)
             else:
                 player.hand.append(drawn_card)
-                if not silent: print(f"{player.name} draws a card.")
-
-        # AI Logic for playing cards and spending eggs
-        self.perform_ai_actions(player, silent)
-
-        # Step 5: Roll the "Chicken Die!"
-        if not self.skip_roll:
-            self.roll_chicken_die(player, silent)
-        else:
-            # Reset for the next player
-            self.skip_roll = False
+                if self.verbose: self.events.emit(CardDrawn(player, drawn_card))
 
     def get_opponents(self, current_player):
-        return [p for p in self.players if p is not current_player and p.total_chickens() > 0]
+        return [p for p in self.roster.live if p is not current_player]
 
-    def perform_ai_actions(self, player, silent=False):
+    def perform_ai_actions(self, player):
         """
-        AI logic for playing cards and spending eggs based on situational awareness.
+        Plays cards and spends eggs as the player's Strategy decides.
         """
-        # Determine AI mode
-        mode = self._get_ai_mode(player)
+        strategy = self.strategies[player.seat]
+        strategy.begin_turn(self, player)
 
         # --- AI: Play Cards ---
-        self._ai_play_cards(player, mode, silent)
+        self._ai_play_cards(player, strategy)
 
         # --- AI: Spend Eggs ---
-        self._ai_spend_eggs(player, mode, silent)
-
-    def _get_ai_mode(self, player):
-        """Determines the AI's current mode (Growth, Aggressive, Defensive)."""
-        total_chickens = player.total_chickens()
-        if total_chickens <= 2:
-            return "Growth"
-        
-        average_chickens = sum(p.total_chickens() for p in self.players) / len(self.players)
-        if total_chickens > average_chickens:
-            return "Aggressive"
-            
-        return "Defensive"
-
-    def _ai_play_cards(self, player, mode, silent):
-        """AI logic for playing cards based on the current mode."""
-        card_to_play = None
-        
-        if mode == "Growth":
-            card_to_play = next((c for c in player.hand if c.card_type == "Personal Growth"), None)
-        elif mode == "Aggressive":
-            card_to_play = next((c for c in player.hand if c.card_type == "Attack"), None)
-        elif mode == "Defensive":
-            # In defensive mode, the AI is more conservative and might hold cards.
-            # For now, we'll keep it simple and play a growth card if available.
-            card_to_play = next((c for c in player.hand if c.card_type == "Personal Growth"), None)
-
-        if card_to_play:
-            self.play_card(player, card_to_play, silent)
-
-    def _ai_spend_eggs(self, player, mode, silent):
-        """AI logic for spending eggs based on the current mode."""
-        # Step 4: Cash in Eggs
+        self._ai_spend_eggs(player, strategy)
+
+    def _ai_play_cards(self, player, strategy):
+        """Step 3: plays the cards the strategy picks, one at a time."""
+        while True:
+            card_to_play = strategy.choose_card(self, player)
+            if card_to_play is None:
+                return
+            if card_to_play not in player.hand:
+                raise ValueError(f"{player.name} cannot play {card_to_play.name}: not in hand")
+            self.play_card(player, card_to_play)
+
+    def _ai_spend_eggs(self, player, strategy):
+        """Step 4: cashes in eggs as the strategy picks."""
         # Rule: Spend 3 Eggs -> Draw 1 card
         # Rule: Spend 6 Eggs -> Take 1 Chick Card
         
         while player.egg_cards >= 3:
-            if player.egg_cards >= 6 and self.chick_supply > 0 and mode in ["Growth", "Defensive"]:
+            spend = strategy.choose_egg_spend(self, player)
+            if spend == BUY_CHICK:
+                if player.egg_cards < 6 or self.chick_supply <= 0:
+                    raise ValueError(f"{player.name} cannot buy a Chick")
                 player.egg_cards -= 6
                 self.egg_supply += 6
-                player.flock["Chicks"] += 1
+                player.add(CHICKS, 1)
                 self.chick_supply -= 1
-                if not silent:
-                    print(f"{player.name} spends 6 eggs to get a new Chick from the supply.")
-            else:
+                if self.verbose:
+                    self.events.emit(ChickBought(player))
+                    self.events.emit(FlockChanged(player, CHICKS, 1))
+            elif spend == DRAW_CARD:
                 player.egg_cards -= 3
                 self.egg_supply += 3
                 drawn_card = self.deck.draw()
                 if drawn_card:
                     if drawn_card.card_type == "Instant Effect":
-                        if not silent: print(f"{player.name} drew an Instant Effect while cashing in eggs: {drawn_card.name}!")
-                        self.play_card(player, drawn_card, silent)
+                        if self.verbose: self.events.emit(CardDrawn(player, drawn_card, cashed_in_eggs=True))
+                        self.play_card(player, drawn_card, from_hand=False)
                     else:
                         player.hand.append(drawn_card)
-                        if not silent: print(f"{player.name} spends 3 eggs to draw a card.")
+                        if self.verbose: self.events.emit(CardDrawn(player, drawn_card, cashed_in_eggs=True))
                 else:
                     break
+            else:
+                break
 
-    def play_card(self, player, card, silent=False):
-        if card in player.hand:
-            player.hand.remove(card)
+    def play_card(self, player, card, from_hand=True):
+        """Plays a card for player. Instant Effects go straight from the deck to the
+        table with from_hand=False: cards are interned, so removing "the" card from
+        the hand would take away a copy the player holds.
+        """
+        if from_hand:
+            hand = player._hand
+            if card in hand:
+                hand.remove(card)
         
         self.total_cards_played += 1
         
-        SPECIALTY_CHICKENS = {
-            "Dino Chicken": "Dino Chickens",
-            "Flying Chicken": "Flying Chickens",
-            "Mad Scientist Chicken": "Mad Scientist Chickens",
-            "Robo-Hen": "Robo-Hens",
-            "Decoy Chicken": "Decoy Chickens",
-            "Punk Rock Chick": "Punk Rock Chicks"
-        }
-
-        if card.name in SPECIALTY_CHICKENS:
-            player.flock[SPECIALTY_CHICKENS[card.name]] += 1
+        card_id = card.id
+        kind = CARD_FLOCK_KIND[card_id]
+        if kind >= 0:
+            player.add(kind, 1)
         else:
-            self.deck.discard_pile.append(card)
+            self.deck.discard_pile.append(card_id)
 
-        if not silent:
-            print(f"{player.name} plays {card.name}.")
+        if self.verbose:
+            self.events.emit(CardPlayed(player, card))
+            if kind >= 0:
+                self.events.emit(FlockChanged(player, kind, 1))
 
         # --- Card Effects ---
-        card_function = self.card_dispatcher.get(card.name)
-        if card_function:
-            card_function(player, silent)
-
-    def _initialize_card_dispatcher(self):
-        self.card_dispatcher = {
-            "Coyote Attack": self._play_coyote_attack,
-            "Chicken Blaster": self._play_chicken_blaster,
-            "Eat Mor Chikin": self._play_eat_mor_chikin,
-            "Farm to Table": self._play_farm_to_table,
-            "Feeding Frenzy": self._play_feeding_frenzy,
-            "Resurrection": self._play_resurrection,
-            "Die-Die-Die!": self._play_die_die_die,
-            "Hen Swap": self._play_hen_swap,
-            "Bird Flu": self._play_bird_flu,
-            "3-Egg Omelette": self._play_omelette,
-            "Infertility": self._play_infertility,
-            "Incubator": self._play_incubator,
-            "Demotion": self._play_demotion,
-            "Foster Farms": self._play_foster_farms,
-            "Fox on the Loose": self._play_fox_on_the_loose,
-            "Chicken Assassin": self._play_chicken_assassin,
-            "Chicken Bomb": self._play_chicken_bomb,
-            "End Your Turn": self._play_end_your_turn,
-            "Reverse": self._play_reverse,
-        }
+        card_function = self.card_handlers[card_id]
+        if card_function is not None:
+            card_function(self, player)
 
-    # --- Card Logic Methods ---
-
-    def _play_coyote_attack(self, player, silent):
-        opponents = self.get_opponents(player)
-        if opponents:
-            target = random.choice(opponents)
-            if not silent: print(f"{player.name} targets {target.name} with Coyote Attack.")
-            self._kill_a_chicken(target, silent, attacker=player)
+    @property
+    def card_dispatcher(self):
+        """Card name -> handler bound to this game, for the cards that have one."""
+        return {CARDS[card_id].name: types.MethodType(handler, self)
+                for card_id, handler in enumerate(self.card_handlers) if handler is not None}
 
-    def _play_chicken_blaster(self, player, silent):
-        opponents = self.get_opponents(player)
-        if opponents:
-            target = random.choice(opponents)
-            if not silent: print(f"{player.name} targets {target.name} with Chicken Blaster.")
-            self._kill_a_chicken(target, silent, attacker=player)
+    # --- Card Logic Methods ---
 
-    def _play_eat_mor_chikin(self, player, silent):
-        opponents = self.get_opponents(player)
-        if opponents:
-            target = random.choice(opponents)
-            if not silent: print(f"{player.name} targets {target.name} with Eat Mor Chikin.")
-            self._kill_a_chicken(target, silent, attacker=player)
+    def _choose_target(self, player, card, candidates=None):
+        return self.strategies[player.seat].choose_target(self, player, card, candidates)
+
+    def _play_coyote_attack(self, player):
+        card = COYOTE_ATTACK
+        target = self._choose_target(player, card)
+        if target is not None:
+            if self.verbose: self.events.emit(TargetChosen(player, target, card))
+            self._kill_a_chicken(target, attacker=player, card=card)
+
+    def _play_chicken_blaster(self, player):
+        card = CHICKEN_BLASTER
+        target = self._choose_target(player, card)
+        if target is not None:
+            if self.verbose: self.events.emit(TargetChosen(player, target, card))
+            self._kill_a_chicken(target, attacker=player, card=card)
+
+    def _play_eat_mor_chikin(self, player):
+        card = EAT_MOR_CHIKIN
+        target = self._choose_target(player, card)
+        if target is not None:
+            if self.verbose: self.events.emit(TargetChosen(player, target, card))
+            self._kill_a_chicken(target, attacker=player, card=card)
             self.skip_roll = True
-            if not silent: print(f"{player.name} skips their 'Roll the Chicken Die!' step.")
+            if self.verbose: self.events.emit(RollSkipped(player, card))
 
-    def _play_farm_to_table(self, player, silent):
+    def _play_farm_to_table(self, player):
         cards_gained = min(3, self.egg_supply)
         player.egg_cards += cards_gained
         self.egg_supply -= cards_gained
-        if not silent: print(f"{player.name} collects {cards_gained} Egg Cards.")
+        if self.verbose: self.events.emit(EggsCollected(player, cards_gained, FARM_TO_TABLE))
 
-    def _play_feeding_frenzy(self, player, silent):
-        chicks_to_promote = player.flock["Chicks"]
+    def _play_feeding_frenzy(self, player):
+        chicks_to_promote = player.counts[CHICKS]
         promotions = min(chicks_to_promote, 3, self.hen_supply)
         if promotions > 0:
-            player.flock["Chicks"] -= promotions
+            player.add(CHICKS, -promotions)
             self.chick_supply += promotions
-            player.flock["Hens"] += promotions
+            player.add(HENS, promotions)
             self.hen_supply -= promotions
-            if not silent: print(f"{player.name} promotes {promotions} chicks to hens!")
+            if self.verbose:
+                self.events.emit(ChicksPromoted(player, promotions))
+                self.events.emit(FlockChanged(player, CHICKS, -promotions))
+                self.events.emit(FlockChanged(player, HENS, promotions))
 
-    def _play_resurrection(self, player, silent):
+    def _play_resurrection(self, player):
         if self.graveyard:
-            chicken_type = random.choice(self.graveyard)
+            chicken_type = self.choice_rng.choice(self.graveyard)
             self.graveyard.remove(chicken_type)
-            # Map back to flock key
-            mapping = {
-                "Dino Chicken": "Dino Chickens",
-                "Flying Chicken": "Flying Chickens",
-                "Mad Scientist Chicken": "Mad Scientist Chickens",
-                "Robo-Hen": "Robo-Hens",
-                "Decoy Chicken": "Decoy Chickens",
-                "Punk Rock Chick": "Punk Rock Chicks"
-            }
-            if chicken_type in mapping:
-                player.flock[mapping[chicken_type]] += 1
-                if not silent: print(f"{player.name} resurrects a {chicken_type}!")
-
-    def _play_die_die_die(self, player, silent):
-        opponents = self.get_opponents(player)
-        if opponents:
-            target = random.choice(opponents)
-            if not silent: print(f"{player.name} targets {target.name} with Die-Die-Die!.")
+            kind = SPECIALTY_KIND_BY_NAME.get(chicken_type)
+            if kind is not None:
+                player.add(kind, 1)
+                if self.verbose:
+                    self.events.emit(ChickenResurrected(player, chicken_type))
+                    self.events.emit(FlockChanged(player, kind, 1))
+
+    def _play_die_die_die(self, player):
+        target = self._choose_target(player, DIE_DIE_DIE)
+        if target is not None:
+            if self.verbose: self.events.emit(TargetChosen(player, target, DIE_DIE_DIE))
             for _ in range(3):
-                roll = random.randint(1, 6)
-                if not silent: print(f"  {target.name} rolls: {roll}")
+                roll = self.dice_rng.randint(1, 6)
+                if self.verbose: self.events.emit(DieRolled(target, roll, DIE_DIE_DIE))
                 # Only negative outcomes: demotions and chicken dying (Roll 4, 5, 6)
                 if roll == 4: # Demote a Chick!
-                    if target.flock["Chicks"] > 0 and self.egg_supply > 0:
-                        target.flock["Chicks"] -= 1
+                    if target.counts[CHICKS] > 0 and self.egg_supply > 0:
+                        target.add(CHICKS, -1)
                         self.chick_supply += 1
                         target.egg_cards += 1
                         self.egg_supply -= 1
-                        if not silent: print("  Outcome: Demote a Chick!")
+                        if self.verbose:
+                            self.events.emit(DieOutcome(target, roll, True, DIE_DIE_DIE))
+                            self.events.emit(FlockChanged(target, CHICKS, -1))
                 elif roll == 5: # Demote a Hen!
-                    if target.flock["Hens"] > 0 and self.chick_supply > 0:
-                        target.flock["Hens"] -= 1
+                    if target.counts[HENS] > 0 and self.chick_supply > 0:
+                        target.add(HENS, -1)
                         self.hen_supply += 1
-                        target.flock["Chicks"] += 1
+                        target.add(CHICKS, 1)
                         self.chick_supply -= 1
-                        if not silent: print("  Outcome: Demote a Hen!")
+                        if self.verbose:
+                            self.events.emit(DieOutcome(target, roll, True, DIE_DIE_DIE))
+                            self.events.emit(FlockChanged(target, HENS, -1))
+                            self.events.emit(FlockChanged(target, CHICKS, 1))
                 elif roll == 6: # A Chicken Dies!
-                    self._kill_a_chicken(target, silent)
+                    self._kill_a_chicken(target)
                 else:
-                    if not silent: print(f"  Outcome: {roll} (No effect due to Die-Die-Die! rules)")
+                    if self.verbose: self.events.emit(DieOutcome(target, roll, False, DIE_DIE_DIE))
 
-    def _play_hen_swap(self, player, silent):
-        opponents = self.get_opponents(player)
-        if opponents:
-            target = random.choice(opponents)
+    def _play_hen_swap(self, player):
+        target = self._choose_target(player, HEN_SWAP)
+        if target is not None:
             # Swap ALL hens. Receive up to 3.
-            my_hens = player.flock["Hens"]
-            target_hens = target.flock["Hens"]
+            my_hens = player.counts[HENS]
+            target_hens = target.counts[HENS]
             
-            player.flock["Hens"] = min(target_hens, 3)
-            target.flock["Hens"] = my_hens
+            player.set_count(HENS, min(target_hens, 3))
+            target.set_count(HENS, my_hens)
             
             # Adjust supply if we capped at 3
             if target_hens > 3:
                 self.hen_supply += (target_hens - 3)
             
-            if not silent: print(f"{player.name} swaps Hens with {target.name}. Now has {player.flock['Hens']} Hens.")
-
-    def _play_bird_flu(self, player, silent):
-        if not silent: print("Bird Flu! All standard chicks in play die.")
-        for p in self.players:
+            if self.verbose:
+                self.events.emit(HensSwapped(player, target))
+                self.events.emit(FlockChanged(player, HENS, player.counts[HENS] - my_hens))
+                self.events.emit(FlockChanged(target, HENS, my_hens - target_hens))
+
+    def _play_bird_flu(self, player):
+        if self.verbose: self.events.emit(GlobalEffect(player, BIRD_FLU))
+        # Only players with chickens can be affected; copy since the live list may change
+        for p in tuple(self.roster.live):
             # Explicitly target standard "Chicks" key only
-            chicks_to_die = min(p.flock["Chicks"], 3) # Max 3 deaths per person
+            chicks_to_die = min(p.counts[CHICKS], 3) # Max 3 deaths per person
             if chicks_to_die > 0:
-                p.flock["Chicks"] -= chicks_to_die
+                p.add(CHICKS, -chicks_to_die)
                 self.chick_supply += chicks_to_die
-                if not silent: print(f"  {p.name} loses {chicks_to_die} chicks.")
+                if self.verbose:
+                    self.events.emit(ChickensLost(p, "chicks", chicks_to_die))
+                    self.events.emit(FlockChanged(p, CHICKS, -chicks_to_die))
 
-    def _play_omelette(self, player, silent):
-        opponents = self.get_opponents(player)
-        if opponents:
-            target = random.choice(opponents)
+    def _play_omelette(self, player):
+        target = self._choose_target(player, THREE_EGG_OMELETTE)
+        if target is not None:
             eggs_lost = min(3, target.egg_cards)
             target.egg_cards -= eggs_lost
             self.egg_supply += eggs_lost
-            if not silent: print(f"{player.name} destroys {eggs_lost} of {target.name}'s eggs.")
+            if self.verbose: self.events.emit(EggsDestroyed(player, target, eggs_lost))
 
-    def _play_infertility(self, player, silent):
-        opponents = [p for p in self.get_opponents(player) if p.flock["Hens"] > p.infertile_hens]
+    def _play_infertility(self, player):
+        opponents = [p for p in self.roster.live if p is not player and p.counts[HENS] > p.infertile_hens]
         if opponents:
-            target = random.choice(opponents)
+            target = self._choose_target(player, INFERTILITY, opponents)
+            if target is None:
+                return
             target.infertile_hens += 1
-            if not silent: print(f"{player.name} makes one of {target.name}'s hens infertile.")
+            if self.verbose: self.events.emit(HenMadeInfertile(player, target))
 
-    def _play_incubator(self, player, silent):
+    def _play_incubator(self, player):
         # Trade 2 Egg Cards for 1 Chick, up to 3 chicks.
         chicks_gained = 0
         while player.egg_cards >= 2 and chicks_gained < 3 and self.chick_supply > 0:
             player.egg_cards -= 2
             self.egg_supply += 2
-            player.flock["Chicks"] += 1
+            player.add(CHICKS, 1)
             self.chick_supply -= 1
             chicks_gained += 1
-        if not silent and chicks_gained > 0:
-            print(f"{player.name} used Incubator to get {chicks_gained} chicks.")
-
-    def _play_demotion(self, player, silent):
-        if not silent: print("A worldwide demotion! All hens become chicks.")
-        for p in self.players:
-            hens = p.flock["Hens"]
+        if self.verbose and chicks_gained > 0:
+            self.events.emit(ChicksHatched(player, chicks_gained))
+            self.events.emit(FlockChanged(player, CHICKS, chicks_gained))
+
+    def _play_demotion(self, player):
+        if self.verbose: self.events.emit(GlobalEffect(player, DEMOTION))
+        # Only players with chickens can be affected; copy since the live list may change
+        for p in tuple(self.roster.live):
+            hens = p.counts[HENS]
             if hens > 0:
-                p.flock["Hens"] = 0
+                p.set_count(HENS, 0)
                 self.hen_supply += hens
                 chicks = min(hens, self.chick_supply)
-                p.flock["Chicks"] += chicks
+                p.add(CHICKS, chicks)
                 self.chick_supply -= chicks
-
-    def _play_foster_farms(self, player, silent):
-        if not silent: print("Foster Farms! All standard hens die.")
-        for p in self.players:
+                if self.verbose:
+                    self.events.emit(FlockChanged(p, HENS, -hens))
+                    self.events.emit(FlockChanged(p, CHICKS, chicks))
+
+    def _play_foster_farms(self, player):
+        if self.verbose: self.events.emit(GlobalEffect(player, FOSTER_FARMS))
+        # Only players with chickens can be affected; copy since the live list may change
+        for p in tuple(self.roster.live):
             # Explicitly target standard "Hens" key only
-            hens_to_die = min(p.flock["Hens"], 3)
+            hens_to_die = min(p.counts[HENS], 3)
             if hens_to_die > 0:
-                p.flock["Hens"] -= hens_to_die
+                p.add(HENS, -hens_to_die)
                 self.hen_supply += hens_to_die
-                if not silent: print(f"  {p.name} loses {hens_to_die} hens.")
-
-    def _play_fox_on_the_loose(self, player, silent):
-        if not silent: print("A fox is on the loose!")
-        for p in self.players:
-            if not silent: print(f"  The fox visits {p.name}...")
-            self.roll_chicken_die(p, silent)
-            self.roll_chicken_die(p, silent)
+                if self.verbose:
+                    self.events.emit(ChickensLost(p, "hens", hens_to_die))
+                    self.events.emit(FlockChanged(p, HENS, -hens_to_die))
 
-    def _play_chicken_assassin(self, player, silent):
-        if not silent: print("Chicken Assassin! Each player must lose a Specialty Chicken.")
+    def _play_fox_on_the_loose(self, player):
+        if self.verbose: self.events.emit(GlobalEffect(player, FOX_ON_THE_LOOSE))
         for p in self.players:
-            specialty_keys = ["Dino Chickens", "Flying Chickens", "Mad Scientist Chickens", "Robo-Hens", "Decoy Chickens", "Punk Rock Chicks"]
-            available = [k for k in specialty_keys if p.flock[k] > 0]
+            if self.verbose: self.events.emit(FoxVisits(p))
+            self.roll_chicken_die(p)
+            self.roll_chicken_die(p)
+
+    def _play_chicken_assassin(self, player):
+        if self.verbose: self.events.emit(GlobalEffect(player, CHICKEN_ASSASSIN))
+        # Only players with chickens can be affected; copy since the live list may change
+        for p in tuple(self.roster.live):
+            counts = p.counts
+            available = [k for k in SPECIALTY_KINDS if counts[k] > 0]
             if available:
-                chosen = random.choice(available)
-                p.flock[chosen] -= 1
-                # Graveyard mapping
-                inv_mapping = {v: k for k, v in {
-                    "Dino Chicken": "Dino Chickens",
-                    "Flying Chicken": "Flying Chickens",
-                    "Mad Scientist Chicken": "Mad Scientist Chickens",
-                    "Robo-Hen": "Robo-Hens",
-                    "Decoy Chicken": "Decoy Chickens",
-                    "Punk Rock Chick": "Punk Rock Chicks"
-                }.items()}
-                self.graveyard.append(inv_mapping[chosen])
-                if not silent: print(f"  {p.name} loses a {inv_mapping[chosen]}.")
-
-    def _play_chicken_bomb(self, player, silent):
-        if not silent: print(f"{player.name} is hit by a Chicken Bomb!")
-        self._kill_a_chicken(player, silent)
-
-    def _play_end_your_turn(self, player, silent):
-        if not silent: print(f"{player.name} ends their turn early.")
+                chosen = self.choice_rng.choice(available)
+                p.add(chosen, -1)
+                self.graveyard.append(SPECIALTY_NAMES[chosen])
+                if self.verbose:
+                    self.events.emit(ChickenKilled(p, SPECIALTY_NAMES[chosen], CHICKEN_ASSASSIN))
+                    self.events.emit(FlockChanged(p, chosen, -1))
+
+    def _play_chicken_bomb(self, player):
+        if self.verbose: self.events.emit(GlobalEffect(player, CHICKEN_BOMB))
+        self._kill_a_chicken(player)
+
+    def _play_end_your_turn(self, player):
+        if self.verbose: self.events.emit(RollSkipped(player, END_YOUR_TURN))
         self.skip_roll = True
 
-    def _play_reverse(self, player, silent):
-        if not silent: print("The direction of play is reversed and turn ends!")
+    def _play_reverse(self, player):
+        if self.verbose: self.events.emit(RollSkipped(player, REVERSE))
         self.reverse_direction = not self.reverse_direction
         self.skip_roll = True
 
-    def _kill_a_chicken(self, player, silent=False, attacker=None):
-        """Kills a chicken, prioritizing Decoy Chickens."""
+    def _kill_a_chicken(self, player, attacker=None, card=None):
+        """Kills a chicken, prioritizing Decoy Chickens.
+
+        attacker is the player whose card caused the kill, if any, and card that
+        card; Dino Chickens are spared when the card is a predator.
+        """
         # AI Check for Immunity or Cock Block (if attacker)
+        hand = player._hand
         if attacker:
-            cock_block = next((card for card in player.hand if card.name == "Cock Block"), None)
-            if cock_block:
-                player.hand.remove(cock_block)
-                self.deck.discard_pile.append(cock_block)
-                if not silent: print(f"{player.name} plays Cock Block! Attack canceled and {attacker.name}'s turn ends.")
+            if hand.counts[COCK_BLOCK.id]:
+                cock_block = COCK_BLOCK
+                hand.remove(cock_block)
+                self.deck.discard_pile.append(cock_block.id)
+                if self.verbose: self.events.emit(AttackBlocked(player, cock_block, attacker))
                 # Ends their Play Action Cards step immediately? README says "ends their Play Action Cards step immediately"
                 # For simulation, we'll just stop the current attack and maybe skip roll?
                 # "ends their Play Action Cards step immediately" - this is hard to implement without a loop.
                 # We'll just return True to indicate it was blocked.
                 return True
 
-        immunity_card = next((card for card in player.hand if card.name == "Immunity"), None)
-        if immunity_card:
-            player.hand.remove(immunity_card)
-            self.deck.discard_pile.append(immunity_card)
-            if not silent: print(f"{player.name} plays Immunity to save a chicken!")
+        if hand.counts[IMMUNITY.id]:
+            immunity_card = IMMUNITY
+            hand.remove(immunity_card)
+            self.deck.discard_pile.append(immunity_card.id)
+            if self.verbose: self.events.emit(AttackBlocked(player, immunity_card, attacker))
             return True
 
         # Check for Dino Chicken (Cannot be killed by predators)
-        # Coyote Attack and Chicken Blaster and Eat Mor Chikin are predators?
-        # README says "Cannot be killed by predators" for Dino Chicken.
-        # I'll assume Coyote, Chicken Blaster, Eat Mor Chikin are predators.
+        # Coyote Attack, Chicken Blaster and Eat Mor Chikin are the predators
+        # (CardSpec.predator in the card registry).
         
         # Priority: Decoy Chicken
-        if player.flock["Decoy Chickens"] > 0:
-            player.flock["Decoy Chickens"] -= 1
+        if player.counts[DECOY] > 0:
+            player.add(DECOY, -1)
             self.graveyard.append("Decoy Chicken")
-            if not silent: print(f"{player.name}'s Decoy Chicken is destroyed!")
+            if self.verbose:
+                self.events.emit(ChickenKilled(player, "Decoy Chicken"))
+                self.events.emit(FlockChanged(player, DECOY, -1))
             return True
 
         # If it's a predator attack, Dino Chicken is immune.
@@ -616,142 +1134,430 @@ class Game:
         # Or if Dino is chosen, it survives?
         # "choose one chicken... (either a Chick, Hen, or Specialty Chicken)"
         
+        counts = player.counts
         candidates = []
-        if player.flock["Chicks"] > 0: candidates.append("Chicks")
-        if player.flock["Hens"] > 0: candidates.append("Hens")
-        if player.flock["Flying Chickens"] > 0: candidates.append("Flying Chickens")
-        if player.flock["Mad Scientist Chickens"] > 0: candidates.append("Mad Scientist Chickens")
-        if player.flock["Robo-Hens"] > 0: candidates.append("Robo-Hens")
-        if player.flock["Punk Rock Chicks"] > 0: candidates.append("Punk Rock Chicks")
+        if counts[CHICKS] > 0: candidates.append(CHICKS)
+        if counts[HENS] > 0: candidates.append(HENS)
+        if counts[FLYING] > 0: candidates.append(FLYING)
+        if counts[MAD] > 0: candidates.append(MAD)
+        if counts[ROBO] > 0: candidates.append(ROBO)
+        if counts[PUNK] > 0: candidates.append(PUNK)
         
         # Dino Chicken only added if not a predator attack
-        is_predator = attacker is not None # Simplified assumption
-        if not is_predator and player.flock["Dino Chickens"] > 0:
-            candidates.append("Dino Chickens")
+        is_predator = card is not None and CARD_PREDATOR[card.id]
+        if not is_predator and counts[DINO] > 0:
+            candidates.append(DINO)
 
         if candidates:
-            chosen = random.choice(candidates)
-            player.flock[chosen] -= 1
-            if chosen == "Chicks":
+            chosen = self.choice_rng.choice(candidates)
+            player.add(chosen, -1)
+            if chosen == CHICKS:
                 self.chick_supply += 1
-                if not silent: print(f"{player.name} loses a Chick.")
-            elif chosen == "Hens":
+                if self.verbose: self.events.emit(ChickenKilled(player, "Chick"))
+            elif chosen == HENS:
                 self.hen_supply += 1
-                if not silent: print(f"{player.name} loses a Hen.")
+                if self.verbose: self.events.emit(ChickenKilled(player, "Hen"))
             else:
                 # Specialty Chicken goes to graveyard
-                inv_mapping = {
-                    "Dino Chickens": "Dino Chicken",
-                    "Flying Chickens": "Flying Chicken",
-                    "Mad Scientist Chickens": "Mad Scientist Chicken",
-                    "Robo-Hens": "Robo-Hen",
-                    "Decoy Chickens": "Decoy Chicken",
-                    "Punk Rock Chicks": "Punk Rock Chick"
-                }
-                self.graveyard.append(inv_mapping[chosen])
-                if not silent: print(f"{player.name} loses a {inv_mapping[chosen]}.")
+                self.graveyard.append(SPECIALTY_NAMES[chosen])
+                if self.verbose: self.events.emit(ChickenKilled(player, SPECIALTY_NAMES[chosen]))
+            if self.verbose: self.events.emit(FlockChanged(player, chosen, -1))
             return True
         else:
-            if not silent: print(f"{player.name} has no chickens to lose.")
+            if self.verbose: self.events.emit(NoChickenToLose(player))
             return False
 
-    def roll_chicken_die(self, player, silent=False):
-        roll = random.randint(1, 6)
-        if not silent:
-            print(f"{player.name} rolls the Chicken Die: {roll}")
+    def roll_chicken_die(self, player):
+        roll = self.dice_rng.randint(1, 6)
+        if self.verbose: self.events.emit(DieRolled(player, roll))
         
         if roll == 1: # Collect an Egg!
             if self.egg_supply > 0:
                 player.egg_cards += 1
                 self.egg_supply -= 1
-                if not silent: print("Outcome: Collect an Egg!")
+                if self.verbose: self.events.emit(DieOutcome(player, roll, True))
         elif roll == 2: # Promote an Egg!
             if player.egg_cards > 0 and self.chick_supply > 0:
                 player.egg_cards -= 1
                 self.egg_supply += 1
-                player.flock["Chicks"] += 1
+                player.add(CHICKS, 1)
                 self.chick_supply -= 1
-                if not silent: print("Outcome: Promote an Egg! (Egg -> Chick)")
+                if self.verbose:
+                    self.events.emit(DieOutcome(player, roll, True))
+                    self.events.emit(FlockChanged(player, CHICKS, 1))
             else:
-                if not silent: print("Outcome: Promote an Egg! (No effect)")
+                if self.verbose: self.events.emit(DieOutcome(player, roll, False))
         elif roll == 3: # Promote a Chick!
-            if player.flock["Chicks"] > 0 and self.hen_supply > 0:
-                player.flock["Chicks"] -= 1
-                player.flock["Hens"] += 1
+            if player.counts[CHICKS] > 0 and self.hen_supply > 0:
+                player.add(CHICKS, -1)
+                player.add(HENS, 1)
                 self.hen_supply -= 1
-                if not silent: print("Outcome: Promote a Chick! (Chick -> Hen)")
+                if self.verbose:
+                    self.events.emit(DieOutcome(player, roll, True))
+                    self.events.emit(FlockChanged(player, CHICKS, -1))
+                    self.events.emit(FlockChanged(player, HENS, 1))
             else:
-                if not silent: print("Outcome: Promote a Chick! (No effect)")
+                if self.verbose: self.events.emit(DieOutcome(player, roll, False))
         elif roll == 4: # Demote a Chick!
-            if player.flock["Chicks"] > 0 and self.egg_supply > 0:
-                player.flock["Chicks"] -= 1
+            if player.counts[CHICKS] > 0 and self.egg_supply > 0:
+                player.add(CHICKS, -1)
                 self.chick_supply += 1
                 player.egg_cards += 1
                 self.egg_supply -= 1
-                if not silent: print("Outcome: Demote a Chick! (Chick -> Egg)")
+                if self.verbose:
+                    self.events.emit(DieOutcome(player, roll, True))
+                    self.events.emit(FlockChanged(player, CHICKS, -1))
             else:
-                if not silent: print("Outcome: Demote a Chick! (No effect)")
+                if self.verbose: self.events.emit(DieOutcome(player, roll, False))
         elif roll == 5: # Demote a Hen!
-            if player.flock["Hens"] > 0 and self.chick_supply > 0:
-                player.flock["Hens"] -= 1
+            if player.counts[HENS] > 0 and self.chick_supply > 0:
+                player.add(HENS, -1)
                 self.hen_supply += 1
-                player.flock["Chicks"] += 1
+                player.add(CHICKS, 1)
                 self.chick_supply -= 1
-                if not silent: print("Outcome: Demote a Hen! (Hen -> Chick)")
+                if self.verbose:
+                    self.events.emit(DieOutcome(player, roll, True))
+                    self.events.emit(FlockChanged(player, HENS, -1))
+                    self.events.emit(FlockChanged(player, CHICKS, 1))
             else:
-                if not silent: print("Outcome: Demote a Hen! (No effect)")
+                if self.verbose: self.events.emit(DieOutcome(player, roll, False))
         elif roll == 6: # A Chicken Dies!
-            if not silent: print("Outcome: A Chicken Dies!")
-            self._kill_a_chicken(player, silent)
+            if self.verbose: self.events.emit(DieOutcome(player, roll, True))
+            self._kill_a_chicken(player)
+
 
+# Handlers by card id, compiled from the registry; GameProfiler shadows this per instance
+Game.card_handlers = tuple(getattr(Game, name) if name else None for name in CARD_HANDLERS)
 
-def run_multiple_simulations(num_simulations=100, num_players=4):
-    print(f"--- Running {num_simulations} Simulations ---")
+
+def _play_games(task):
+    """Plays a contiguous range of seeded games and returns compact per-game results.
+
+    A game's outcome depends only on its seed, not on which worker (or in what
+    order) it ran. Results are (seed, winner_seat, turns, reshuffles, cards_played,
+    duration) tuples, with winner_seat = -1 when nobody won. The task is
+    (start_seed, count, num_players), optionally followed by the Rules to play by.
+    """
+    start_seed, count, num_players = task[:3]
+    rules = task[3] if len(task) > 3 else DEFAULT_RULES
     results = []
-    for i in range(num_simulations):
-        game = Game(num_players=num_players, silent_deck=True)
-        result = game.run_simulation(silent=True)
+    for seed in range(start_seed, start_seed + count):
+        game = Game(num_players=num_players, silent_deck=True, seed=seed, rules=rules)
+        result = game.run_simulation()
         if result:
-            results.append(result)
-
-    print("\n--- Simulation Results ---")
-    if not results:
-        print("No games finished.")
-        return
-
-    total_turns = sum(r['turns'] for r in results)
-    average_turns = total_turns / len(results)
-    print(f"Average game length: {average_turns:.2f} turns")
-
-    total_reshuffles = sum(r.get('reshuffles', 0) for r in results)
-    average_reshuffles = total_reshuffles / len(results)
-    print(f"Average reshuffles per game: {average_reshuffles:.2f}")
-
-    total_cards = sum(r.get('cards_played', 0) for r in results)
-    avg_cards_per_turn = total_cards / total_turns if total_turns > 0 else 0
-    print(f"Average cards played per turn: {avg_cards_per_turn:.2f}")
-
-    total_duration = sum(r.get('duration', 0) for r in results)
-    avg_time_per_turn_ms = (total_duration / total_turns * 1000) if total_turns > 0 else 0
-    print(f"Average execution time per turn: {avg_time_per_turn_ms:.4f} ms")
-
-    winner_counts = {}
-    for r in results:
-        winner = r['winner']
-        winner_counts[winner] = winner_counts.get(winner, 0) + 1
-    
-    print("\nWin Distribution:")
-    for winner, count in sorted(winner_counts.items()):
-        win_percentage = (count / len(results)) * 100
-        print(f"  {winner}: {count} wins ({win_percentage:.1f}%)")
+            results.append(_compact_result(seed, result))
+    return results
+
+def _compact_result(seed, result):
+    """The (seed, winner_seat, turns, reshuffles, cards_played, duration) tuple of a run_simulation result.
+
+    Stalemates append the turns they had left before the max_turns cap.
+    """
+    winner = result['winner']
+    winner_seat = int(winner.split()[-1]) - 1 if winner != "None" else -1
+    compact = (seed, winner_seat, result['turns'], result['reshuffles'],
+               result['cards_played'], result['duration'])
+    if result.get('reason') == "Stalemate":
+        compact += (result['turns_to_cap'],)
+    return compact
+
+def _seed_ranges(seed, num_simulations, num_players, chunk_size, rules=DEFAULT_RULES):
+    """Splits seeds seed, seed+1, ... into (start_seed, count, num_players, rules) tasks; endless if num_simulations is None."""
+    offset = 0
+    while num_simulations is None or offset < num_simulations:
+        count = chunk_size if num_simulations is None else min(chunk_size, num_simulations - offset)
+        yield (seed + offset, count, num_players, rules)
+        offset += count
+
+def _aggregate_games(play, task):
+    """Plays a task with play() and folds its results into a SimulationStats."""
+    return SimulationStats().extend(play(task))
+
+def _aggregate_indexed(aggregate, indexed_task):
+    index, task = indexed_task
+    return index, aggregate(task)
+
+def _merge_by_index(aggregate, indexed_tasks, workers, count):
+    """Plays (index, task) pairs and merges their aggregates into count SimulationStats, one per index."""
+    results = [SimulationStats() for _ in range(count)]
+    play = functools.partial(_aggregate_indexed, aggregate)
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            for index, chunk_stats in pool.imap_unordered(play, indexed_tasks):
+                results[index].merge(chunk_stats)
+    else:
+        for indexed_task in indexed_tasks:
+            index, chunk_stats = play(indexed_task)
+            results[index].merge(chunk_stats)
+    return results
+
+def _cache_config(num_players, rules):
+    """The configuration a ResultCache stores object-engine results under."""
+    rules = rules._replace(base_players=float(rules.base_players), attack_scaling=float(rules.attack_scaling))
+    values = rules.to_dict()
+    # Without stalemate detection the config is the one stored before those rules existed
+    for name in ("stalemate_window", "stalemate_repeats"):
+        if not values[name]:
+            del values[name]
+    return {"engine": "object", "engine_version": ENGINE_VERSION,
+            "num_players": num_players, "rules": values}
+
+def _play_uncached(cache, config, seed, num_simulations, num_players, rules, workers):
+    """Merges the cached aggregate for a seed range with freshly played gaps, and stores the gaps."""
+    stats, gaps = cache.plan(config, seed, num_simulations)
+    missing = sum(count for _, count in gaps)
+    chunk_size = max(1, min(1000, missing // (workers * 4)))
+    tasks = [(index, task)
+             for index, (start, count) in enumerate(gaps)
+             for task in _seed_ranges(start, count, num_players, chunk_size, rules)]
+    aggregate = functools.partial(_aggregate_games, _play_games)
+    for (start, count), gap_stats in zip(gaps, _merge_by_index(aggregate, tasks, workers, len(gaps))):
+        cache.store(config, start, count, gap_stats)
+        stats.merge(gap_stats)
+    return stats, missing
+
+def _profile_games(task):
+    """Plays a range of seeded games under a GameProfiler and returns the profiler."""
+    start_seed, count, num_players = task[:3]
+    rules = task[3] if len(task) > 3 else DEFAULT_RULES
+    profiler = GameProfiler()
+    for seed in range(start_seed, start_seed + count):
+        game = Game(num_players=num_players, silent_deck=True, seed=seed, rules=rules)
+        profiler.attach(game).run_simulation()
+    return profiler
+
+def run_profiled_simulations(num_simulations=100, num_players=4, workers=1, seed=None):
+    """Plays games seeded seed, seed+1, ... with per-phase and per-card timing and prints the profile."""
+    if seed is None:
+        seed = random.randrange(2**32)
+    print(f"--- Profiling {num_simulations} Simulations (seed {seed}) ---")
+
+    profiler = GameProfiler()
+    chunk_size = max(1, min(1000, num_simulations // (workers * 4)))
+    tasks = _seed_ranges(seed, num_simulations, num_players, chunk_size)
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            for chunk_profiler in pool.imap_unordered(_profile_games, tasks):
+                profiler.merge(chunk_profiler)
+    else:
+        for task in tasks:
+            profiler.merge(_profile_games(task))
+
+    profiler.report()
+    return profiler
+
+# Games per chunk when stopping adaptively. It is fixed, rather than derived from
+# the worker count, so a --target-ci run stops at the same game whatever -w is.
+ADAPTIVE_CHUNK_SIZE = 250
+# --target-ci never stops before this many games; win-rate CIs of rarely winning
+# seats are meaningless on tiny samples.
+MIN_ADAPTIVE_GAMES = 1000
+
+def _merge_until(aggregate, tasks, workers, should_stop, stats=None):
+    """Merges chunk aggregates in task order into stats until should_stop(stats, task) or tasks run out.
+
+    should_stop is called after each merge with the task just merged. With
+    workers > 1 a few chunks per worker are kept in flight; results are still
+    merged (and should_stop checked) in seed order, and chunks in flight when the
+    run stops are dropped, so the stopping point does not depend on worker timing.
+    """
+    stats = stats if stats is not None else SimulationStats()
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            pending = collections.deque()
+            for task in tasks:
+                pending.append((task, pool.apply_async(aggregate, (task,))))
+                if len(pending) < workers * 2:
+                    continue
+                done, result = pending.popleft()
+                stats.merge(result.get())
+                if should_stop(stats, done):
+                    return stats
+            while pending:
+                done, result = pending.popleft()
+                stats.merge(result.get())
+                if should_stop(stats, done):
+                    return stats
+    else:
+        for task in tasks:
+            stats.merge(aggregate(task))
+            if should_stop(stats, task):
+                break
+    return stats
+
+def run_multiple_simulations(num_simulations=None, num_players=4, workers=1, seed=None,
+                             engine="object", batch_size=16384, target_ci=None, time_budget=None,
+                             rules=DEFAULT_RULES, cache=None, checkpoint=None, checkpoint_every=60.0,
+                             resume_from=None, progress_every=None, heartbeat=None):
+    """Runs games seeded seed, seed+1, ... and prints the merged results.
+
+    With workers > 1 the seed range is split into chunks that are played in a
+    process pool. Each chunk comes back as a SimulationStats aggregate and the
+    aggregates merge exactly, so the report matches a serial run over the same
+    seeds while memory stays constant in the number of games.
+
+    engine="vectorized" plays the games in lockstep batches of batch_size with the
+    NumPy engine in vectorized.py. Each batch is seeded by its first game's seed,
+    so results depend on the batch size but not on the number of workers.
+
+    target_ci and time_budget (seconds) make the run adaptive: games are played
+    chunk by chunk until every seat's win-rate CI half-width is within target_ci
+    and the mean game length is within target_ci of itself, or until the time
+    budget is spent, whichever comes first. num_simulations then caps the number
+    of games (no cap if None); otherwise it defaults to 100.
+
+    cache, a ResultCache, supplies the aggregates of games it already holds for
+    these rules and seeds; only the missing seed ranges are played and stored.
+    Caching needs the object engine and a fixed number of games.
+
+    checkpoint is a path that gets an atomic checkpoint of the progress every
+    checkpoint_every seconds, on Ctrl-C and at the end; resume_simulations()
+    continues an interrupted run from it. resume_from=(next_seed, stats) starts
+    the run with the games before next_seed already merged into stats. A time
+    budget starts afresh on resume.
+
+    progress_every (seconds) prints a status line with the games played, the
+    throughput, the ETA and the win distribution to stderr that often while the
+    run goes on; heartbeat is a path that gets the same numbers as JSON (every
+    progress_every seconds, 10 by default). Progress comes from the merged
+    chunks, so cached runs only report when they finish.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    adaptive = target_ci is not None or time_budget is not None
+    if cache is not None and (adaptive or engine != "object"):
+        raise ValueError("The result cache needs the object engine and a fixed number of games")
+    if cache is not None and (checkpoint is not None or resume_from is not None):
+        raise ValueError("Cached runs store their progress in the cache and do not checkpoint")
+    if engine == "vectorized" and (rules.stalemate_window or rules.stalemate_repeats):
+        raise ValueError("Stalemate detection needs the object engine")
+    if num_simulations is None and not adaptive:
+        num_simulations = 100
+    if adaptive:
+        limits = [f"target CI ±{target_ci}"] if target_ci is not None else []
+        if time_budget is not None:
+            limits.append(f"time budget {time_budget:g}s")
+        if num_simulations is not None:
+            limits.append(f"at most {num_simulations} games")
+        print(f"--- Running Simulations until {', '.join(limits)} (seed {seed}) ---")
+    else:
+        print(f"--- Running {num_simulations} Simulations (seed {seed}) ---")
+
+    if engine == "vectorized":
+        from vectorized import play_games_vectorized
+        play, chunk_size = play_games_vectorized, batch_size
+    elif adaptive:
+        play, chunk_size = _play_games, ADAPTIVE_CHUNK_SIZE
+    else:
+        play, chunk_size = _play_games, max(1, min(1000, num_simulations // (workers * 4)))
+
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    stop_reason = "game limit reached"
+
+    next_seed, stats = resume_from if resume_from is not None else (seed, SimulationStats())
+    if resume_from is not None:
+        print(f"Resuming at seed {next_seed} with {stats.games} games already played.")
+    checkpointer = None
+    if checkpoint is not None:
+        run = {"num_simulations": num_simulations, "num_players": num_players, "seed": seed,
+               "engine": engine, "batch_size": batch_size, "target_ci": target_ci,
+               "time_budget": time_budget, "rules": rules.to_dict()}
+        checkpointer = Checkpointer(checkpoint, run, checkpoint_every, ENGINE_VERSION)
+        checkpointer.update(next_seed, stats)
+
+    def should_stop(stats):
+        nonlocal stop_reason
+        if target_ci is not None and stats.games >= MIN_ADAPTIVE_GAMES \
+                and stats.within_tolerance(num_players, target_ci):
+            stop_reason = "target CI reached"
+            return True
+        if deadline is not None and time.monotonic() >= deadline:
+            stop_reason = "time budget spent"
+            return True
+        return False
+
+    progress = None
+    if progress_every is not None or heartbeat is not None:
+        progress = ProgressReporter(total=num_simulations, interval=progress_every or 10.0,
+                                    heartbeat_path=heartbeat, deadline=deadline, seed=seed)
+        progress.update(stats)
+        progress.start()
+    try:
+        if cache is not None:
+            stats, played = _play_uncached(cache, _cache_config(num_players, rules), seed, num_simulations,
+                                           num_players, rules, workers)
+            print(f"Result cache: {num_simulations - played} games reused, {played} played.")
+        else:
+            remaining = num_simulations - (next_seed - seed) if num_simulations is not None else None
+            tasks = _seed_ranges(next_seed, remaining, num_players, chunk_size, rules)
+            aggregate = functools.partial(_aggregate_games, play)
+
+            def after_merge(stats, task):
+                if checkpointer is not None:
+                    checkpointer.update(task[0] + task[1], stats)
+                if progress is not None:
+                    progress.update(stats)
+                return adaptive and should_stop(stats)
+
+            # A resumed adaptive run may have met its target just before the checkpoint
+            already_stopped = adaptive and resume_from is not None and should_stop(stats)
+            try:
+                if not already_stopped:
+                    stats = _merge_until(aggregate, tasks, workers, after_merge, stats)
+            except KeyboardInterrupt:
+                if checkpointer is not None:
+                    checkpointer.save()
+                    print(f"\nInterrupted; continue with --resume {checkpoint}")
+                raise
+            if checkpointer is not None:
+                checkpointer.save(complete=True)
+    except BaseException:
+        if progress is not None:
+            progress.stop(complete=False)
+        raise
+    if progress is not None:
+        progress.update(stats)
+        progress.stop()
+
+    if adaptive:
+        print(f"Stopped after {stats.games} games: {stop_reason}.")
+    stats.report()
+    return stats
+
+def resume_simulations(checkpoint, workers=1, checkpoint_every=60.0, progress_every=None, heartbeat=None):
+    """Continues the run saved in a checkpoint file and keeps checkpointing to it."""
+    run, next_seed, stats, complete = load_checkpoint(checkpoint, ENGINE_VERSION)
+    run["rules"] = Rules.from_dict(run["rules"])
+    if complete:
+        # Resuming would play a fresh time budget or CI target on top of the finished run
+        print(f"The run in {checkpoint} had already finished with {stats.games} games.")
+        stats.report()
+        return stats
+    return run_multiple_simulations(workers=workers, checkpoint=checkpoint, checkpoint_every=checkpoint_every,
+                                    resume_from=(next_seed, stats), progress_every=progress_every,
+                                    heartbeat=heartbeat, **run)
+
+def _parse_duration(text):
+    """Parses a duration such as 90, 90s, 5m or 1.5h into seconds."""
+    units = {"s": 1, "m": 60, "h": 3600}
+    text = text.strip().lower()
+    scale = units.get(text[-1:], None)
+    try:
+        seconds = float(text[:-1] if scale else text) * (scale or 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid duration: {text!r} (use e.g. 90, 90s, 5m or 1h)")
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError("the time budget must be positive")
+    return seconds
 
 def main():
     parser = argparse.ArgumentParser(description="Run a simulation of the Chicken Die! game.")
     parser.add_argument(
         "-n", "--num-simulations",
         type=int,
-        default=100,
-        help="The number of simulations to run in silent mode."
+        default=None,
+        help="The number of simulations to run in silent mode (default 100). "
+             "With --target-ci or --time-budget, the most games to run (default no limit)."
     )
     parser.add_argument(
         "-v", "--verbose",
@@ -764,16 +1570,151 @@ def main():
         default=4,
         help="The number of players in the game."
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes to spread simulations across."
+    )
+    parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed of the first game; game i uses seed + i. Random if omitted."
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["object", "vectorized"],
+        default="object",
+        help="Engine for batch runs: one Game at a time, or NumPy lockstep batches (needs numpy)."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=16384,
+        help="Number of games the vectorized engine advances in lockstep."
+    )
+    parser.add_argument(
+        "--replay",
+        type=int,
+        metavar="SEED",
+        default=None,
+        help="Re-run the single game with this seed (and the same -p) in verbose mode. Overrides -n and -v."
+    )
+    parser.add_argument(
+        "--target-ci",
+        type=float,
+        default=None,
+        metavar="TOL",
+        help="Keep running games until every seat's 95%% win-rate CI is within ±TOL "
+             "and the mean game length is within ±TOL of itself (e.g. 0.005)."
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=_parse_duration,
+        default=None,
+        metavar="DURATION",
+        help="Run as many games as fit in this wall-clock budget (e.g. 60s, 5m), then report."
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        default=None,
+        help="SQLite result cache; games already stored for these rules and seeds are not replayed."
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        default=None,
+        help="Save the progress of the run to this file periodically, so it can be resumed."
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=_parse_duration,
+        default=60.0,
+        metavar="DURATION",
+        help="How often to write the checkpoint (default 60s)."
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="PATH",
+        default=None,
+        help="Continue the run saved in this checkpoint (its -n, -p, -s and rules are reused)."
+    )
+    parser.add_argument(
+        "--stalemate-window",
+        type=int,
+        default=0,
+        metavar="TURNS",
+        help="End games as stalemates after this many turns without a player eliminated "
+             "or the chickens in play falling to a new low (default: never)."
+    )
+    parser.add_argument(
+        "--stalemate-repeats",
+        type=int,
+        default=0,
+        metavar="N",
+        help="End games as stalemates once the same game state recurs N times without progress (default: never)."
+    )
+    parser.add_argument(
+        "--progress-every",
+        type=_parse_duration,
+        default=None,
+        metavar="DURATION",
+        help="Print a status line with progress, games/s, turns/s, ETA and wins to stderr this often (e.g. 10s)."
+    )
+    parser.add_argument(
+        "--heartbeat",
+        metavar="PATH",
+        default=None,
+        help="Keep the run's progress, throughput and ETA in this JSON file (updated every --progress-every, default 10s)."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each turn phase and card handler over the -n games and print where the time goes."
+    )
     args = parser.parse_args()
+    # Replays and verbose games play by the same rules as the batch they come from
+    rules = Rules(stalemate_window=args.stalemate_window, stalemate_repeats=args.stalemate_repeats)
 
-    if args.verbose:
+    if args.replay is not None:
+        print(f"--- Replaying game with seed {args.replay} ---")
+        game = Game(num_players=args.num_players, seed=args.replay, events=TextRenderer(), rules=rules)
+        result = game.run_simulation()
+        if result:
+            print(f"Total deck reshuffles: {result.get('reshuffles', 0)}")
+    elif args.verbose:
         print("--- Running a single verbose simulation ---")
-        game = Game(num_players=args.num_players)
-        result = game.run_simulation(silent=False)
+        game = Game(num_players=args.num_players, seed=args.seed, events=TextRenderer(), rules=rules)
+        result = game.run_simulation()
         if result:
             print(f"Total deck reshuffles: {result.get('reshuffles', 0)}")
+    elif args.profile:
+        run_profiled_simulations(num_simulations=args.num_simulations or 100, num_players=args.num_players,
+                                 workers=args.workers, seed=args.seed)
+    elif args.resume:
+        resume_simulations(args.resume, workers=args.workers, checkpoint_every=args.checkpoint_every,
+                           progress_every=args.progress_every, heartbeat=args.heartbeat)
     else:
-        run_multiple_simulations(num_simulations=args.num_simulations, num_players=args.num_players)
+        if args.cache and args.checkpoint:
+            parser.error("--cache and --checkpoint cannot be combined")
+        if args.cache and (args.engine != "object" or args.target_ci is not None or args.time_budget is not None):
+            parser.error("--cache needs the object engine and a fixed -n")
+        if args.engine != "object" and (args.stalemate_window or args.stalemate_repeats):
+            parser.error("stalemate detection needs the object engine")
+        cache = ResultCache(args.cache) if args.cache else None
+        try:
+            run_multiple_simulations(num_simulations=args.num_simulations, num_players=args.num_players,
+                                     workers=args.workers, seed=args.seed, rules=rules,
+                                     engine=args.engine, batch_size=args.batch_size,
+                                     target_ci=args.target_ci, time_budget=args.time_budget,
+                                     cache=cache, checkpoint=args.checkpoint,
+                                     checkpoint_every=args.checkpoint_every,
+                                     progress_every=args.progress_every, heartbeat=args.heartbeat)
+        finally:
+            if cache is not None:
+                cache.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,69 @@
+"""Stalemate detection: ending games that have stopped heading for an end.
+
+A game ends when all but one player are eliminated, so a game makes progress
+when a player is eliminated or when the number of chickens in play falls below
+its lowest point so far; chickens that die and are bred back again do not
+count. StalemateDetector watches that signal at the end of every turn and
+declares a stalemate when
+
+  - no progress was made for Rules.stalemate_window turns, or
+  - since the last progress, the compact state of the game (flocks, eggs,
+    supplies, hand and deck summaries, whose turn it is) recurred
+    Rules.stalemate_repeats times.
+
+The dice make an endless cycle impossible to prove: a recurring state comes
+with a different RNG state. A game that keeps returning to the same position
+without progress is treated as cycling instead. Game then ends the game as a
+stalemate instead of playing on to the Rules.max_turns safety break. Both
+checks are off by default, and games that never enable them pay one attribute
+check per turn.
+"""
+
+
+class StalemateDetector:
+    """Tracks the progress of one game; stalled() is called at the end of every turn."""
+
+    def __init__(self, game, window=0, repeats=0):
+        self.window = window
+        self.repeats = repeats
+        self.lowest = game.roster.total
+        self.live = len(game.roster.live)
+        self.last_progress = game.turn
+        self.seen = {} # State hash -> times seen since the last progress
+        self.cycling = False # Whether the stalemate was a recurring state
+
+    def stalled(self, game):
+        roster = game.roster
+        if roster.total < self.lowest or len(roster.live) < self.live:
+            self.lowest = min(self.lowest, roster.total)
+            self.live = len(roster.live)
+            self.last_progress = game.turn
+            self.seen.clear()
+            return False
+        if self.window and game.turn - self.last_progress >= self.window:
+            return True
+        if self.repeats:
+            key = state_hash(game)
+            seen = self.seen.get(key, 0) + 1
+            self.seen[key] = seen
+            if seen >= self.repeats:
+                self.cycling = True
+                return True
+        return False
+
+    def quiet_turns(self, game):
+        """Turns since the last progress."""
+        return game.turn - self.last_progress
+
+
+def state_hash(game):
+    """Hash of the compact state of a game: what a cycle would repeat, apart from the RNG."""
+    deck = game.deck
+    values = [game.current_player_index, game.reverse_direction, game.chick_supply, game.hen_supply,
+              game.egg_supply, len(deck.cards), len(deck.discard_pile)]
+    for player in game.players:
+        values += player.counts
+        values += player.hand.type_counts
+        values.append(player.egg_cards)
+        values.append(player.infertile_hens)
+    return hash(tuple(values))
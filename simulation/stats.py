@@ -0,0 +1,427 @@
+"""Streaming, mergeable statistics over finished games.
+
+SimulationStats folds in one compact game result at a time and keeps only running
+totals and histograms, so memory does not grow with the number of games. All
+counters are integers (durations are kept in nanoseconds), which makes merging
+the aggregates of parallel workers exact and independent of merge order.
+"""
+import math
+
+Z_95 = 1.959963984540054 # Two-sided 95% normal quantile
+
+
+class SimulationStats:
+    """Running aggregates over (seed, winner_seat, turns, reshuffles, cards_played, duration) results.
+
+    Results of games ended as stalemates carry a seventh value, the turns they had
+    left before the max_turns cap.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.turns = 0
+        self.turns_squared = 0
+        self.reshuffles = 0
+        self.reshuffles_squared = 0
+        self.cards_played = 0
+        self.duration_ns = 0
+        self.turn_histogram = {}
+        self.reshuffle_histogram = {}
+        self.winner_counts = {} # winner seat -> games won, -1 when nobody won
+        self.longest = None # (turns, seed) of the longest game
+        self.slowest = None # (duration_ns, seed) of the slowest game
+        self.stalemates = 0 # Games ended early by stalemate detection
+        # Turns they had left before the max_turns safety break: an upper bound on the
+        # turns detection saved, since a stalled game may still have ended by itself
+        self.turns_to_cap = 0
+
+    def add(self, result):
+        seed, winner_seat, turns, reshuffles, cards_played, duration = result[:6]
+        if len(result) > 6:
+            self.stalemates += 1
+            self.turns_to_cap += result[6]
+        duration_ns = round(duration * 1e9)
+        self.games += 1
+        self.turns += turns
+        self.turns_squared += turns * turns
+        self.reshuffles += reshuffles
+        self.reshuffles_squared += reshuffles * reshuffles
+        self.cards_played += cards_played
+        self.duration_ns += duration_ns
+        self.turn_histogram[turns] = self.turn_histogram.get(turns, 0) + 1
+        self.reshuffle_histogram[reshuffles] = self.reshuffle_histogram.get(reshuffles, 0) + 1
+        self.winner_counts[winner_seat] = self.winner_counts.get(winner_seat, 0) + 1
+        if seed is not None:
+            if self.longest is None or (turns, -seed) > (self.longest[0], -self.longest[1]):
+                self.longest = (turns, seed)
+            if self.slowest is None or (duration_ns, -seed) > (self.slowest[0], -self.slowest[1]):
+                self.slowest = (duration_ns, seed)
+
+    def extend(self, results):
+        for result in results:
+            self.add(result)
+        return self
+
+    def merge(self, other):
+        """Folds another aggregate into this one; the result does not depend on merge order."""
+        self.games += other.games
+        self.turns += other.turns
+        self.turns_squared += other.turns_squared
+        self.reshuffles += other.reshuffles
+        self.reshuffles_squared += other.reshuffles_squared
+        self.cards_played += other.cards_played
+        self.duration_ns += other.duration_ns
+        self.stalemates += other.stalemates
+        self.turns_to_cap += other.turns_to_cap
+        for mine, theirs in ((self.turn_histogram, other.turn_histogram),
+                             (self.reshuffle_histogram, other.reshuffle_histogram),
+                             (self.winner_counts, other.winner_counts)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        # Ties go to the lower seed, as if the games had been added in seed order
+        if other.longest is not None:
+            if self.longest is None or (other.longest[0], -other.longest[1]) > (self.longest[0], -self.longest[1]):
+                self.longest = other.longest
+        if other.slowest is not None:
+            if self.slowest is None or (other.slowest[0], -other.slowest[1]) > (self.slowest[0], -self.slowest[1]):
+                self.slowest = other.slowest
+        return self
+
+    def to_dict(self):
+        """A JSON-ready copy of the aggregate (histogram keys become strings)."""
+        values = dict(vars(self))
+        for name in ("turn_histogram", "reshuffle_histogram", "winner_counts"):
+            values[name] = {str(key): count for key, count in values[name].items()}
+        for name in ("longest", "slowest"):
+            values[name] = list(values[name]) if values[name] is not None else None
+        return values
+
+    @classmethod
+    def from_dict(cls, values):
+        """Rebuilds an aggregate written by to_dict."""
+        stats = cls()
+        for name, value in values.items():
+            if name in ("turn_histogram", "reshuffle_histogram", "winner_counts"):
+                value = {int(key): count for key, count in value.items()}
+            elif name in ("longest", "slowest") and value is not None:
+                value = tuple(value)
+            setattr(stats, name, value)
+        return stats
+
+    def __eq__(self, other):
+        return isinstance(other, SimulationStats) and vars(self) == vars(other)
+
+    # --- Estimates ---
+
+    def mean_turns(self):
+        return self.turns / self.games if self.games else 0.0
+
+    def variance_turns(self):
+        """Sample variance of the game length."""
+        if self.games < 2:
+            return 0.0
+        return (self.turns_squared - self.turns * self.turns / self.games) / (self.games - 1)
+
+    def turns_ci(self, z=Z_95):
+        """Half-width of the confidence interval for the mean game length."""
+        if self.games < 2:
+            return math.inf
+        return z * math.sqrt(self.variance_turns() / self.games)
+
+    def turn_quantile(self, q):
+        """The q-quantile of the game length, read off the turn histogram."""
+        if not self.games:
+            return 0
+        rank = max(1, math.ceil(q * self.games))
+        seen = 0
+        for turns in sorted(self.turn_histogram):
+            seen += self.turn_histogram[turns]
+            if seen >= rank:
+                return turns
+        return turns
+
+    def win_rate(self, seat):
+        return self.winner_counts.get(seat, 0) / self.games if self.games else 0.0
+
+    def win_rate_ci(self, seat, z=Z_95):
+        """Half-width of the normal-approximation confidence interval for a seat's win rate."""
+        if not self.games:
+            return math.inf
+        p = self.win_rate(seat)
+        return z * math.sqrt(p * (1 - p) / self.games)
+
+    def within_tolerance(self, seats, target, z=Z_95):
+        """True when every seat's win-rate CI half-width is at most target, and the
+        mean game length is known to within target relative to the mean."""
+        if self.games < 2:
+            return False
+        if any(self.win_rate_ci(seat, z) > target for seat in range(seats)):
+            return False
+        return self.turns_ci(z) <= target * self.mean_turns()
+
+    # --- Report ---
+
+    def report(self):
+        """Prints the "Simulation Results" report."""
+        print("\n--- Simulation Results ---")
+        if not self.games:
+            print("No games finished.")
+            return
+
+        print(f"Average game length: {self.mean_turns():.2f} turns (95% CI ±{self.turns_ci():.2f})")
+        print(f"Game length percentiles: p50 {self.turn_quantile(0.5)}, "
+              f"p95 {self.turn_quantile(0.95)}, p99 {self.turn_quantile(0.99)}")
+
+        average_reshuffles = self.reshuffles / self.games
+        print(f"Average reshuffles per game: {average_reshuffles:.2f}")
+
+        avg_cards_per_turn = self.cards_played / self.turns if self.turns > 0 else 0
+        print(f"Average cards played per turn: {avg_cards_per_turn:.2f}")
+
+        avg_time_per_turn_ms = (self.duration_ns / 1e6 / self.turns) if self.turns > 0 else 0
+        print(f"Average execution time per turn: {avg_time_per_turn_ms:.4f} ms")
+
+        # Seeds of the outliers, so they can be re-run in isolation with --replay
+        if self.longest is not None:
+            print(f"Longest game: {self.longest[0]} turns (replay with --replay {self.longest[1]})")
+            print(f"Slowest game: {self.slowest[0] / 1e6:.2f} ms (replay with --replay {self.slowest[1]})")
+        if self.stalemates:
+            print(f"Stalemates: {self.stalemates} games ({self.stalemates / self.games * 100:.1f}%) ended early, "
+                  f"with {self.turns_to_cap} turns left before the max_turns cap")
+
+        print("\nWin Distribution:")
+        names = {seat: f"Player {seat + 1}" if seat >= 0 else "None" for seat in self.winner_counts}
+        for seat in sorted(self.winner_counts, key=names.get):
+            count = self.winner_counts[seat]
+            print(f"  {names[seat]}: {count} wins ({self.win_rate(seat) * 100:.1f}% ±{self.win_rate_ci(seat) * 100:.1f}%)")
+
+
+class PairedStats:
+    """Running sums over pairs of games, variant A and variant B, played on the same seed.
+
+    Alongside each variant's own totals it keeps the sums of squared per-seed
+    differences, which give paired confidence intervals for B - A. With common
+    random numbers the two games of a pair are positively correlated, so these
+    intervals are narrower than those of two independent runs.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.turns = [0, 0] # A, B
+        self.turns_squared = [0, 0]
+        self.turn_difference_squared = 0
+        self.wins = [{}, {}] # Seat -> games won, -1 when nobody won
+        self.win_disagreements = {} # Seat -> pairs where exactly one variant was won by that seat
+
+    def add(self, result_a, result_b):
+        self.games += 1
+        for variant, result in enumerate((result_a, result_b)):
+            turns = result[2]
+            self.turns[variant] += turns
+            self.turns_squared[variant] += turns * turns
+            self.wins[variant][result[1]] = self.wins[variant].get(result[1], 0) + 1
+        difference = result_b[2] - result_a[2]
+        self.turn_difference_squared += difference * difference
+        if result_a[1] != result_b[1]:
+            for seat in (result_a[1], result_b[1]):
+                self.win_disagreements[seat] = self.win_disagreements.get(seat, 0) + 1
+
+    def merge(self, other):
+        self.games += other.games
+        for variant in range(2):
+            self.turns[variant] += other.turns[variant]
+            self.turns_squared[variant] += other.turns_squared[variant]
+            for seat, count in other.wins[variant].items():
+                self.wins[variant][seat] = self.wins[variant].get(seat, 0) + count
+        self.turn_difference_squared += other.turn_difference_squared
+        for seat, count in other.win_disagreements.items():
+            self.win_disagreements[seat] = self.win_disagreements.get(seat, 0) + count
+        return self
+
+    def __eq__(self, other):
+        return isinstance(other, PairedStats) and vars(self) == vars(other)
+
+    @staticmethod
+    def _paired(n, sum_a, sum_b, sum_difference_squared, sum_a_squared, sum_b_squared, z):
+        """(mean B - A, paired CI half-width, variance ratio independent / paired)."""
+        mean = (sum_b - sum_a) / n
+        if n < 2:
+            return mean, math.inf, 1.0
+        paired = (sum_difference_squared - n * mean * mean) / (n - 1)
+        independent = ((sum_a_squared - sum_a * sum_a / n) + (sum_b_squared - sum_b * sum_b / n)) / (n - 1)
+        ratio = independent / paired if paired > 0 else math.inf
+        return mean, z * math.sqrt(max(paired, 0.0) / n), ratio
+
+    def turns_difference(self, z=Z_95):
+        """(mean of B - A game length, paired CI half-width, games-saved factor over independent runs)."""
+        return self._paired(self.games, self.turns[0], self.turns[1], self.turn_difference_squared,
+                            self.turns_squared[0], self.turns_squared[1], z)
+
+    def win_rate_difference(self, seat, z=Z_95):
+        """(B - A win rate of seat, paired CI half-width, games-saved factor over independent runs)."""
+        wins_a, wins_b = self.wins[0].get(seat, 0), self.wins[1].get(seat, 0)
+        # Win indicators are 0/1, so they equal their squares
+        return self._paired(self.games, wins_a, wins_b, self.win_disagreements.get(seat, 0), wins_a, wins_b, z)
+
+    def report(self):
+        """Prints the paired differences B - A."""
+        print(f"\n--- A/B Results ({self.games} paired games) ---")
+        if not self.games:
+            print("No games finished.")
+            return
+        mean_a, mean_b = self.turns[0] / self.games, self.turns[1] / self.games
+        difference, ci, ratio = self.turns_difference()
+        print(f"Average game length: A {mean_a:.2f}, B {mean_b:.2f} turns; "
+              f"B - A {difference:+.2f} (95% paired CI ±{ci:.2f}, {ratio:.1f}x fewer games than independent runs)")
+
+        print("\nWin rates (A -> B):")
+        seats = set(self.wins[0]) | set(self.wins[1])
+        names = {seat: f"Player {seat + 1}" if seat >= 0 else "None" for seat in seats}
+        for seat in sorted(seats, key=names.get):
+            rate_a = self.wins[0].get(seat, 0) / self.games
+            rate_b = self.wins[1].get(seat, 0) / self.games
+            difference, ci, ratio = self.win_rate_difference(seat)
+            print(f"  {names[seat]}: {rate_a * 100:.1f}% -> {rate_b * 100:.1f}% "
+                  f"({difference * 100:+.1f}% ±{ci * 100:.1f}%, {ratio:.1f}x)")
+
+
+class TournamentStats:
+    """Running totals of a strategy tournament, keyed by strategy name.
+
+    Every seat a strategy plays counts as one entry; its win rate is wins over
+    seats, and expected_wins is what it would have won as an average player (1/N
+    of its seats in N-player games). For ratings, the winner of a game beats each
+    other seat played by a different strategy; ratings() fits a Bradley-Terry
+    model to those pairwise results and returns it on the Elo scale. All counts
+    are integers, so merging is exact and the ratings do not depend on merge order.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.no_winner = 0
+        self.seats = {} # Strategy -> {player count -> seats played}
+        self.wins = {} # Strategy -> games won
+        self.beats = {} # Winner -> {loser -> pairwise wins}
+
+    def add(self, lineup, winner_seat):
+        """Folds in one game: the strategy name of every seat, and the winning seat (-1 for none)."""
+        self.games += 1
+        num_players = len(lineup)
+        for name in lineup:
+            by_count = self.seats.setdefault(name, {})
+            by_count[num_players] = by_count.get(num_players, 0) + 1
+            self.wins.setdefault(name, 0)
+        if winner_seat < 0:
+            self.no_winner += 1
+            return
+        winner = lineup[winner_seat]
+        self.wins[winner] += 1
+        beaten = self.beats.setdefault(winner, {})
+        for name in lineup:
+            if name != winner:
+                beaten[name] = beaten.get(name, 0) + 1
+
+    def merge(self, other):
+        self.games += other.games
+        self.no_winner += other.no_winner
+        for name, by_count in other.seats.items():
+            mine = self.seats.setdefault(name, {})
+            for num_players, seats in by_count.items():
+                mine[num_players] = mine.get(num_players, 0) + seats
+        for name, wins in other.wins.items():
+            self.wins[name] = self.wins.get(name, 0) + wins
+        for winner, beaten in other.beats.items():
+            mine = self.beats.setdefault(winner, {})
+            for loser, count in beaten.items():
+                mine[loser] = mine.get(loser, 0) + count
+        return self
+
+    def to_dict(self):
+        """A JSON-ready copy (player counts become strings)."""
+        values = dict(vars(self))
+        values["seats"] = {name: {str(n): seats for n, seats in by_count.items()}
+                           for name, by_count in self.seats.items()}
+        return values
+
+    def __eq__(self, other):
+        return isinstance(other, TournamentStats) and vars(self) == vars(other)
+
+    # --- Estimates ---
+
+    def seats_played(self, name):
+        return sum(self.seats.get(name, {}).values())
+
+    def win_rate(self, name):
+        seats = self.seats_played(name)
+        return self.wins.get(name, 0) / seats if seats else 0.0
+
+    def win_rate_ci(self, name, z=Z_95):
+        """Half-width of the normal-approximation confidence interval, treating seats as independent."""
+        seats = self.seats_played(name)
+        if not seats:
+            return math.inf
+        p = self.win_rate(name)
+        return z * math.sqrt(p * (1 - p) / seats)
+
+    def expected_wins(self, name):
+        return sum(seats / num_players for num_players, seats in self.seats.get(name, {}).items())
+
+    def ratings(self, iterations=1000, tolerance=1e-9):
+        """Bradley-Terry strengths fitted by minorization-maximization, as Elo ratings averaging 1500.
+
+        Every strategy also gets one virtual win and one virtual loss against an
+        opponent of average strength, so strategies that never (or always) win
+        keep a finite rating.
+        """
+        names = sorted(self.seats)
+        if not names:
+            return {}
+        wins = {name: 1 + sum(self.beats.get(name, {}).values()) for name in names}
+        meetings = {name: {} for name in names}
+        for winner, beaten in self.beats.items():
+            for loser, count in beaten.items():
+                meetings[winner][loser] = meetings[winner].get(loser, 0) + count
+                meetings[loser][winner] = meetings[loser].get(winner, 0) + count
+        strength = dict.fromkeys(names, 1.0)
+        for _ in range(iterations):
+            updated = {}
+            for name in names:
+                own = strength[name]
+                denominator = 2 / (own + 1) # The virtual games
+                for other, count in sorted(meetings[name].items()):
+                    denominator += count / (own + strength[other])
+                updated[name] = wins[name] / denominator
+            scale = math.exp(sum(math.log(value) for value in updated.values()) / len(names))
+            updated = {name: value / scale for name, value in updated.items()}
+            change = max(abs(updated[name] - strength[name]) for name in names)
+            strength = updated
+            if change < tolerance:
+                break
+        return {name: 1500 + 400 * math.log10(value) for name, value in strength.items()}
+
+    def standings(self):
+        """(name, rating, seats, wins, win rate, CI half-width, wins / expected wins) rows, best first."""
+        ratings = self.ratings()
+        rows = []
+        for name in self.seats:
+            expected = self.expected_wins(name)
+            rows.append((name, ratings[name], self.seats_played(name), self.wins[name], self.win_rate(name),
+                         self.win_rate_ci(name), self.wins[name] / expected if expected else 0.0))
+        rows.sort(key=lambda row: (-row[1], row[0]))
+        return rows
+
+    # --- Report ---
+
+    def report(self):
+        """Prints the standings table."""
+        print(f"\n--- Tournament Standings ({self.games} games) ---")
+        if not self.games:
+            print("No games finished.")
+            return
+        width = max(len(name) for name in self.seats)
+        print(f"  {'Strategy':<{width}}  {'Elo':>6}  {'Seats':>7}  {'Wins':>7}  {'Win rate':>15}  {'vs fair':>7}")
+        for name, rating, seats, wins, rate, ci, performance in self.standings():
+            print(f"  {name:<{width}}  {rating:6.0f}  {seats:7d}  {wins:7d}  "
+                  f"{rate * 100:6.1f}% ±{ci * 100:4.1f}%  {performance:7.2f}")
+        if self.no_winner:
+            print(f"  Games without a winner: {self.no_winner}")
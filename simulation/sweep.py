@@ -0,0 +1,191 @@
+"""Parameter sweeps over player counts and Rules.
+
+A sweep file (JSON, or TOML with a .toml extension) names the games to play per
+point and a grid of values; every combination of the grid is one point:
+
+    games = 2000
+    seed = 0
+
+    [grid]
+    num_players = [2, 4, 8]
+    attack_scaling = [1.0, 2.0]
+    chick_supply = 50
+
+    [grid.card_counts]
+    "Chicken Bomb" = [1, 3]
+
+Grid keys are num_players, any Rules field and card_counts (card name -> base
+counts); single values are allowed for axes that are not varied. Every point
+plays the same seeds, seed .. seed + games - 1, so points differ only in their
+rules. Run from the simulation directory:
+
+    python sweep.py grid.toml -o results.csv -w 4 --cache results.sqlite
+"""
+import argparse
+import csv
+import functools
+import itertools
+import json
+import sys
+import tomllib
+
+from cards import DECK_COMPOSITION
+from simulation import (
+    Rules, _deck_card_ids, _play_games, _seed_ranges, _aggregate_games,
+    _merge_by_index, _cache_config,
+)
+from stats import SimulationStats
+from cache import ResultCache
+
+# Columns written for every point, after the swept parameters
+METRICS = ("games", "deck_size", "mean_turns", "turns_ci", "p50_turns", "p95_turns",
+           "mean_reshuffles", "cards_per_turn", "no_winner_rate")
+
+
+def load_sweep(path):
+    """Reads a sweep file; TOML if the name ends in .toml, JSON otherwise."""
+    if str(path).endswith(".toml"):
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path) as f:
+        return json.load(f)
+
+
+def _values(value):
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def sweep_points(grid):
+    """Expands a grid into (num_players, Rules, parameters) points.
+
+    parameters holds only the grid's own keys, with swept cards as "card:<name>".
+    """
+    grid = dict(grid)
+    card_grid = grid.pop("card_counts", {})
+    order = {card["name"]: i for i, card in enumerate(DECK_COMPOSITION)}
+    card_names = sorted(card_grid, key=lambda name: order.get(name, len(order)))
+    rule_names = [name for name in Rules._fields if name in grid]
+    unknown = set(grid) - set(rule_names) - {"num_players"}
+    if unknown:
+        raise ValueError(f"Unknown grid key(s): {', '.join(sorted(unknown))}")
+
+    axes = [_values(grid.get("num_players", 4))]
+    axes += [_values(grid[name]) for name in rule_names]
+    axes += [_values(card_grid[name]) for name in card_names]
+    points = []
+    for combination in itertools.product(*axes):
+        num_players, rule_values = combination[0], combination[1:1 + len(rule_names)]
+        card_values = combination[1 + len(rule_names):]
+        rules = Rules.from_dict(dict(zip(rule_names, rule_values),
+                                     card_counts=dict(zip(card_names, card_values))))
+        parameters = {"num_players": num_players}
+        parameters.update(zip(rule_names, rule_values))
+        parameters.update((f"card:{name}", count) for name, count in zip(card_names, card_values))
+        points.append((num_players, rules, parameters))
+    return points
+
+
+def run_sweep(spec, workers=1, cache=None):
+    """Plays every point of a sweep spec; returns a list of (num_players, rules, parameters, stats).
+
+    The chunks of all points go to one process pool, so points run in parallel with
+    each other as well as within themselves. A point's Rules are built once and sent
+    with each chunk; each worker builds that point's deck once (Deck caches decks
+    per player count and Rules). With a ResultCache, only the seeds a point is
+    missing are played, and they are stored for the next run.
+    """
+    points = sweep_points(spec.get("grid", {}))
+    games = spec.get("games", 1000)
+    seed = spec.get("seed", 0)
+
+    # One (point, seed range) part per gap; without a cache each point is one gap
+    results, parts = [], []
+    for index, (num_players, rules, _) in enumerate(points):
+        if cache is not None:
+            config = _cache_config(num_players, rules)
+            cached, gaps = cache.plan(config, seed, games)
+        else:
+            config, cached, gaps = None, SimulationStats(), [(seed, games)]
+        results.append(cached)
+        parts.extend((index, config, start, count) for start, count in gaps)
+
+    missing = sum(count for _, _, _, count in parts)
+    chunk_size = max(1, min(1000, missing // (workers * 4)))
+    tasks = [(part, task)
+             for part, (index, _, start, count) in enumerate(parts)
+             for task in _seed_ranges(start, count, points[index][0], chunk_size, points[index][1])]
+    aggregate = functools.partial(_aggregate_games, _play_games)
+    part_results = _merge_by_index(aggregate, tasks, workers, len(parts))
+    for (index, config, start, count), part_stats in zip(parts, part_results):
+        if cache is not None:
+            cache.store(config, start, count, part_stats)
+        results[index].merge(part_stats)
+    return [point + (stats,) for point, stats in zip(points, results)]
+
+
+def point_row(num_players, rules, parameters, stats, max_players):
+    """One row of the results table: the point's parameters, then its metrics and seat win rates."""
+    row = dict(parameters)
+    row.update(
+        games=stats.games,
+        deck_size=len(_deck_card_ids(num_players, rules)),
+        mean_turns=round(stats.mean_turns(), 4),
+        turns_ci=round(stats.turns_ci(), 4),
+        p50_turns=stats.turn_quantile(0.5),
+        p95_turns=stats.turn_quantile(0.95),
+        mean_reshuffles=round(stats.reshuffles / stats.games, 4) if stats.games else 0,
+        cards_per_turn=round(stats.cards_played / stats.turns, 4) if stats.turns else 0,
+        no_winner_rate=round(stats.win_rate(-1), 4),
+    )
+    for seat in range(max_players):
+        row[f"win_rate_seat_{seat + 1}"] = round(stats.win_rate(seat), 4) if seat < num_players else ""
+    return row
+
+
+def write_table(results, stream):
+    """Writes one CSV row per point."""
+    max_players = max(num_players for num_players, _, _, _ in results)
+    rows = [point_row(*result, max_players) for result in results]
+    parameters = list(dict.fromkeys(key for _, _, point, _ in results for key in point))
+    fields = parameters + list(METRICS) + [f"win_rate_seat_{seat + 1}" for seat in range(max_players)]
+    writer = csv.DictWriter(stream, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep Chicken Die! rules over a grid of parameters.")
+    parser.add_argument("spec", help="Sweep file (.toml or .json).")
+    parser.add_argument("-o", "--output", help="Write the results table to this CSV file instead of stdout.")
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes to spread the sweep across."
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        default=None,
+        help="SQLite result cache; only grid points and seeds missing from it are played."
+    )
+    args = parser.parse_args()
+
+    spec = load_sweep(args.spec)
+    points = sweep_points(spec.get("grid", {}))
+    print(f"--- Sweeping {len(points)} points x {spec.get('games', 1000)} games ---", file=sys.stderr)
+    if args.cache:
+        with ResultCache(args.cache) as cache:
+            results = run_sweep(spec, workers=args.workers, cache=cache)
+    else:
+        results = run_sweep(spec, workers=args.workers)
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_table(results, f)
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        write_table(results, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import unittest
+
+from ab import _play_pairs
+from simulation import Game, Deck, Rules, DEFAULT_RULES, CARDS_BY_NAME, _compact_result
+
+class TestCommonRandomNumbers(unittest.TestCase):
+
+    def test_keyed_shuffle_keeps_common_cards_in_order(self):
+        """Test that decks with the same shuffle key order the cards they share identically."""
+        more_frenzy = Rules.from_dict({"card_counts": {"Feeding Frenzy": 3}})
+        frenzy = CARDS_BY_NAME["Feeding Frenzy"].id
+        decks = []
+        for rules in (DEFAULT_RULES, more_frenzy):
+            deck = Deck(num_players=4, silent=True, rules=rules, shuffle_key=12345)
+            deck.shuffle()
+            decks.append([card_id for card_id in deck.cards if card_id != frenzy])
+        self.assertEqual(decks[0], decks[1])
+
+    def test_split_streams_are_seeded(self):
+        """Test that split-stream games are reproducible from their seed."""
+        first = Game(num_players=4, silent_deck=True, seed=8, split_streams=True).run_simulation()
+        second = Game(num_players=4, silent_deck=True, seed=8, split_streams=True).run_simulation()
+        self.assertEqual(_compact_result(8, first)[:5], _compact_result(8, second)[:5])
+
+    def test_identical_variants_have_no_paired_noise(self):
+        """Test that A/B with the same rules on both sides gives exactly zero differences."""
+        stats = _play_pairs((0, 30, 3, DEFAULT_RULES, DEFAULT_RULES))
+        self.assertEqual(stats.games, 30)
+        self.assertEqual(stats.turns_difference()[:2], (0.0, 0.0))
+        for seat in range(3):
+            self.assertEqual(stats.win_rate_difference(seat)[:2], (0.0, 0.0))
+
+    def test_paired_stats_merge(self):
+        """Test that merged chunks equal one aggregate over all pairs."""
+        variant = Rules(chick_supply=14)
+        whole = _play_pairs((0, 20, 3, DEFAULT_RULES, variant))
+        merged = _play_pairs((0, 8, 3, DEFAULT_RULES, variant)).merge(_play_pairs((8, 12, 3, DEFAULT_RULES, variant)))
+        self.assertEqual(merged, whole)
+
+if __name__ == '__main__':
+    unittest.main()
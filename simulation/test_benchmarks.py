@@ -0,0 +1,40 @@
+import unittest
+
+from benchmarks import run_suite, compare, PLAYER_COUNTS
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_suite_covers_player_counts_and_handlers(self):
+        """Test that a tiny run reports every player count, card handler and the die roll."""
+        results = run_suite(scale=0.02, repeats=1)
+        self.assertEqual(sorted(results["engine"]), sorted(f"{n}_players" for n in PLAYER_COUNTS))
+        for metrics in results["engine"].values():
+            self.assertGreater(metrics["games_per_sec"], 0)
+            self.assertGreater(metrics["turns_per_sec"], 0)
+        self.assertIn("roll_chicken_die", results["handlers_ns_per_call"])
+        self.assertIn("Fox on the Loose", results["handlers_ns_per_call"])
+        self.assertGreater(results["lookahead"]["rollouts_per_sec"], 0)
+        self.assertEqual(set(results["tracing"]), {"overhead_pct", "full_row_overhead_pct"})
+
+    def test_compare_flags_slowdowns_above_threshold(self):
+        """Test that lower rates and higher handler timings are flagged only past the threshold."""
+        baseline = {
+            "engine": {"4_players": {"games_per_sec": 100.0, "turns_per_sec": 1000.0}},
+            "handlers_ns_per_call": {"Reverse": 100.0, "Bird Flu": 100.0},
+        }
+        current = {
+            "engine": {"4_players": {"games_per_sec": 80.0, "turns_per_sec": 950.0}},
+            "handlers_ns_per_call": {"Reverse": 105.0, "Bird Flu": 150.0},
+        }
+        flagged = [metric for metric, _, _, _ in compare(baseline, current, threshold=0.10)]
+        self.assertEqual(flagged, ["engine.4_players.games_per_sec", "handlers_ns_per_call.Bird Flu"])
+
+    def test_compare_flags_tracing_overhead_growth(self):
+        """Test that a tracing overhead is flagged when traced games got relatively slower past the threshold."""
+        baseline = {"tracing": {"overhead_pct": 8.0, "full_row_overhead_pct": 12.0}}
+        current = {"tracing": {"overhead_pct": 9.0, "full_row_overhead_pct": 25.0}}
+        flagged = [metric for metric, _, _, _ in compare(baseline, current, threshold=0.10)]
+        self.assertEqual(flagged, ["tracing.full_row_overhead_pct"])
+
+if __name__ == '__main__':
+    unittest.main()
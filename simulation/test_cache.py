@@ -0,0 +1,51 @@
+import contextlib
+import io
+import unittest
+
+from cache import ResultCache, config_key
+from simulation import Rules, _cache_config, _play_games, run_multiple_simulations
+from stats import SimulationStats
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        """Open a fresh in-memory cache for each test."""
+        self.cache = ResultCache(":memory:")
+        self.config = _cache_config(3, Rules())
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_plan_reports_gaps_around_stored_segments(self):
+        """Test that stored segments inside the range are reused and the rest are gaps."""
+        segment = SimulationStats().extend(_play_games((10, 5, 3)))
+        self.cache.store(self.config, 10, 5, segment)
+        cached, gaps = self.cache.plan(self.config, 0, 20)
+        self.assertEqual(cached, segment)
+        self.assertEqual(gaps, [(0, 10), (15, 5)])
+        # A segment that sticks out of the requested range cannot be used
+        cached, gaps = self.cache.plan(self.config, 12, 8)
+        self.assertEqual(cached.games, 0)
+        self.assertEqual(gaps, [(12, 8)])
+
+    def test_key_covers_rules_and_engine_version(self):
+        """Test that different rules, or a different engine version, never share results."""
+        other_rules = _cache_config(3, Rules(attack_scaling=1.5))
+        self.assertNotEqual(config_key(self.config), config_key(other_rules))
+        self.assertNotEqual(config_key(self.config), config_key(dict(self.config, engine_version=0)))
+        self.assertEqual(config_key(_cache_config(3, Rules(base_players=2))),
+                         config_key(_cache_config(3, Rules(base_players=2.0))))
+
+    def test_cached_run_extends_and_matches_plain_run(self):
+        """Test that a run over a longer seed range plays only the new seeds and matches an uncached run."""
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            run_multiple_simulations(num_simulations=20, num_players=3, seed=0, cache=self.cache)
+            cached = run_multiple_simulations(num_simulations=50, num_players=3, seed=0, cache=self.cache)
+            plain = run_multiple_simulations(num_simulations=50, num_players=3, seed=0)
+        self.assertIn("20 games reused, 30 played", out.getvalue())
+        self.assertEqual(cached.turn_histogram, plain.turn_histogram)
+        self.assertEqual(cached.winner_counts, plain.winner_counts)
+        self.assertEqual(cached.longest, plain.longest)
+
+if __name__ == '__main__':
+    unittest.main()
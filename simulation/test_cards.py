@@ -0,0 +1,54 @@
+import unittest
+
+from cards import (
+    REGISTRY, CARDS, CARDS_BY_NAME, CARD_FLOCK_KIND, CARD_HANDLERS, CARD_PREDATOR, SPECIALTY_NAMES, DINO, CHICKS,
+    Card, COYOTE_ATTACK,
+)
+from simulation import Game, Deck, DEFAULT_RULES
+
+class TestCardRegistry(unittest.TestCase):
+
+    def test_tables_follow_the_registry(self):
+        """Test that card ids, flock kinds and handlers line up with the registry entries."""
+        self.assertEqual([card.name for card in CARDS], [spec.name for spec in REGISTRY])
+        for card, spec in zip(CARDS, REGISTRY):
+            self.assertEqual(CARD_FLOCK_KIND[card.id], spec.flock_kind)
+            if spec.flock_kind >= 0:
+                self.assertEqual(SPECIALTY_NAMES[spec.flock_kind], spec.name)
+            if spec.handler is not None:
+                self.assertIs(Game.card_handlers[card.id], getattr(Game, CARD_HANDLERS[card.id]))
+
+    def test_unknown_names_are_not_cards(self):
+        """Test that only registry names with their registry types make cards, always the interned one."""
+        self.assertIs(Card("Coyote Attack", "Attack"), COYOTE_ATTACK)
+        with self.assertRaises(ValueError):
+            Card("Coyote Atack", "Attack")
+        with self.assertRaises(ValueError):
+            Card("Coyote Attack", "Instant Effect")
+        self.assertEqual(len(CARDS), len(REGISTRY))
+
+    def test_two_player_deck_uses_base_counts(self):
+        """Test that a deck for the base number of players has each card at its base count, attacks doubled."""
+        deck = Deck(num_players=2, silent=True, rules=DEFAULT_RULES)
+        for card, spec in zip(CARDS, REGISTRY):
+            expected = spec.count * 2 if spec.card_type == "Attack" else spec.count
+            self.assertEqual(deck.cards.count(card.id), expected, spec.name)
+
+    def test_predators_spare_dino_chickens(self):
+        """Test that a predator card cannot kill a Dino Chicken but other kills can."""
+        game = Game(num_players=2, silent_deck=True, seed=0)
+        victim, attacker = game.players[1], game.players[0]
+        victim.hand = []
+        for kind in range(len(victim.counts)):
+            victim.set_count(kind, 0)
+        victim.set_count(DINO, 1)
+        coyote, die_die_die = CARDS_BY_NAME["Coyote Attack"], CARDS_BY_NAME["Die-Die-Die!"]
+        self.assertTrue(CARD_PREDATOR[coyote.id])
+        self.assertFalse(game._kill_a_chicken(victim, attacker=attacker, card=coyote))
+        self.assertEqual(victim.counts[DINO], 1)
+        self.assertTrue(game._kill_a_chicken(victim, attacker=attacker, card=die_die_die))
+        self.assertEqual(victim.counts[DINO], 0)
+        self.assertEqual(victim.counts[CHICKS], 0)
+
+if __name__ == '__main__':
+    unittest.main()
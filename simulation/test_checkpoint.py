@@ -0,0 +1,71 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from checkpoint import Checkpointer, load_checkpoint
+from simulation import Rules, ENGINE_VERSION, _play_games, run_multiple_simulations, resume_simulations
+from stats import SimulationStats
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        """Give each test its own checkpoint path."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.ckpt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_finished_run_writes_complete_checkpoint(self):
+        """Test that a checkpointed run ends with a complete checkpoint of all its games."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = run_multiple_simulations(num_simulations=25, num_players=3, seed=2, checkpoint=self.path)
+        run, next_seed, saved, complete = load_checkpoint(self.path)
+        self.assertTrue(complete)
+        self.assertEqual(next_seed, 27)
+        self.assertEqual(saved, stats)
+        self.assertEqual(run["num_simulations"], 25)
+        self.assertEqual(Rules.from_dict(run["rules"]), Rules())
+        self.assertEqual(os.listdir(self.directory.name), ["run.ckpt"])
+
+    def test_resume_matches_uninterrupted_run(self):
+        """Test that resuming from a partial checkpoint gives the numbers of an uninterrupted run."""
+        run = {"num_simulations": 40, "num_players": 3, "seed": 100, "engine": "object", "batch_size": 16384,
+               "target_ci": None, "time_budget": None, "rules": Rules().to_dict()}
+        partial = Checkpointer(self.path, run, interval=0, engine_version=ENGINE_VERSION)
+        partial.update(115, SimulationStats().extend(_play_games((100, 15, 3))))
+        with contextlib.redirect_stdout(io.StringIO()):
+            resumed = resume_simulations(self.path)
+            uninterrupted = run_multiple_simulations(num_simulations=40, num_players=3, seed=100)
+        self.assertEqual(resumed.games, 40)
+        self.assertEqual(resumed.turn_histogram, uninterrupted.turn_histogram)
+        self.assertEqual(resumed.winner_counts, uninterrupted.winner_counts)
+        self.assertEqual(resumed.longest, uninterrupted.longest)
+
+    def test_resume_of_finished_adaptive_run_plays_nothing(self):
+        """Test that resuming a completed time-budget run reports its games without playing more."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            finished = run_multiple_simulations(num_players=3, seed=0, time_budget=0.05, checkpoint=self.path)
+            resumed = resume_simulations(self.path)
+        self.assertTrue(load_checkpoint(self.path)[3])
+        self.assertEqual(resumed.games, finished.games)
+        self.assertEqual(resumed, finished)
+        self.assertEqual(load_checkpoint(self.path)[2].games, finished.games)
+
+    def test_resume_refuses_other_engine_version(self):
+        """Test that a checkpoint written by another engine version is not resumed."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_multiple_simulations(num_simulations=5, num_players=3, seed=0, checkpoint=self.path)
+        run, next_seed, stats, _ = load_checkpoint(self.path, ENGINE_VERSION)
+        stale = Checkpointer(self.path, run, interval=0, engine_version=ENGINE_VERSION - 1)
+        stale.update(next_seed - 2, stats)
+        with self.assertRaisesRegex(ValueError, "engine version"):
+            resume_simulations(self.path)
+        with self.assertRaises(ValueError):
+            load_checkpoint(self.path, ENGINE_VERSION)
+        self.assertEqual(load_checkpoint(self.path)[1], next_seed - 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from cards import Card
+from simulation import Game, CARDS_BY_NAME, FLOCK_KEYS, HENS
+from events import ListSink, ChickenKilled, DieRolled
+from eventlog import (
+    BinaryEventLog, read_events, record_games, kills_by_card, _log_games, RECORD, EVENT_DTYPE,
+    CARD_PLAYED, DIE_ROLLED, CHICKEN_KILLED, FLOCK_CHANGE, INFERTILE_HEN, GAME_OVER,
+)
+
+class TestEventLog(unittest.TestCase):
+
+    def setUp(self):
+        """Give each test its own log path."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.evlog")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_records_round_trip_through_memory_map(self):
+        """Test that a logged game reads back with one record per die roll and a final game over."""
+        sink = ListSink()
+        Game(num_players=3, silent_deck=True, seed=5, events=sink).run_simulation()
+        with BinaryEventLog(self.path) as log:
+            log.game = 5
+            Game(num_players=3, silent_deck=True, seed=5, events=log).run_simulation()
+        events = read_events(self.path)
+        self.assertEqual(events.dtype, EVENT_DTYPE)
+        self.assertEqual(len(events), log.records)
+        self.assertTrue((events["game"] == 5).all())
+        rolls = [e.roll for e in sink.events if isinstance(e, DieRolled)]
+        self.assertEqual(events["roll"][events["event"] == DIE_ROLLED].tolist(), rolls)
+        kills = sum(isinstance(e, ChickenKilled) for e in sink.events)
+        self.assertEqual(int((events["event"] == CHICKEN_KILLED).sum()), kills)
+        self.assertEqual(events["event"][-1], GAME_OVER)
+
+    def test_kill_records_carry_cause(self):
+        """Test that a chicken killed by an attack card records the attacker, the victim and the card."""
+        log = BinaryEventLog()
+        game = Game(num_players=2, silent_deck=True, seed=3, events=log)
+        game.players[1].hand = []
+        for kind in range(len(FLOCK_KEYS)):
+            game.players[1].set_count(kind, 1 if kind == HENS else 0)
+        card = Card("Coyote Attack", "Attack")
+        game.play_card(game.players[0], card)
+        records = [RECORD.unpack_from(chunk) for chunk in _chunks(log.take())]
+        self.assertEqual(records[0][2:6], (CARD_PLAYED, 0, -1, card.id))
+        kill = next(record for record in records if record[2] == CHICKEN_KILLED)
+        self.assertEqual(kill[3:6], (0, 1, card.id))
+        self.assertEqual(kill[7:], (HENS, -1))
+
+    def test_flock_changes_rebuild_final_flocks(self):
+        """Test that summing a game's flock changes by seat and kind gives every player's final flock."""
+        log = BinaryEventLog()
+        finals = {}
+        for seed in range(30):
+            log.game = seed
+            game = Game(num_players=4, silent_deck=True, seed=seed, events=log)
+            game.run_simulation()
+            finals[seed] = [list(p.counts) for p in game.players]
+        events = np.frombuffer(log.take(), dtype=EVENT_DTYPE)
+        self.assertIn(INFERTILE_HEN, events["event"])
+        changes = events[events["event"] == FLOCK_CHANGE]
+        for seed, flocks in finals.items():
+            rebuilt = np.zeros((4, len(FLOCK_KEYS)), dtype=int)
+            game_changes = changes[changes["game"] == seed]
+            np.add.at(rebuilt, (game_changes["target"], game_changes["kind"]), game_changes["delta"])
+            self.assertEqual(rebuilt.tolist(), flocks, f"seed {seed}")
+
+    def test_log_appends_to_existing_file(self):
+        """Test that a second run appends to a log instead of overwriting it."""
+        first = record_games(self.path, num_simulations=3, num_players=2, seed=0)
+        second = record_games(self.path, num_simulations=2, num_players=2, seed=10)
+        events = read_events(self.path)
+        self.assertEqual(len(events), first + second)
+        self.assertEqual(sorted(set(events["game"].tolist())), [0, 1, 2, 10, 11])
+
+    def test_log_is_independent_of_workers(self):
+        """Test that logging with several workers writes the same records as one worker."""
+        other = os.path.join(self.directory.name, "parallel.evlog")
+        record_games(self.path, num_simulations=8, num_players=3, workers=1, seed=4)
+        record_games(other, num_simulations=8, num_players=3, workers=2, seed=4)
+        self.assertTrue((read_events(self.path) == read_events(other)).all())
+
+    def test_kills_by_card_counts_causes(self):
+        """Test that kills by card add up to every kill in the log, with predator cards among the causes."""
+        with BinaryEventLog(self.path) as log:
+            log.write(_log_games((0, 20, 4)))
+        events = read_events(self.path)
+        kills = kills_by_card(events)
+        self.assertEqual(sum(kills.values()), int((events["event"] == CHICKEN_KILLED).sum()))
+        self.assertIn(-1, kills) # The Chicken Die step
+        self.assertIn(CARDS_BY_NAME["Chicken Blaster"].id, kills)
+
+    def test_empty_log_reads_as_empty_array(self):
+        """Test that a log with only its header reads as an empty record array."""
+        BinaryEventLog(self.path).close()
+        self.assertEqual(len(read_events(self.path)), 0)
+
+    def test_reader_rejects_other_files(self):
+        """Test that reading a file without the event log header raises a ValueError."""
+        with open(self.path, "wb") as f:
+            f.write(b"not a log at all")
+        with self.assertRaises(ValueError):
+            read_events(self.path)
+        with self.assertRaises(ValueError):
+            BinaryEventLog(self.path)
+
+def _chunks(records):
+    return [records[i:i + RECORD.size] for i in range(0, len(records), RECORD.size)]
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import io
+import unittest
+from cards import Card
+from simulation import Game
+from events import ListSink, TextRenderer, CardPlayed, ChickenKilled, DieRolled, GameOver
+
+class TestEventSinks(unittest.TestCase):
+
+    def test_handlers_emit_typed_events(self):
+        """Test that playing a card emits CardPlayed and the resulting ChickenKilled."""
+        sink = ListSink()
+        game = Game(num_players=2, silent_deck=True, seed=3, events=sink)
+        game.players[1].hand = []
+        card = Card("Coyote Attack", "Attack")
+        game.play_card(game.players[0], card)
+        self.assertIn(CardPlayed(game.players[0], card), sink.events)
+        killed = [e for e in sink.events if isinstance(e, ChickenKilled)]
+        self.assertEqual(len(killed), 1)
+        self.assertIs(killed[0].player, game.players[1])
+
+    def test_full_game_ends_with_game_over(self):
+        """Test that a full game emits die rolls and ends with a single GameOver event."""
+        sink = ListSink()
+        Game(num_players=3, silent_deck=True, seed=5, events=sink).run_simulation()
+        self.assertTrue(any(isinstance(e, DieRolled) for e in sink.events))
+        self.assertIsInstance(sink.events[-1], GameOver)
+
+    def test_text_renderer_buffers_transcript(self):
+        """Test that the text renderer only writes its buffered lines on flush."""
+        stream = io.StringIO()
+        renderer = TextRenderer(stream, buffer_lines=1000)
+        game = Game(num_players=2, silent_deck=True, seed=1, events=renderer)
+        game.take_turn(game.players[0])
+        self.assertEqual(stream.getvalue(), "")
+        renderer.flush()
+        self.assertTrue(stream.getvalue().startswith("It's Player 1's turn.\n"))
+
+    def test_silent_game_matches_verbose_game(self):
+        """Test that the event sink has no effect on how a seeded game plays out."""
+        silent = Game(num_players=4, silent_deck=True, seed=21).run_simulation()
+        verbose = Game(num_players=4, silent_deck=True, seed=21,
+                       events=TextRenderer(io.StringIO())).run_simulation()
+        self.assertEqual((silent["winner"], silent["turns"]), (verbose["winner"], verbose["turns"]))
+
+if __name__ == '__main__':
+    unittest.main()
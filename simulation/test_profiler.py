@@ -0,0 +1,42 @@
+import unittest
+
+from simulation import Game, _profile_games
+from profiler import GameProfiler, PHASES
+
+class TestGameProfiler(unittest.TestCase):
+
+    def test_profiling_does_not_change_the_game(self):
+        """Test that a profiled game plays out exactly like an unprofiled one with the same seed."""
+        plain = Game(num_players=4, silent_deck=True, seed=21).run_simulation()
+        profiled = GameProfiler().attach(Game(num_players=4, silent_deck=True, seed=21)).run_simulation()
+        for key in ("winner", "turns", "reshuffles", "cards_played"):
+            self.assertEqual(plain[key], profiled[key])
+
+    def test_counts_phases_and_cards(self):
+        """Test that every turn runs each phase once and every handled card is counted."""
+        profiler = GameProfiler()
+        game = profiler.attach(Game(num_players=3, silent_deck=True, seed=5))
+        result = game.run_simulation()
+        turns = profiler.phase_calls["take_turn"]
+        self.assertEqual(turns, min(result["turns"], 1000))
+        for name in ("_collect_eggs", "_draw_phase", "_ai_play_cards", "_ai_spend_eggs"):
+            self.assertEqual(profiler.phase_calls[name], turns)
+        self.assertEqual(sorted(profiler.card_calls), sorted(game.card_dispatcher))
+        self.assertLessEqual(sum(profiler.card_calls.values()), result["cards_played"])
+
+    def test_unprofiled_games_are_not_instrumented(self):
+        """Test that hooks live only on attached instances."""
+        game = Game(num_players=4, silent_deck=True, seed=1)
+        for name, _ in PHASES:
+            self.assertNotIn(name, vars(game))
+
+    def test_merge_matches_single_run(self):
+        """Test that merged chunks count the same calls as one profiler over all the games."""
+        whole = _profile_games((0, 20, 4))
+        merged = _profile_games((0, 10, 4)).merge(_profile_games((10, 10, 4)))
+        self.assertEqual(merged.games, 20)
+        self.assertEqual(merged.phase_calls, whole.phase_calls)
+        self.assertEqual(merged.card_calls, whole.card_calls)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from progress import ProgressReporter
+from simulation import run_multiple_simulations
+from stats import SimulationStats
+
+def _stats(winners):
+    """A SimulationStats of 10-turn games won by the given seats."""
+    return SimulationStats().extend((seed, seat, 10, 0, 3, 0.001) for seed, seat in enumerate(winners))
+
+class TestProgressReporter(unittest.TestCase):
+
+    def setUp(self):
+        """Give each test its own heartbeat path."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "heartbeat.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_snapshot_reports_rates_eta_and_wins(self):
+        """Test that a snapshot has the games played, positive rates, an ETA and the win shares."""
+        reporter = ProgressReporter(total=100, stream=io.StringIO())
+        reporter.update(SimulationStats())
+        reporter.start()
+        time.sleep(0.01)
+        reporter.update(_stats([0, 1, 1, -1]))
+        state = reporter.snapshot()
+        reporter.stop()
+        self.assertEqual(state["games"], 4)
+        self.assertEqual(state["turns"], 40)
+        self.assertGreater(state["games_per_sec"], 0)
+        self.assertAlmostEqual(state["turns_per_sec"], 10 * state["games_per_sec"])
+        self.assertGreater(state["eta_seconds"], 0)
+        self.assertEqual(state["win_distribution"], {"0": 0.25, "1": 0.5, "-1": 0.25})
+        line = reporter.status_line(state)
+        self.assertTrue(line.startswith("[4/100 games, 4.0%]"))
+        self.assertTrue(line.endswith("| P1 25.0% P2 50.0% none 25.0%"))
+
+    def test_thread_reports_periodically(self):
+        """Test that the reporter thread prints status lines until stopped, then a final one."""
+        stream = io.StringIO()
+        with ProgressReporter(interval=0.01, stream=stream) as reporter:
+            reporter.update(_stats([0]))
+            time.sleep(0.1)
+        lines = stream.getvalue().splitlines()
+        self.assertGreater(len(lines), 2)
+        self.assertIn("done", lines[-1])
+        self.assertIn("ETA ?", lines[0]) # No total and no deadline
+
+    def test_failed_run_leaves_incomplete_heartbeat(self):
+        """Test that a run ending in an exception writes a heartbeat that is not marked complete."""
+        with self.assertRaises(RuntimeError):
+            with ProgressReporter(heartbeat_path=self.path, stream=io.StringIO()):
+                raise RuntimeError("worker died")
+        with open(self.path) as f:
+            self.assertFalse(json.load(f)["complete"])
+
+    def test_parallel_run_writes_heartbeat(self):
+        """Test that a multi-process run ends with a complete heartbeat and unchanged results."""
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+            plain = run_multiple_simulations(num_simulations=40, num_players=3, seed=6)
+            stats = run_multiple_simulations(num_simulations=40, num_players=3, seed=6, workers=2,
+                                             progress_every=0.01, heartbeat=self.path)
+        self.assertEqual((stats.turn_histogram, stats.winner_counts), (plain.turn_histogram, plain.winner_counts))
+        with open(self.path) as f:
+            heartbeat = json.load(f)
+        self.assertTrue(heartbeat["complete"])
+        self.assertEqual((heartbeat["games"], heartbeat["total"], heartbeat["turns"]), (40, 40, stats.turns))
+        self.assertAlmostEqual(sum(heartbeat["win_distribution"].values()), 1.0)
+        self.assertTrue(stderr.getvalue().splitlines()[-1].startswith("[40/40 games, 100.0%]"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from simulation import Game, DEFAULT_STRATEGY, CARDS_BY_NAME
+from rollout import RolloutStrategy
+
+class InstantEffectLover(RolloutStrategy):
+    """Scores any Instant Effect as a sure win, so it is picked whenever it is a candidate."""
+
+    def rollout(self, game, snapshot, seat, card, rollout_seed):
+        return 1.0 if card is not None and card.card_type == "Instant Effect" else 0.0
+
+class TestRolloutStrategy(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(num_players=4, silent_deck=True, seed=3)
+        self.player = self.game.players[0]
+
+    def test_decision_leaves_the_game_untouched(self):
+        """Test that evaluating candidates only touches clones, never the game or its RNG."""
+        strategy = RolloutStrategy(rollouts=30, seed=1)
+        before = self.game.snapshot()
+        card = strategy.choose_card(self.game, self.player)
+        self.assertEqual(self.game.snapshot(), before)
+        self.assertTrue(card is None or card in self.player.hand)
+        self.assertGreaterEqual(strategy.total_rollouts, 30)
+
+    def test_seeded_decisions_repeat(self):
+        """Test that the same seed makes the same choice from the same position."""
+        first = RolloutStrategy(rollouts=30, seed=5).choose_card(self.game, self.player)
+        second = RolloutStrategy(rollouts=30, seed=5).choose_card(self.game, self.player)
+        self.assertIs(first, second)
+
+    def test_plays_full_games(self):
+        """Test that a game with a rollout player in one seat runs to completion."""
+        strategies = [RolloutStrategy(rollouts=10, horizon=5, seed=0)] + [DEFAULT_STRATEGY] * 3
+        result = Game(num_players=4, silent_deck=True, seed=9, strategies=strategies).run_simulation()
+        self.assertIn("winner", result)
+
+    def test_time_budget_counts_completed_rounds(self):
+        """Test that a decision cut short by its time budget counts only the rounds it played."""
+        strategy = RolloutStrategy(rollouts=1000, time_budget=0.0, seed=1)
+        self.player.hand = [CARDS_BY_NAME["Coyote Attack"], CARDS_BY_NAME["Incubator"]]
+        strategy.choose_card(self.game, self.player)
+        self.assertEqual(strategy.total_rollouts, 3) # One round of three candidates
+
+    def test_never_plays_held_instant_effects(self):
+        """Test that an Instant Effect held in hand is never a rollout candidate."""
+        self.player.hand = [CARDS_BY_NAME["Bird Flu"], CARDS_BY_NAME["Chicken Bomb"], CARDS_BY_NAME["Incubator"]]
+        strategy = InstantEffectLover(rollouts=30, seed=1)
+        # Playing nothing and Incubator tie, so playing nothing wins
+        self.assertIsNone(strategy.choose_card(self.game, self.player))
+        self.assertEqual(strategy.total_rollouts, 30) # Two candidates, 15 rounds
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
+import contextlib
+import io
 import unittest
 from unittest.mock import patch
 import random
-from simulation import Game, Card, Player
+from cards import Card
+from simulation import (
+    Game, Deck, Hand, Player, Rules, Strategy, DefaultStrategy, CARDS, CARDS_BY_NAME, BUY_CHICK,
+    _play_games, _seed_ranges, run_multiple_simulations, CHICKS, HENS, SPECIALTY_KINDS,
+)
 
 class TestGameMechanics(unittest.TestCase):
 
@@ -39,7 +45,7 @@ class TestPersonalGrowthCards(unittest.TestCase):
         initial_eggs = self.player1.egg_cards
         card = Card("Farm to Table", "Personal Growth")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player1.egg_cards, initial_eggs + 3)
 
     def test_feeding_frenzy_card(self):
@@ -47,7 +53,7 @@ class TestPersonalGrowthCards(unittest.TestCase):
         self.player1.flock["Chicks"] = 5
         card = Card("Feeding Frenzy", "Personal Growth")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         # Should promote 3 chicks
         self.assertEqual(self.player1.flock["Hens"], 1 + 3)
         self.assertEqual(self.player1.flock["Chicks"], 5 - 3)
@@ -57,7 +63,7 @@ class TestPersonalGrowthCards(unittest.TestCase):
         self.game.graveyard = ["Robo-Hen"]
         card = Card("Resurrection", "Personal Growth")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player1.flock["Robo-Hens"], 1)
         self.assertEqual(len(self.game.graveyard), 0)
 
@@ -67,7 +73,7 @@ class TestPersonalGrowthCards(unittest.TestCase):
         initial_chicks = self.player1.flock["Chicks"]
         card = Card("Incubator", "Personal Growth")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player1.flock["Chicks"], initial_chicks + 3)
         self.assertEqual(self.player1.egg_cards, 10 - (3 * 2))
 
@@ -87,7 +93,7 @@ class TestAttackCards(unittest.TestCase):
         initial_chickens = self.player2.total_chickens()
         card = Card("Coyote Attack", "Attack")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player2.total_chickens(), initial_chickens - 1)
 
     def test_chicken_blaster_card(self):
@@ -95,7 +101,7 @@ class TestAttackCards(unittest.TestCase):
         initial_chickens = self.player2.total_chickens()
         card = Card("Chicken Blaster", "Attack")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player2.total_chickens(), initial_chickens - 1)
 
     def test_eat_mor_chikin_card(self):
@@ -103,7 +109,7 @@ class TestAttackCards(unittest.TestCase):
         initial_chickens = self.player2.total_chickens()
         card = Card("Eat Mor Chikin", "Attack")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player2.total_chickens(), initial_chickens - 1)
         self.assertTrue(self.game.skip_roll)
 
@@ -113,7 +119,7 @@ class TestAttackCards(unittest.TestCase):
         self.player2.flock["Hens"] = 5
         card = Card("Hen Swap", "Attack")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player1.flock["Hens"], 3) # Capped at 3
         self.assertEqual(self.player2.flock["Hens"], 1)
 
@@ -122,7 +128,7 @@ class TestAttackCards(unittest.TestCase):
         self.player2.flock["Chicks"] = 5
         card = Card("Bird Flu", "Instant Effect") # Note: Card is Instant Effect in rules
         # Mocking draw/play since it's instant
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player2.flock["Chicks"], 2) # 5 - 3
 
     def test_omelette_card(self):
@@ -130,7 +136,7 @@ class TestAttackCards(unittest.TestCase):
         initial_eggs = self.player2.egg_cards
         card = Card("3-Egg Omelette", "Attack")
         self.player1.hand.append(card)
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player2.egg_cards, initial_eggs - 3)
 
 class TestInstantEffectCards(unittest.TestCase):
@@ -146,7 +152,7 @@ class TestInstantEffectCards(unittest.TestCase):
         self.player1.flock["Hens"] = 2
         self.player2.flock["Hens"] = 1
         card = Card("Demotion", "Instant Effect")
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player1.flock["Hens"], 0)
         self.assertEqual(self.player1.flock["Chicks"], 2 + 2) # Start with 2
         self.assertEqual(self.player2.flock["Hens"], 0)
@@ -157,7 +163,7 @@ class TestInstantEffectCards(unittest.TestCase):
         self.player1.flock["Hens"] = 5
         self.player1.flock["Robo-Hens"] = 1
         card = Card("Foster Farms", "Instant Effect")
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player1.flock["Hens"], 2) # 5 - 3
         self.assertEqual(self.player1.flock["Robo-Hens"], 1) # Unaffected
 
@@ -165,7 +171,7 @@ class TestInstantEffectCards(unittest.TestCase):
         """Test that Chicken Bomb kills a chicken of the player who drew it."""
         initial_chickens = self.player1.total_chickens()
         card = Card("Chicken Bomb", "Instant Effect")
-        self.game.play_card(self.player1, card, silent=True)
+        self.game.play_card(self.player1, card)
         self.assertEqual(self.player1.total_chickens(), initial_chickens - 1)
 
 class TestSpecialtyChickenCards(unittest.TestCase):
@@ -184,7 +190,7 @@ class TestSpecialtyChickenCards(unittest.TestCase):
         # Mocking turn steps to only test egg collection
         with patch.object(self.game, 'perform_ai_actions'), \
              patch.object(self.game, 'roll_chicken_die'):
-            self.game.take_turn(self.player1, silent=True)
+            self.game.take_turn(self.player1)
             self.assertEqual(self.player1.egg_cards, 2)
 
     def test_punk_rock_chick_production(self):
@@ -194,7 +200,7 @@ class TestSpecialtyChickenCards(unittest.TestCase):
         self.player1.egg_cards = 0
         with patch.object(self.game, 'perform_ai_actions'), \
              patch.object(self.game, 'roll_chicken_die'):
-            self.game.take_turn(self.player1, silent=True)
+            self.game.take_turn(self.player1)
             self.assertEqual(self.player1.egg_cards, 1)
 
     def test_decoy_chicken_priority(self):
@@ -202,7 +208,7 @@ class TestSpecialtyChickenCards(unittest.TestCase):
         self.player1.hand = [] # Ensure no Immunity card
         self.player1.flock["Decoy Chickens"] = 1
         self.player1.flock["Chicks"] = 1
-        self.game._kill_a_chicken(self.player1, silent=True)
+        self.game._kill_a_chicken(self.player1)
         self.assertEqual(self.player1.flock["Decoy Chickens"], 0)
         self.assertEqual(self.player1.flock["Chicks"], 1)
 
@@ -219,7 +225,7 @@ class TestProtectionCards(unittest.TestCase):
         card = Card("Immunity", "Protection")
         self.player2.hand = [card]
         initial_chickens = self.player2.total_chickens()
-        self.game._kill_a_chicken(self.player2, silent=True)
+        self.game._kill_a_chicken(self.player2)
         self.assertEqual(self.player2.total_chickens(), initial_chickens)
         self.assertNotIn(card, self.player2.hand)
 
@@ -230,9 +236,245 @@ class TestProtectionCards(unittest.TestCase):
         initial_chickens = self.player2.total_chickens()
         
         # Coyote Attack should be blocked
-        self.game._kill_a_chicken(self.player2, silent=True, attacker=self.player1)
+        self.game._kill_a_chicken(self.player2, attacker=self.player1)
         self.assertEqual(self.player2.total_chickens(), initial_chickens)
         self.assertNotIn(card, self.player2.hand)
 
+class TestDeck(unittest.TestCase):
+
+    def test_cards_are_interned(self):
+        """Test that cards with the same name are the same flyweight object."""
+        card = Card("Immunity", "Protection")
+        self.assertIs(card, Card("Immunity", "Protection"))
+        self.assertIs(CARDS[card.id], card)
+
+    def test_draw_reshuffles_discard_pile(self):
+        """Test that the deck holds card ids and reshuffles the discard pile when empty."""
+        deck = Deck(num_players=2, silent=True, rng=random.Random(0))
+        size = len(deck.cards)
+        drawn = [deck.draw() for _ in range(size)]
+        deck.discard_pile.extend(card.id for card in drawn)
+        self.assertEqual(len(deck.cards), 0)
+        self.assertIsInstance(deck.draw(), Card)
+        self.assertEqual(deck.reshuffles, 1)
+        self.assertEqual(len(deck.cards), size - 1)
+
+    def test_rules_change_deck_and_supplies(self):
+        """Test that Rules override card counts, attack scaling and starting supplies."""
+        rules = Rules.from_dict({"card_counts": {"Chicken Bomb": 0, "Immunity": 5},
+                                 "attack_scaling": 1.0, "chick_supply": 20})
+        ids = list(Deck(num_players=4, silent=True, rules=rules).cards)
+        self.assertNotIn(CARDS_BY_NAME["Chicken Bomb"].id, ids)
+        self.assertEqual(ids.count(CARDS_BY_NAME["Immunity"].id), 10)
+        self.assertEqual(ids.count(CARDS_BY_NAME["Chicken Blaster"].id), 6)
+        game = Game(num_players=4, silent_deck=True, seed=0, rules=rules)
+        self.assertEqual(game.chick_supply, 20 - 2 * 4)
+        with self.assertRaises(ValueError):
+            Rules.from_dict({"card_counts": {"Chicken Nuke": 1}})
+
+class TestPlayerFlock(unittest.TestCase):
+
+    def test_flock_view_keeps_total_in_sync(self):
+        """Test that dict-style flock writes update the flock array and running total."""
+        player = Player("Player 1")
+        player.flock["Chicks"] = 3
+        player.add(HENS, 2)
+        self.assertEqual(player.counts[CHICKS], 3)
+        self.assertEqual(player.flock["Hens"], 2)
+        self.assertEqual(player.total_chickens(), 5)
+        self.assertEqual(dict(player.flock)["Robo-Hens"], 0)
+
+class TestHand(unittest.TestCase):
+
+    def test_counts_follow_appends_and_removes(self):
+        """Test that per-card and per-type counts stay in sync with the cards held."""
+        coyote, blaster, incubator = (CARDS_BY_NAME[name] for name in ("Coyote Attack", "Chicken Blaster", "Incubator"))
+        hand = Hand([blaster, coyote, blaster, incubator])
+        hand.remove(blaster)
+        self.assertEqual(len(hand), 3)
+        self.assertEqual(hand.count(blaster), 1)
+        self.assertEqual(hand.count_of_type("Attack"), 2)
+        self.assertEqual(list(hand), [coyote, blaster, incubator])
+        hand.remove(blaster)
+        self.assertNotIn(blaster, hand)
+        with self.assertRaises(ValueError):
+            hand.remove(blaster)
+
+    def test_first_of_type_is_lowest_card_id(self):
+        """Test that picking by type returns the lowest-id card of that type, or None."""
+        player = Player("Player 1")
+        player.hand = [CARDS_BY_NAME["Eat Mor Chikin"], CARDS_BY_NAME["Hen Swap"], CARDS_BY_NAME["Immunity"]]
+        self.assertIs(player.hand.first_of_type("Attack"), CARDS_BY_NAME["Hen Swap"])
+        self.assertIsNone(player.hand.first_of_type("Personal Growth"))
+
+class TestRoster(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new game for each test."""
+        self.game = Game(num_players=4, silent_deck=True)
+        self.players = self.game.players
+
+    def test_live_players_and_total_follow_flock_changes(self):
+        """Test that eliminations and revivals update the live list and chicken total."""
+        self.players[1].flock["Chicks"] = 0
+        self.players[1].flock["Hens"] = 0
+        self.assertEqual(self.game.roster.live, [self.players[0], self.players[2], self.players[3]])
+        self.assertEqual(self.game.roster.total, 9)
+        self.players[1].add(HENS, 2)
+        self.assertEqual(self.game.roster.live, self.players)
+        self.assertEqual(self.game.roster.total, 11)
+
+    def test_random_opponent_matches_choice_over_opponents(self):
+        """Test that random_opponent draws the same opponent as rng.choice(get_opponents())."""
+        self.players[2].flock["Chicks"] = 0
+        self.players[2].flock["Hens"] = 0
+        for seat in range(4):
+            player = self.players[seat]
+            for seed in range(10):
+                expected = random.Random(seed).choice(self.game.get_opponents(player))
+                actual = self.game.roster.random_opponent(player, random.Random(seed))
+                self.assertIs(actual, expected)
+
+class TestBatchRunner(unittest.TestCase):
+
+    def test_chunked_runs_match_serial_run(self):
+        """Test that splitting a seed range into chunks reproduces the serial results."""
+        serial = _play_games((100, 12, 4))
+        chunked = []
+        for task in _seed_ranges(100, 12, 4, chunk_size=5):
+            chunked.extend(_play_games(task))
+        # Durations are wall-clock timings, everything else must match exactly
+        self.assertEqual([r[:5] for r in serial], [r[:5] for r in chunked])
+
+    def test_target_ci_stops_at_same_game_with_workers(self):
+        """Test that an adaptive run stops once converged, at the same game for any worker count."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = run_multiple_simulations(num_players=3, seed=4, target_ci=0.05)
+            parallel = run_multiple_simulations(num_players=3, seed=4, workers=2, target_ci=0.05)
+        self.assertTrue(serial.within_tolerance(3, 0.05))
+        self.assertEqual(serial.games, parallel.games)
+        self.assertEqual(serial.turn_histogram, parallel.turn_histogram)
+        self.assertEqual(serial.winner_counts, parallel.winner_counts)
+
+    def test_time_budget_respects_game_limit(self):
+        """Test that a time-budgeted run reports what it played and honours -n as a cap."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = run_multiple_simulations(num_simulations=300, seed=0, time_budget=60)
+        self.assertEqual(stats.games, 300)
+
+class TestSeededGames(unittest.TestCase):
+
+    def test_same_seed_replays_same_game(self):
+        """Test that two games with the same seed play out identically."""
+        first = Game(num_players=4, silent_deck=True, seed=1234).run_simulation()
+        second = Game(num_players=4, silent_deck=True, seed=1234).run_simulation()
+        first.pop("duration")
+        second.pop("duration")
+        self.assertEqual(first, second)
+
+    def test_game_does_not_use_global_random(self):
+        """Test that reseeding the module-global RNG does not change a seeded game."""
+        random.seed(1)
+        first = Game(num_players=3, silent_deck=True, seed=99).run_simulation()
+        random.seed(2)
+        second = Game(num_players=3, silent_deck=True, seed=99).run_simulation()
+        self.assertEqual(first["turns"], second["turns"])
+        self.assertEqual(first["winner"], second["winner"])
+
+    def test_games_keep_every_card(self):
+        """Test that no card leaves the game: deck, discards, hands, specialty chickens and graveyard add up."""
+        def card_count(game):
+            return (len(game.deck.cards) + len(game.deck.discard_pile) + len(game.graveyard)
+                    + sum(len(p.hand) + sum(p.counts[kind] for kind in SPECIALTY_KINDS) for p in game.players))
+        for seed in range(6):
+            game = Game(num_players=4, silent_deck=True, seed=seed)
+            dealt = card_count(game)
+            game.run_simulation()
+            self.assertEqual(card_count(game), dealt, f"seed {seed}")
+
+class TestStrategies(unittest.TestCase):
+
+    def test_default_strategy_is_the_builtin_ai(self):
+        """Test that explicit DefaultStrategy instances play the same game as the default."""
+        first = Game(num_players=3, silent_deck=True, seed=17).run_simulation()
+        strategies = [DefaultStrategy() for _ in range(3)]
+        second = Game(num_players=3, silent_deck=True, seed=17, strategies=strategies).run_simulation()
+        first.pop("duration")
+        second.pop("duration")
+        self.assertEqual(first, second)
+
+    def test_game_follows_the_strategy(self):
+        """Test that the strategy's card, target and egg choices are the ones carried out."""
+        class Scripted(Strategy):
+            def choose_card(self, game, player):
+                return next((c for c in player.hand if c.name == "Coyote Attack"), None)
+
+            def choose_target(self, game, player, card, candidates=None):
+                return game.players[2]
+
+            def choose_egg_spend(self, game, player):
+                return BUY_CHICK if player.egg_cards >= 6 else None
+
+        game = Game(num_players=3, silent_deck=True, seed=0, strategies=Scripted())
+        player = game.players[0]
+        coyote = CARDS_BY_NAME["Coyote Attack"]
+        player.hand = [coyote, coyote]
+        player.egg_cards = 7
+        with patch.object(game, '_kill_a_chicken') as kill:
+            game.perform_ai_actions(player)
+        self.assertEqual(kill.call_count, 2)
+        kill.assert_called_with(game.players[2], attacker=player, card=coyote)
+        self.assertEqual(player.egg_cards, 1)
+        self.assertEqual(player.counts[CHICKS], 3)
+
+    def test_strategies_must_match_players(self):
+        """Test that a strategy list of the wrong length is rejected."""
+        with self.assertRaises(ValueError):
+            Game(num_players=3, silent_deck=True, seed=0, strategies=[DefaultStrategy()] * 2)
+
+class TestSnapshot(unittest.TestCase):
+
+    def _advance(self, game, turns):
+        """Plays turns the way run_simulation does."""
+        for _ in range(turns):
+            game.turn += 1
+            if game.split_streams:
+                game._reseed_streams()
+            game.take_turn(game.players[game.current_player_index])
+            game._advance_player()
+
+    def _finish(self, game):
+        result = game.run_simulation()
+        result.pop("duration")
+        return result
+
+    def test_clone_plays_on_like_the_original(self):
+        """Test that a clone taken mid-game finishes exactly as the original does."""
+        for split_streams in (False, True):
+            game = Game(num_players=4, silent_deck=True, seed=21, split_streams=split_streams)
+            self._advance(game, 12)
+            clone = game.clone()
+            self.assertEqual(self._finish(clone), self._finish(game))
+
+    def test_restore_rewinds_the_game(self):
+        """Test that restoring a snapshot replays the rest of the game identically."""
+        game = Game(num_players=3, silent_deck=True, seed=5)
+        self._advance(game, 8)
+        snapshot = game.snapshot()
+        first = self._finish(game)
+        game.restore(snapshot)
+        self.assertEqual(game.snapshot(), snapshot)
+        self.assertEqual(self._finish(game), first)
+
+    def test_clone_with_rng_is_independent(self):
+        """Test that a rollout clone leaves the original untouched and needs an rng without RNG states."""
+        game = Game(num_players=4, silent_deck=True, seed=2)
+        self._advance(game, 5)
+        snapshot = game.snapshot(include_rng=False)
+        self._finish(game.clone(snapshot, rng=random.Random(1)))
+        self.assertEqual(game.snapshot(include_rng=False), snapshot)
+        with self.assertRaises(ValueError):
+            game.clone(snapshot)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
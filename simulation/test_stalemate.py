@@ -0,0 +1,87 @@
+import contextlib
+import io
+import unittest
+
+from simulation import Game, Rules, HENS, _compact_result, _cache_config, run_multiple_simulations
+from stats import SimulationStats
+from events import TextRenderer
+
+def _quiet_turn(game):
+    """Advances the turn counter without changing anything else."""
+    game.turn += 1
+    return game.stalemate.stalled(game)
+
+class TestStalemateDetector(unittest.TestCase):
+
+    def test_default_rules_have_no_detector(self):
+        """Test that stalemate detection is off unless the rules enable it."""
+        self.assertIsNone(Game(num_players=4, silent_deck=True, seed=1).stalemate)
+        self.assertNotIn("stalemate_window", _cache_config(4, Rules())["rules"])
+        self.assertEqual(_cache_config(4, Rules(stalemate_window=50))["rules"]["stalemate_window"], 50)
+
+    def test_window_without_progress_is_stalemate(self):
+        """Test that a game without progress for the window's number of turns is stalled."""
+        game = Game(num_players=3, silent_deck=True, seed=1, rules=Rules(stalemate_window=3))
+        self.assertEqual([_quiet_turn(game) for _ in range(3)], [False, False, True])
+        self.assertFalse(game.stalemate.cycling)
+
+    def test_new_low_resets_window(self):
+        """Test that only a new low in the chickens in play counts as progress, not a death bred back."""
+        game = Game(num_players=3, silent_deck=True, seed=1, rules=Rules(stalemate_window=3))
+        _quiet_turn(game)
+        _quiet_turn(game)
+        game.players[0].add(HENS, -1)
+        self.assertFalse(_quiet_turn(game))
+        self.assertEqual(game.stalemate.last_progress, 3)
+        game.players[0].add(HENS, 1)
+        self.assertFalse(_quiet_turn(game))
+        game.players[0].add(HENS, -1) # Back to the low, not below it
+        self.assertFalse(_quiet_turn(game))
+        self.assertTrue(_quiet_turn(game))
+
+    def test_recurring_state_is_cycling(self):
+        """Test that a state seen the repeats' number of times without progress is a cycling stalemate."""
+        game = Game(num_players=2, silent_deck=True, seed=4, rules=Rules(stalemate_repeats=3))
+        self.assertEqual([_quiet_turn(game) for _ in range(3)], [False, False, True])
+        self.assertTrue(game.stalemate.cycling)
+
+    def test_stalled_game_reports_turns_to_cap(self):
+        """Test that a stalled game ends without a winner and its aggregate counts the turns left before the cap."""
+        rules = Rules(stalemate_window=5)
+        stats = SimulationStats()
+        stalled = []
+        for seed in range(30):
+            result = Game(num_players=4, silent_deck=True, seed=seed, rules=rules).run_simulation()
+            stats.add(_compact_result(seed, result))
+            if result.get("reason") == "Stalemate":
+                stalled.append(result)
+        self.assertTrue(stalled)
+        for result in stalled:
+            self.assertEqual(result["winner"], "None")
+            self.assertEqual(result["turns_to_cap"], rules.max_turns - result["turns"])
+        self.assertEqual(stats.stalemates, len(stalled))
+        self.assertEqual(stats.turns_to_cap, sum(result["turns_to_cap"] for result in stalled))
+        merged = SimulationStats().merge(stats)
+        self.assertEqual((merged.stalemates, merged.turns_to_cap), (stats.stalemates, stats.turns_to_cap))
+
+    def test_transcript_names_stalemate(self):
+        """Test that the verbose transcript of a stalled game ends with the stalemate."""
+        stream = io.StringIO()
+        game = Game(num_players=4, silent_deck=True, seed=0, rules=Rules(stalemate_window=1),
+                    events=TextRenderer(stream))
+        result = game.run_simulation()
+        self.assertEqual(result["reason"], "Stalemate")
+        self.assertIn(f"Stalemate after {result['turns']} turns", stream.getvalue())
+
+    def test_batch_report_counts_stalemates(self):
+        """Test that a batch run with detection reports its stalemates, and the vectorized engine refuses it."""
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            stats = run_multiple_simulations(num_simulations=30, num_players=4, seed=0, rules=Rules(stalemate_window=5))
+        self.assertGreater(stats.stalemates, 0)
+        self.assertIn(f"Stalemates: {stats.stalemates} games", stdout.getvalue())
+        with self.assertRaises(ValueError):
+            run_multiple_simulations(num_simulations=10, engine="vectorized", rules=Rules(stalemate_window=5))
+
+if __name__ == '__main__':
+    unittest.main()
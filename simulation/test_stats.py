@@ -0,0 +1,48 @@
+import random
+import statistics
+import unittest
+from simulation import _play_games
+from stats import SimulationStats
+
+class TestSimulationStats(unittest.TestCase):
+
+    def setUp(self):
+        """Play a small seeded batch to aggregate in each test."""
+        self.results = _play_games((500, 40, 3))
+
+    def test_running_moments_match_batch_statistics(self):
+        """Test that the streaming mean and variance match statistics over the full list."""
+        stats = SimulationStats().extend(self.results)
+        turns = [r[2] for r in self.results]
+        self.assertEqual(stats.games, len(turns))
+        self.assertAlmostEqual(stats.mean_turns(), statistics.mean(turns))
+        self.assertAlmostEqual(stats.variance_turns(), statistics.variance(turns))
+        self.assertEqual(stats.turn_quantile(0.5), sorted(turns)[(len(turns) + 1) // 2 - 1])
+
+    def test_merge_is_exact_and_order_independent(self):
+        """Test that merging shuffled partial aggregates reproduces the serial aggregate."""
+        serial = SimulationStats().extend(self.results)
+        chunks = [SimulationStats().extend(self.results[i:i + 7]) for i in range(0, len(self.results), 7)]
+        random.Random(0).shuffle(chunks)
+        merged = SimulationStats()
+        for chunk in chunks:
+            merged.merge(chunk)
+        self.assertEqual(merged, serial)
+
+    def test_outliers_report_lowest_seed_on_ties(self):
+        """Test that the longest game is the first one in seed order, like max() over the results."""
+        stats = SimulationStats().extend(self.results)
+        longest = max(self.results, key=lambda r: r[2])
+        self.assertEqual(stats.longest, (longest[2], longest[0]))
+
+    def test_within_tolerance(self):
+        """Test that convergence needs every seat's win-rate CI and the relative length CI inside the target."""
+        stats = SimulationStats().extend(self.results)
+        widest = max(stats.win_rate_ci(seat) for seat in range(3))
+        relative_length = stats.turns_ci() / stats.mean_turns()
+        self.assertTrue(stats.within_tolerance(3, max(widest, relative_length)))
+        self.assertFalse(stats.within_tolerance(3, widest * 0.99))
+        self.assertFalse(SimulationStats().within_tolerance(3, 1.0))
+
+if __name__ == '__main__':
+    unittest.main()
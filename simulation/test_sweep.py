@@ -0,0 +1,37 @@
+import unittest
+
+from simulation import Rules, _play_games
+from stats import SimulationStats
+from sweep import sweep_points, run_sweep
+
+class TestSweep(unittest.TestCase):
+
+    def test_grid_expands_to_every_combination(self):
+        """Test that each grid axis multiplies the points and scalars stay fixed."""
+        points = sweep_points({
+            "num_players": [2, 3],
+            "attack_scaling": [1.0, 2.0],
+            "egg_supply": 80,
+            "card_counts": {"Reverse": [0, 1, 2]},
+        })
+        self.assertEqual(len(points), 12)
+        num_players, rules, parameters = points[-1]
+        self.assertEqual(num_players, 3)
+        self.assertEqual(rules, Rules(card_counts=(("Reverse", 2),), attack_scaling=2.0, egg_supply=80))
+        self.assertEqual(parameters, {"num_players": 3, "attack_scaling": 2.0, "egg_supply": 80, "card:Reverse": 2})
+
+    def test_unknown_grid_key_is_rejected(self):
+        """Test that a misspelt parameter fails instead of being silently ignored."""
+        with self.assertRaises(ValueError):
+            sweep_points({"atack_scaling": [1.0]})
+
+    def test_default_point_matches_plain_run(self):
+        """Test that a point with the standard rules reproduces an ordinary batch over the same seeds."""
+        (num_players, rules, _, stats), = run_sweep({"games": 30, "seed": 9, "grid": {"num_players": 3}})
+        expected = SimulationStats().extend(_play_games((9, 30, 3)))
+        self.assertEqual(rules, Rules())
+        self.assertEqual(stats.turn_histogram, expected.turn_histogram)
+        self.assertEqual(stats.winner_counts, expected.winner_counts)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import contextlib
+import io
+import unittest
+
+from simulation import DefaultStrategy
+from rollout import RolloutStrategy
+from stats import TournamentStats
+from tournament import parse_spec, build_strategy, seatings, run_tournament
+
+class TestTournament(unittest.TestCase):
+
+    def test_seatings_rotate_every_mixed_lineup(self):
+        """Test that every strategy sits in every seat equally often and mirror lineups are skipped."""
+        orders = seatings(["a", "b"], [3])
+        self.assertEqual(len(orders), 6) # aab and abb, three rotations each
+        for seat in range(3):
+            self.assertEqual(sum(order[seat] == "a" for order in orders), 3)
+        self.assertNotIn(("a", "a", "a"), orders)
+        self.assertEqual(seatings(["a", "b"], [2]), [("a", "b"), ("b", "a")])
+
+    def test_specs(self):
+        """Test that specs name a strategy and its parameters, and seeded strategies get a seed."""
+        self.assertEqual(parse_spec("rollout:rollouts=5,horizon=3"), ("rollout", {"rollouts": 5, "horizon": 3}))
+        with self.assertRaises(ValueError):
+            parse_spec("bogus")
+        self.assertIsInstance(build_strategy("default", 1), DefaultStrategy)
+        strategy = build_strategy("rollout:rollouts=5", 7)
+        self.assertIsInstance(strategy, RolloutStrategy)
+        self.assertEqual(strategy.rng.random(), RolloutStrategy(seed=7).rng.random())
+
+    def test_ratings_follow_pairwise_wins(self):
+        """Test that the stronger strategy rates higher and that merging does not change ratings."""
+        first, second = TournamentStats(), TournamentStats()
+        for game in range(30):
+            first.add(("strong", "weak"), 0 if game % 3 else 1)
+            second.add(("weak", "strong", "weak"), 1 if game % 2 else -1)
+        merged = TournamentStats().merge(first).merge(second)
+        ratings = merged.ratings()
+        self.assertGreater(ratings["strong"], 1500)
+        self.assertLess(ratings["weak"], 1500)
+        self.assertEqual(ratings, TournamentStats().merge(second).merge(first).ratings())
+        self.assertEqual(merged.no_winner, 15)
+        self.assertEqual(merged.seats_played("weak"), 90)
+
+    def test_workers_do_not_change_results(self):
+        """Test that a parallel tournament merges to the same totals as a serial one."""
+        with contextlib.redirect_stderr(io.StringIO()):
+            serial = run_tournament(["default", "passive"], player_counts=(2,), num_games=6, seed=3)
+            parallel = run_tournament(["default", "passive"], player_counts=(2,), num_games=6, seed=3, workers=2)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial.games, 12)
+
+if __name__ == '__main__':
+    unittest.main()
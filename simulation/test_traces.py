@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from simulation import Game, HENS
+from traces import (
+    TurnTrace, trace_games, load_traces, flock_by_turn, TURN_COLUMNS, PLAYER_COLUMNS, ALL_COLUMNS, DEFAULT_COLUMNS,
+)
+
+class TestTurnTrace(unittest.TestCase):
+
+    def setUp(self):
+        """Give each test its own trace directory."""
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_trace_records_state_after_every_turn(self):
+        """Test that a traced game records one row per turn matching the game's state."""
+        trace = TurnTrace(3, columns=ALL_COLUMNS)
+        game = Game(num_players=3, silent_deck=True, seed=8, trace=trace)
+        result = game.run_simulation()
+        columns = trace.columns()
+        self.assertEqual(len(trace), result["turns"])
+        self.assertEqual(columns["turn"].tolist(), list(range(1, result["turns"] + 1)))
+        self.assertTrue((columns["game"] == 8).all())
+        # The last row is the final state of the game
+        self.assertEqual(columns["flock_total"][-1].tolist(), [p.total for p in game.players])
+        self.assertEqual(columns["hens"][-1].tolist(), [p.counts[HENS] for p in game.players])
+        self.assertEqual(columns["eggs"][-1].tolist(), [p.egg_cards for p in game.players])
+        self.assertEqual(columns["hand_size"][-1].tolist(), [len(p.hand) for p in game.players])
+        self.assertEqual(columns["deck_size"][-1], len(game.deck.cards))
+        self.assertEqual(columns["chick_supply"][-1], game.chick_supply)
+        self.assertEqual(columns["hen_supply"][-1], game.hen_supply)
+        self.assertEqual(columns["egg_supply"][-1], game.egg_supply)
+        self.assertEqual(columns["seat"][-1], game.current_player_index)
+
+    def test_trace_records_only_selected_columns(self):
+        """Test that a trace records the default columns unless asked for others, and rejects unknown ones."""
+        full, narrow = TurnTrace(2, columns=ALL_COLUMNS), TurnTrace(2)
+        for seed in range(3):
+            Game(num_players=2, silent_deck=True, seed=seed, trace=full).run_simulation()
+            Game(num_players=2, silent_deck=True, seed=seed, trace=narrow).run_simulation()
+        columns = narrow.columns()
+        self.assertEqual(set(columns), {"game", "turn", *DEFAULT_COLUMNS})
+        for name, column in columns.items():
+            self.assertTrue(np.array_equal(full.columns()[name], column), name)
+        with self.assertRaises(ValueError):
+            TurnTrace(2, columns=("seat", "score"))
+        with self.assertRaises(ValueError):
+            TurnTrace(2, columns=())
+
+    def test_trace_does_not_change_outcomes(self):
+        """Test that tracing a seeded game does not change how it plays out."""
+        plain = Game(num_players=4, silent_deck=True, seed=13).run_simulation()
+        traced = Game(num_players=4, silent_deck=True, seed=13, trace=TurnTrace(4)).run_simulation()
+        self.assertEqual((plain["winner"], plain["turns"]), (traced["winner"], traced["turns"]))
+
+    def test_trace_keeps_rows_of_many_games(self):
+        """Test that a trace keeps every row of several games, split into their games."""
+        trace = TurnTrace(2, columns=ALL_COLUMNS)
+        turns = []
+        for seed in range(5):
+            turns.append(Game(num_players=2, silent_deck=True, seed=seed, trace=trace).run_simulation()["turns"])
+        columns = trace.columns()
+        self.assertEqual(len(columns["turn"]), sum(turns))
+        self.assertEqual(np.bincount(columns["game"]).tolist(), turns)
+        self.assertEqual(columns["flock_total"].shape, (sum(turns), 2))
+        self.assertEqual(set(columns), {"game", "turn", *TURN_COLUMNS, *PLAYER_COLUMNS})
+
+    def test_trace_rejects_other_player_counts(self):
+        """Test that a trace refuses a game with a different number of players."""
+        with self.assertRaises(ValueError):
+            Game(num_players=3, silent_deck=True, seed=1, trace=TurnTrace(4)).run_simulation()
+
+    def test_batch_chunks_load_in_seed_order(self):
+        """Test that a batch written as several chunk files loads back as one trace in seed order."""
+        paths = trace_games(self.directory.name, num_simulations=7, num_players=3, seed=20, chunk_size=3)
+        self.assertEqual(len(paths), 3)
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+        columns = load_traces(self.directory.name)
+        games = columns["game"]
+        self.assertEqual(sorted(set(games.tolist())), list(range(20, 27)))
+        self.assertTrue((np.diff(games) >= 0).all())
+        single = TurnTrace(3)
+        for seed in range(20, 27):
+            Game(num_players=3, silent_deck=True, seed=seed, trace=single).run_simulation()
+        for name, column in single.columns().items():
+            self.assertTrue(np.array_equal(columns[name], column), name)
+
+    def test_flock_by_turn_averages_running_games(self):
+        """Test that flock_by_turn counts the games still running and starts near the opening flock."""
+        trace = TurnTrace(4, columns=("flock_total", "hens"))
+        for seed in range(10):
+            Game(num_players=4, silent_deck=True, seed=seed, trace=trace).run_simulation()
+        turns, flock, hens, games = flock_by_turn(trace.columns(), max_turn=5)
+        self.assertEqual(turns.tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(games[0], 10)
+        self.assertTrue(0 < flock[0] <= 4)
+        self.assertTrue((hens <= flock).all())
+        columns = trace.columns()
+        del columns["hens"]
+        self.assertIsNone(flock_by_turn(columns, max_turn=5)[2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+from fractions import Fraction
+
+from simulation import Game, CARDS_BY_NAME, CHICKS, HENS, DECOY
+from transitions import (
+    FlockState, Supplies, roll_outcomes, die_die_die_outcomes, fox_outcomes, fox_seat_outcomes, sample_fox,
+    survival_probability, expected_counts, from_game, apply_to_game, _roll, _player_rolls,
+)
+
+class ScriptedRng:
+    """Stands in for the Game RNG streams: a fixed die roll, and a fixed pick among kill candidates."""
+
+    def __init__(self, roll, pick):
+        self.roll, self.pick, self.choices = roll, pick, 1
+
+    def randint(self, a, b):
+        return self.roll
+
+    def choice(self, seq):
+        self.choices = len(seq)
+        return seq[self.pick]
+
+class TestTransitions(unittest.TestCase):
+
+    def make_game(self, chicks, hens, eggs, immunity=0, decoy=0, supplies=(50, 50, 100)):
+        game = Game(num_players=2, silent_deck=True, seed=0)
+        player = game.players[0]
+        player.set_count(CHICKS, chicks)
+        player.set_count(HENS, hens)
+        player.set_count(DECOY, decoy)
+        player.egg_cards = eggs
+        player.hand = [CARDS_BY_NAME["Immunity"]] * immunity
+        game.chick_supply, game.hen_supply, game.egg_supply = supplies
+        return game, player
+
+    def test_roll_matches_every_scripted_game(self):
+        """Test that the exact roll distribution matches replaying every die face and kill choice."""
+        for setup in ((2, 1, 1), (1, 0, 0), (0, 2, 3), (1, 1, 0, 1), (1, 1, 2, 0, 1)):
+            game, player = self.make_game(*setup, supplies=(50, 0, 1))
+            exact = roll_outcomes(from_game(game, [player])[0][0], from_game(game)[1])
+            replayed = {}
+            for roll in range(1, 7):
+                pick, picks = 0, 1
+                while pick < picks:
+                    game, player = self.make_game(*setup, supplies=(50, 0, 1))
+                    game.dice_rng = game.choice_rng = scripted = ScriptedRng(roll, pick)
+                    game.roll_chicken_die(player)
+                    picks = scripted.choices
+                    state = from_game(game, [player])
+                    replayed[state] = replayed.get(state, 0) + Fraction(1, 6 * picks)
+                    pick += 1
+            self.assertEqual(dict(exact), replayed)
+
+    def test_die_die_die_survival(self):
+        """Test that a lone chick survives Die-Die-Die! only if no 4 or 6 comes up in three rolls."""
+        outcomes = die_die_die_outcomes(FlockState.of(chicks=1))
+        self.assertEqual(sum(outcomes.values()), 1)
+        self.assertEqual(survival_probability(outcomes), Fraction(4, 6) ** 3)
+
+    def test_fox_shares_supplies_between_players(self):
+        """Test that a Fox with an empty chick supply cannot demote hens for anyone."""
+        outcomes = fox_outcomes([FlockState.of(hens=1), FlockState.of(hens=1)], Supplies(chicks=0))
+        self.assertEqual(sum(outcomes.values()), 1)
+        for (flocks, supplies), _ in outcomes.items():
+            self.assertEqual(supplies.chicks, 0)
+            for flock in flocks:
+                self.assertEqual(flock.counts[CHICKS], 0)
+        self.assertEqual(survival_probability(outcomes, seat=1), 1 - Fraction(11, 36))
+
+    def test_sampled_outcome_applies_to_game(self):
+        """Test that a sampled Fox outcome written into a Game reads back identically."""
+        game = Game(num_players=3, silent_deck=True, seed=4)
+        state = fox_outcomes(*from_game(game)).sample(random.Random(0))
+        apply_to_game(game, state)
+        self.assertEqual(from_game(game), state)
+        self.assertEqual(game.roster.total, sum(flock.total() for flock in state[0]))
+
+    def test_seat_outcomes_match_joint_marginal(self):
+        """Test that one seat's Fox outcomes give the same chances as the joint table."""
+        game = Game(num_players=3, silent_deck=True, seed=4)
+        joint = fox_outcomes(*from_game(game))
+        for seat in range(3):
+            single = fox_seat_outcomes(*from_game(game), seat=seat)
+            self.assertEqual(sum(single.values()), 1)
+            self.assertEqual(survival_probability(single), survival_probability(joint, seat))
+            self.assertEqual(expected_counts(single), expected_counts(joint, seat))
+
+    def test_sample_fox_draws_joint_outcomes(self):
+        """Test that sampled Fox outcomes are outcomes of the joint table, at about their probabilities."""
+        flocks, supplies = [FlockState.of(chicks=1, hens=1), FlockState.of(hens=2)], Supplies(chicks=1)
+        joint = fox_outcomes(flocks, supplies)
+        rng = random.Random(3)
+        draws = 20000
+        counts = {}
+        for _ in range(draws):
+            state = sample_fox(flocks, supplies, rng)
+            counts[state] = counts.get(state, 0) + 1
+        self.assertLessEqual(set(counts), set(joint))
+        for state, probability in joint.items():
+            self.assertAlmostEqual(counts.get(state, 0) / draws, float(probability), delta=0.015)
+
+    def test_caches_are_bounded(self):
+        """Test that the memoized steps keep a bounded number of entries."""
+        self.assertIsNotNone(_roll.cache_info().maxsize)
+        self.assertIsNotNone(_player_rolls.cache_info().maxsize)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+try:
+    import numpy as np
+    from vectorized import VectorizedGames, CHICKS, HENS, DECOY
+except ImportError:  # numpy is optional
+    np = None
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestVectorizedGames(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small batch of games for each test."""
+        self.games = VectorizedGames(64, num_players=4, seed=7)
+
+    def test_initial_game_setup(self):
+        """Test that every game starts with the standard flock, eggs and hand."""
+        self.assertTrue((self.games.flock[:, :, CHICKS] == 2).all())
+        self.assertTrue((self.games.flock[:, :, HENS] == 1).all())
+        self.assertTrue((self.games.eggs == 1).all())
+        self.assertTrue((self.games.hand.sum(axis=2) == 5).all())
+
+    def test_cards_are_conserved(self):
+        """Test that cards only move between deck, discard pile, hands and flocks."""
+        self.games.run()
+        deck_size = len(self.games.cards.deck)
+        in_hands = self.games.hand.sum(axis=(1, 2))
+        played_specialty = self.games.flock[:, :, 2:].sum(axis=(1, 2)) + self.games.graveyard.sum(axis=1)
+        total = self.games.deck_len + self.games.discard_len + in_hands + played_specialty
+        self.assertTrue((total == deck_size).all())
+
+    def test_games_finish_with_valid_winner(self):
+        """Test that all games end and the winner is the only player with chickens."""
+        self.games.run()
+        self.assertTrue(self.games.done.all())
+        alive = self.games.flock.sum(axis=2) > 0
+        for g, winner in enumerate(self.games.winner):
+            if winner >= 0:
+                self.assertEqual(list(np.flatnonzero(alive[g])), [winner])
+            elif self.games.turn[g] <= self.games.max_turns:
+                self.assertFalse(alive[g].any())
+
+    def test_same_seed_reproduces_batch(self):
+        """Test that a batch is fully determined by its seed."""
+        first = VectorizedGames(32, num_players=3, seed=11)
+        second = VectorizedGames(32, num_players=3, seed=11)
+        first.run()
+        second.run()
+        self.assertEqual(first.results(), second.results())
+
+    def test_immunity_saves_a_chicken(self):
+        """Test that a held Immunity card is used up instead of a chicken dying."""
+        immunity = self.games.cards.ids["Immunity"]
+        g, q = np.array([0]), np.array([1])
+        self.games._hand[q, :] = 0
+        self.games._hand[q, immunity] = 1
+        before = self.games._flock[1].sum()
+        self.games._kill(g, q, attacker=False)
+        self.assertEqual(self.games._flock[1].sum(), before)
+        self.assertEqual(self.games._hand[1, immunity], 0)
+
+    def test_decoy_chicken_priority(self):
+        """Test that Decoy Chicken is killed first."""
+        g, q = np.array([0]), np.array([1])
+        self.games._hand[q, :] = 0
+        self.games._flock[1, DECOY] = 1
+        self.games._kill(g, q, attacker=True)
+        self.assertEqual(self.games._flock[1, DECOY], 0)
+        self.assertEqual(self.games._flock[1, CHICKS], 2)
+        self.assertEqual(self.games.graveyard[0, DECOY], 1)
+
+if __name__ == '__main__':
+    unittest.main()
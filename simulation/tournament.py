@@ -0,0 +1,197 @@
+"""Round-robin tournaments between AI strategies.
+
+Strategies are named by a spec, "name" or "name:key=value,...", e.g. "default",
+"passive" or "rollout:rollouts=50,horizon=10", and built fresh for every seat of
+every game (STRATEGIES lists the names). For each player count, every lineup
+that mixes at least two of the strategies (a multiset of them, one per seat) is
+played in each of its seat rotations, so every strategy sits in every seat
+equally often, and every rotation plays the same seeds. Run from the simulation
+directory:
+
+    python tournament.py default passive rollout:rollouts=40 -p 2 4 -n 200 -w 4 --standings standings.json
+
+Chunks go to a process pool and are merged as they finish. The standings are
+printed to stderr and, with --standings, written atomically as JSON at most every
+--report-every seconds, so partial results can be watched during long runs.
+"""
+import argparse
+import ast
+import inspect
+import itertools
+import multiprocessing
+import random
+import sys
+import time
+
+from simulation import Game, Strategy, DefaultStrategy, _seed_ranges
+from rollout import RolloutStrategy
+from stats import TournamentStats
+from checkpoint import save_checkpoint
+
+STRATEGIES = {
+    "default": DefaultStrategy,
+    "passive": Strategy, # Never plays a card or spends an egg
+    "rollout": RolloutStrategy,
+}
+
+
+def parse_spec(spec):
+    """(name, parameters) of a strategy spec; parameter values are Python literals or plain strings."""
+    name, _, arguments = spec.partition(":")
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {name!r}; expected one of {', '.join(STRATEGIES)}")
+    parameters = {}
+    for argument in filter(None, arguments.split(",")):
+        key, separator, value = argument.partition("=")
+        if not separator:
+            raise ValueError(f"Expected key=value in {spec!r}, got {argument!r}")
+        try:
+            parameters[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            parameters[key.strip()] = value.strip()
+    return name, parameters
+
+
+def build_strategy(spec, seed):
+    """A fresh Strategy for spec; strategies with a seed parameter get seed unless the spec sets one."""
+    name, parameters = parse_spec(spec)
+    factory = STRATEGIES[name]
+    if "seed" in inspect.signature(factory).parameters:
+        parameters.setdefault("seed", seed)
+    return factory(**parameters)
+
+
+def seatings(specs, player_counts):
+    """Every seat order to play: the rotations of each mixed lineup, per player count."""
+    orders = []
+    for num_players in player_counts:
+        for lineup in itertools.combinations_with_replacement(specs, num_players):
+            if len(set(lineup)) < 2:
+                continue
+            rotations = [lineup[shift:] + lineup[:shift] for shift in range(num_players)]
+            orders.extend(dict.fromkeys(rotations)) # A periodic lineup repeats rotations
+    return orders
+
+
+def _play_seating(task):
+    """Plays a (start_seed, count, seat order) range of games and returns their TournamentStats."""
+    start_seed, count, order = task
+    stats = TournamentStats()
+    num_players = len(order)
+    for seed in range(start_seed, start_seed + count):
+        strategies = [build_strategy(spec, seed * num_players + seat) for seat, spec in enumerate(order)]
+        result = Game(num_players=num_players, silent_deck=True, seed=seed, strategies=strategies).run_simulation()
+        winner = result["winner"]
+        stats.add(order, int(winner.split()[-1]) - 1 if winner != "None" else -1)
+    return stats
+
+
+def _status_line(stats, done, total):
+    leaders = ", ".join(f"{name} {rating:.0f}" for name, rating, *_ in stats.standings()[:4])
+    return f"[{done}/{total} chunks, {stats.games} games] {leaders}"
+
+
+def run_tournament(specs, player_counts=(4,), num_games=100, workers=1, seed=None,
+                   standings_path=None, report_every=10.0):
+    """Plays num_games seeds for every seat order and returns the merged TournamentStats."""
+    for spec in specs:
+        parse_spec(spec)
+    if len(set(specs)) < 2:
+        raise ValueError("A tournament needs at least two different strategies")
+    if seed is None:
+        seed = random.randrange(2**32)
+    orders = seatings(specs, player_counts)
+    print(f"--- Tournament: {len(orders)} seatings x {num_games} games (seed {seed}) ---", file=sys.stderr)
+    chunk_size = max(1, min(100, num_games * len(orders) // (workers * 4)))
+    tasks = [task[:2] + (order,)
+             for order in orders
+             for task in _seed_ranges(seed, num_games, len(order), chunk_size)]
+
+    stats = TournamentStats()
+    last_report = time.monotonic()
+
+    def publish(done, final=False):
+        print(_status_line(stats, done, len(tasks)), file=sys.stderr)
+        if standings_path:
+            save_checkpoint(standings_path, {
+                "seed": seed,
+                "strategies": list(specs),
+                "player_counts": list(player_counts),
+                "chunks_done": done,
+                "chunks": len(tasks),
+                "complete": final,
+                "ratings": stats.ratings(),
+                "stats": stats.to_dict(),
+            })
+
+    def merge(results):
+        nonlocal last_report
+        for done, chunk_stats in enumerate(results, 1):
+            stats.merge(chunk_stats)
+            if time.monotonic() - last_report >= report_every:
+                publish(done)
+                last_report = time.monotonic()
+
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            merge(pool.imap_unordered(_play_seating, tasks))
+    else:
+        merge(map(_play_seating, tasks))
+    publish(len(tasks), final=True)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a round-robin tournament between Chicken Die! strategies.")
+    parser.add_argument("strategies", nargs="+",
+                        help=f"Strategy specs, name[:key=value,...]; names: {', '.join(STRATEGIES)}.")
+    parser.add_argument(
+        "-p", "--num-players",
+        type=int,
+        nargs="+",
+        default=[4],
+        help="The player counts to play at."
+    )
+    parser.add_argument(
+        "-n", "--num-games",
+        type=int,
+        default=100,
+        help="Seeds to play for every seat order of every lineup."
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes to spread games across."
+    )
+    parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed of the first game of every seat order; game i uses seed + i. Random if omitted."
+    )
+    parser.add_argument(
+        "--standings",
+        metavar="PATH",
+        default=None,
+        help="Keep the current standings in this JSON file."
+    )
+    parser.add_argument(
+        "--report-every",
+        type=float,
+        default=10.0,
+        metavar="SECONDS",
+        help="Print and save partial standings at most this often (default 10)."
+    )
+    args = parser.parse_args()
+    try:
+        stats = run_tournament(args.strategies, player_counts=args.num_players, num_games=args.num_games,
+                               workers=args.workers, seed=args.seed, standings_path=args.standings,
+                               report_every=args.report_every)
+    except ValueError as error:
+        parser.error(str(error))
+    stats.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Columnar per-turn state traces of many games, for analytics at scale.
+
+A TurnTrace passed as Game(trace=...) records the state at the end of every turn
+column by column: each recorded column keeps a flat list of ints, read from the
+game by that column's getter, so tracing creates no per-turn dicts or rows.
+columns() turns the lists into named NumPy columns, one value per turn or, for
+PLAYER_COLUMNS, one per player:
+
+    game          int64   seed of the game the turn belongs to (-1 if unseeded)
+    turn          int32   turn number
+    seat          int32   seat of the player who took the turn
+    chick_supply, hen_supply, egg_supply, deck_size   int32
+    flock_total, hens, eggs, hand_size                int32, shape (turns, num_players)
+
+game and turn follow from the order of the rows and are always there; the
+others are recorded only when asked for. Every recorded column costs time on
+every turn, and only the narrow default row, DEFAULT_COLUMNS (seat and
+flock_total), keeps tracing within the 10% budget: it makes a 4 player game
+about 6% slower. The full row, columns=ALL_COLUMNS, does not: it makes the same
+game about 35% slower, and is meant for smaller, more detailed studies (see
+benchmarks.bench_tracing).
+
+One trace can record many games in a row. trace_games writes the trace of
+each chunk of a batch as an .npz file of these columns, and load_traces
+concatenates the chunks of a directory again:
+
+    columns = load_traces("traces")
+    first_turns = columns["turn"] <= 10
+    mean_flock = columns["flock_total"][first_turns].mean()
+
+Run from the simulation directory to trace a batch of seeded games:
+
+    python traces.py traces -n 10000 -p 4 -w 4 -s 0
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import random
+
+import numpy as np
+
+from simulation import Game, HENS, _seed_ranges
+
+TURN_COLUMNS = ("seat", "chick_supply", "hen_supply", "egg_supply", "deck_size")
+PLAYER_COLUMNS = ("flock_total", "hens", "eggs", "hand_size")
+ALL_COLUMNS = TURN_COLUMNS + PLAYER_COLUMNS
+DEFAULT_COLUMNS = ("seat", "flock_total")
+
+
+# How each column reads its value: turn columns from the Game, player columns from each Player
+def _seat(game):
+    return game.current_player_index
+
+
+def _chick_supply(game):
+    return game.chick_supply
+
+
+def _hen_supply(game):
+    return game.hen_supply
+
+
+def _egg_supply(game):
+    return game.egg_supply
+
+
+def _deck_size(game):
+    return len(game.deck.cards)
+
+
+def _flock_total(player):
+    return player.total
+
+
+def _hens(player):
+    return player.counts[HENS]
+
+
+def _eggs(player):
+    return player.egg_cards
+
+
+def _hand_size(player):
+    return player._hand.size
+
+
+_TURN_GETTERS = {
+    "seat": _seat,
+    "chick_supply": _chick_supply,
+    "hen_supply": _hen_supply,
+    "egg_supply": _egg_supply,
+    "deck_size": _deck_size,
+}
+_PLAYER_GETTERS = {
+    "flock_total": _flock_total,
+    "hens": _hens,
+    "eggs": _eggs,
+    "hand_size": _hand_size,
+}
+
+
+class TurnTrace:
+    """Records the state of one or more games at the end of every turn.
+
+    columns selects the recorded columns among ALL_COLUMNS (at least one). Each
+    column keeps its values in a list, num_players values per turn for player
+    columns, until columns() converts them.
+    """
+
+    def __init__(self, num_players, columns=DEFAULT_COLUMNS):
+        unknown = set(columns) - set(ALL_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown trace columns: {', '.join(sorted(unknown))}")
+        if not columns:
+            raise ValueError("A trace needs at least one column")
+        self.num_players = num_players
+        self.turn_columns = tuple(name for name in TURN_COLUMNS if name in columns)
+        self.player_columns = tuple(name for name in PLAYER_COLUMNS if name in columns)
+        self._values = {name: [] for name in self.turn_columns + self.player_columns}
+        # (append, getter) per column, prebuilt for the recording closures
+        self._turn_recorders = tuple((self._values[name].append, _TURN_GETTERS[name]) for name in self.turn_columns)
+        self._player_recorders = tuple((self._values[name].append, _PLAYER_GETTERS[name])
+                                       for name in self.player_columns)
+        self.game_seeds = [] # One per game, in order
+        self.game_starts = [] # First row of each game
+        self.first_turns = [] # Turn number of each game's first row
+
+    def start(self, game):
+        """Starts recording game; returns the function Game calls at the end of each of its turns."""
+        if len(game.players) != self.num_players:
+            raise ValueError(f"Expected a game of {self.num_players} players, got {len(game.players)}")
+        self.game_seeds.append(game.seed if game.seed is not None else -1)
+        self.game_starts.append(len(self))
+        self.first_turns.append(game.turn + 1)
+        players = tuple(game.players)
+        turn_recorders, player_recorders = self._turn_recorders, self._player_recorders
+        if self.turn_columns + self.player_columns == DEFAULT_COLUMNS:
+            # The default row is recorded on most turns traced, so it reads its two values directly
+            append_seat, append_total = self._values["seat"].append, self._values["flock_total"].append
+
+            def record():
+                append_seat(game.current_player_index)
+                for player in players:
+                    append_total(player.total)
+            return record
+
+        def record():
+            for append, get in turn_recorders:
+                append(get(game))
+            for player in players:
+                for append, get in player_recorders:
+                    append(get(player))
+        return record
+
+    def __len__(self):
+        if self.turn_columns:
+            return len(self._values[self.turn_columns[0]])
+        return len(self._values[self.player_columns[0]]) // self.num_players
+
+    def columns(self):
+        """{column name: array} of the turns recorded so far (copies, so the trace can keep recording)."""
+        size = len(self)
+        ends = self.game_starts[1:] + [size]
+        lengths = np.subtract(ends, self.game_starts)
+        starts = np.repeat(np.array(self.game_starts, dtype=np.int32), lengths)
+        first_turns = np.repeat(np.array(self.first_turns, dtype=np.int32), lengths)
+        columns = {
+            "game": np.repeat(np.array(self.game_seeds, dtype=np.int64), lengths),
+            "turn": np.arange(size, dtype=np.int32) - starts + first_turns,
+        }
+        for name in self.turn_columns:
+            columns[name] = np.array(self._values[name], dtype=np.int32)
+        for name in self.player_columns:
+            columns[name] = np.array(self._values[name], dtype=np.int32).reshape(size, self.num_players)
+        return columns
+
+    def save(self, path):
+        """Writes the columns to an .npz file at path."""
+        np.savez(path, **self.columns())
+
+
+def load_traces(path):
+    """The columns of a saved trace, or of every .npz trace in a directory concatenated in file name order."""
+    paths = sorted(glob.glob(os.path.join(path, "*.npz"))) if os.path.isdir(path) else [path]
+    if not paths:
+        raise ValueError(f"No traces found in {path}")
+    chunks = []
+    for chunk_path in paths:
+        with np.load(chunk_path) as chunk:
+            chunks.append({name: chunk[name] for name in chunk.files})
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+
+def _trace_games(task):
+    """Plays a (start_seed, count, num_players) range of games and saves their trace in directory."""
+    start_seed, count, num_players, directory, columns = task
+    trace = TurnTrace(num_players, columns)
+    for seed in range(start_seed, start_seed + count):
+        Game(num_players=num_players, silent_deck=True, seed=seed, trace=trace).run_simulation()
+    path = os.path.join(directory, f"trace_{start_seed:020d}.npz")
+    trace.save(path)
+    return path
+
+
+def trace_games(directory, num_simulations=100, num_players=4, workers=1, seed=None, chunk_size=1000,
+                columns=DEFAULT_COLUMNS):
+    """Traces games seeded seed, seed+1, ... into one .npz file per chunk in directory; returns the paths.
+
+    Chunk files are named by their first seed, so load_traces reads them in seed
+    order (for non-negative seeds) whatever the number of workers.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    os.makedirs(directory, exist_ok=True)
+    tasks = [task[:3] + (directory, columns) for task in _seed_ranges(seed, num_simulations, num_players, chunk_size)]
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            return pool.map(_trace_games, tasks)
+    return [_trace_games(task) for task in tasks]
+
+
+def flock_by_turn(columns, max_turn=None):
+    """(turns, mean flock total per player, mean hens per player, games still running) by turn number.
+
+    The mean hens are None unless the hens column was recorded.
+    """
+    turn = columns["turn"]
+    max_turn = int(turn.max()) if max_turn is None else max_turn
+    turns = np.arange(1, max_turn + 1)
+    games = np.bincount(turn, minlength=max_turn + 1)[1:max_turn + 1]
+    num_players = columns["flock_total"].shape[1]
+    flock = np.bincount(turn, weights=columns["flock_total"].sum(axis=1), minlength=max_turn + 1)[1:max_turn + 1]
+    running = np.maximum(games, 1) * num_players
+    hens = None
+    if "hens" in columns:
+        hens = np.bincount(turn, weights=columns["hens"].sum(axis=1), minlength=max_turn + 1)[1:max_turn + 1] / running
+    return turns, flock / running, hens, games
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record per-turn state traces of seeded Chicken Die! games.")
+    parser.add_argument("directory", help="The directory to write .npz trace chunks to.")
+    parser.add_argument(
+        "-n", "--num-simulations",
+        type=int,
+        default=100,
+        help="The number of games to trace."
+    )
+    parser.add_argument(
+        "-p", "--num-players",
+        type=int,
+        default=4,
+        help="The number of players in each game."
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes to spread games across."
+    )
+    parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed of the first game; game i uses seed + i. Random if omitted."
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Games per trace file."
+    )
+    parser.add_argument(
+        "-c", "--columns",
+        nargs="+",
+        choices=ALL_COLUMNS,
+        default=DEFAULT_COLUMNS,
+        help="The columns to record besides game and turn; the summary needs flock_total."
+    )
+    args = parser.parse_args()
+    paths = trace_games(args.directory, num_simulations=args.num_simulations, num_players=args.num_players,
+                        workers=args.workers, seed=args.seed, chunk_size=args.chunk_size, columns=args.columns)
+    columns = load_traces(args.directory)
+    print(f"--- Traced {args.num_simulations} games into {len(paths)} files in {args.directory} ---")
+    print(f"{len(columns['turn'])} turns recorded in the directory")
+    if "flock_total" not in columns:
+        return
+    turns, flock, hens, games = flock_by_turn(columns, max_turn=min(30, int(columns["turn"].max())))
+    if hens is None:
+        print("Turn  Games  Flock/player")
+        for row in zip(turns, games, flock):
+            print("{:>4} {:>6} {:>13.2f}".format(*row))
+        return
+    print("Turn  Games  Flock/player  Hens/player")
+    for row in zip(turns, games, flock, hens):
+        print("{:>4} {:>6} {:>13.2f} {:>12.2f}".format(*row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""Exact outcome distributions for the die-driven effects.
+
+roll_chicken_die, Die-Die-Die! (three rolls where only 4, 5 and 6 count) and Fox on
+the Loose (two rolls for every player, in seat order) depend only on the flocks,
+egg cards and Immunity cards of the players they hit and on the shared supplies.
+This module enumerates their outcomes exactly, with Fraction probabilities, and
+memoizes every single-player step in bounded caches, so questions such as
+
+    >>> fox = fox_outcomes([FlockState.of(chicks=1, hens=1)], Supplies())
+    >>> survival_probability(fox)
+    Fraction(67, 72)
+
+cost one enumeration the first time and a cache lookup afterwards.
+
+A table state is (flocks, supplies): a tuple of FlockState, one per player, and
+the Supplies. A Distribution maps table states to probabilities and its
+sample() draws an outcome with one random number. Players only affect each other
+through the supplies, so Fox on the Loose is factored per player: the joint
+fox_outcomes grows about 25 times with every player and is only practical up to
+3 or 4 players, while fox_seat_outcomes (one player's chances) and sample_fox
+(one drawn outcome) stay cheap at any table size. from_game / apply_to_game
+convert between a Game and table states, so a simulation can replace a sequence of rolls
+by a single lookup (which uses the RNG differently from replaying the rolls).
+"""
+import bisect
+import functools
+import itertools
+from fractions import Fraction
+from typing import NamedTuple
+
+from simulation import FLOCK_KEYS, IMMUNITY, SPECIALTY_NAMES, CHICKS, HENS, DINO, FLYING, MAD, ROBO, DECOY, PUNK
+
+# Kill candidates in the order Game._kill_a_chicken lists them; dice are not
+# predators, so a Dino Chicken can die too
+_KILL_ORDER = (CHICKS, HENS, FLYING, MAD, ROBO, PUNK, DINO)
+_SIXTH = Fraction(1, 6)
+# Memoized single-player steps are small and shared widely; whole-table distributions are large
+_CACHE_SIZE = 1 << 16
+_TABLE_CACHE_SIZE = 8
+
+
+class FlockState(NamedTuple):
+    """What a roll can change about one player."""
+    counts: tuple # Flock counts in FLOCK_KEYS order
+    eggs: int = 0 # Egg cards
+    immunity: int = 0 # Immunity cards in hand
+
+    @classmethod
+    def of(cls, chicks=0, hens=0, eggs=0, immunity=0, **specialty):
+        """Builds a state from keyword counts; specialty chickens by FLOCK_KEYS name, e.g. decoy_chickens=1."""
+        counts = [0] * len(FLOCK_KEYS)
+        counts[CHICKS], counts[HENS] = chicks, hens
+        keys = {key.lower().replace(" ", "_").replace("-", "_"): i for i, key in enumerate(FLOCK_KEYS)}
+        for name, count in specialty.items():
+            counts[keys[name]] = count
+        return cls(tuple(counts), eggs, immunity)
+
+    def total(self):
+        return sum(self.counts)
+
+
+class Supplies(NamedTuple):
+    chicks: int = 50
+    hens: int = 50
+    eggs: int = 100
+
+
+def _add(counts, kind, amount):
+    counts = list(counts)
+    counts[kind] += amount
+    return tuple(counts)
+
+
+def _kill(flock, supplies):
+    """[(flock, supplies, probability)] after _kill_a_chicken without an attacker."""
+    if flock.immunity > 0:
+        return [(flock._replace(immunity=flock.immunity - 1), supplies, Fraction(1))]
+    if flock.counts[DECOY] > 0:
+        return [(flock._replace(counts=_add(flock.counts, DECOY, -1)), supplies, Fraction(1))]
+    candidates = [kind for kind in _KILL_ORDER if flock.counts[kind] > 0]
+    if not candidates:
+        return [(flock, supplies, Fraction(1))]
+    outcomes = []
+    for kind in candidates:
+        if kind == CHICKS:
+            after = supplies._replace(chicks=supplies.chicks + 1)
+        elif kind == HENS:
+            after = supplies._replace(hens=supplies.hens + 1)
+        else:
+            after = supplies # Specialty chickens go to the graveyard
+        outcomes.append((flock._replace(counts=_add(flock.counts, kind, -1)), after,
+                         Fraction(1, len(candidates))))
+    return outcomes
+
+
+def _face(flock, supplies, roll):
+    """[(flock, supplies, probability)] after one die face, as in Game.roll_chicken_die."""
+    counts = flock.counts
+    if roll == 1: # Collect an Egg!
+        if supplies.eggs > 0:
+            return [(flock._replace(eggs=flock.eggs + 1), supplies._replace(eggs=supplies.eggs - 1), Fraction(1))]
+    elif roll == 2: # Promote an Egg!
+        if flock.eggs > 0 and supplies.chicks > 0:
+            return [(flock._replace(counts=_add(counts, CHICKS, 1), eggs=flock.eggs - 1),
+                     supplies._replace(chicks=supplies.chicks - 1, eggs=supplies.eggs + 1), Fraction(1))]
+    elif roll == 3: # Promote a Chick!
+        if counts[CHICKS] > 0 and supplies.hens > 0:
+            return [(flock._replace(counts=_add(_add(counts, CHICKS, -1), HENS, 1)),
+                     supplies._replace(hens=supplies.hens - 1), Fraction(1))]
+    elif roll == 4: # Demote a Chick!
+        if counts[CHICKS] > 0 and supplies.eggs > 0:
+            return [(flock._replace(counts=_add(counts, CHICKS, -1), eggs=flock.eggs + 1),
+                     supplies._replace(chicks=supplies.chicks + 1, eggs=supplies.eggs - 1), Fraction(1))]
+    elif roll == 5: # Demote a Hen!
+        if counts[HENS] > 0 and supplies.chicks > 0:
+            return [(flock._replace(counts=_add(_add(counts, HENS, -1), CHICKS, 1)),
+                     supplies._replace(chicks=supplies.chicks - 1, hens=supplies.hens + 1), Fraction(1))]
+    else: # A Chicken Dies!
+        return _kill(flock, supplies)
+    return [(flock, supplies, Fraction(1))]
+
+
+class Distribution(dict):
+    """Table state -> Fraction probability; memoized distributions are shared, so treat them as read-only."""
+    _states = None
+
+    def sample(self, rng):
+        """Draws one table state with a single rng.random() call."""
+        if self._states is None:
+            self._states = tuple(self)
+            self._cumulative = tuple(itertools.accumulate(float(p) for p in self.values()))
+        index = bisect.bisect_right(self._cumulative, rng.random() * self._cumulative[-1])
+        return self._states[min(index, len(self._states) - 1)]
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _roll(flock, supplies, faces):
+    """{(flock, supplies): probability} after one roll where only the given faces have an effect."""
+    outcomes = {}
+    for roll in range(1, 7):
+        if roll in faces:
+            results = _face(flock, supplies, roll)
+        else:
+            results = [(flock, supplies, Fraction(1))]
+        for after_flock, after_supplies, probability in results:
+            key = (after_flock, after_supplies)
+            outcomes[key] = outcomes.get(key, 0) + _SIXTH * probability
+    return outcomes
+
+
+_ALL_FACES = frozenset(range(1, 7))
+_NEGATIVE_FACES = frozenset((4, 5, 6))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _player_rolls(flock, supplies, rolls, faces):
+    """Distribution over (flock, supplies) after rolls rolls of one player, where only the given faces count."""
+    outcomes = {(flock, supplies): Fraction(1)}
+    for _ in range(rolls):
+        after = {}
+        for (state_flock, state_supplies), probability in outcomes.items():
+            for key, roll_probability in _roll(state_flock, state_supplies, faces).items():
+                after[key] = after.get(key, 0) + probability * roll_probability
+        outcomes = after
+    return Distribution(outcomes)
+
+
+@functools.lru_cache(maxsize=_TABLE_CACHE_SIZE)
+def _table_rolls(flocks, supplies, rolls, faces):
+    """Distribution over table states after rolls rolls for every player, in seat order.
+
+    Players only affect each other through the supplies, so the table is built
+    one player at a time from each player's own outcomes given the supplies the
+    earlier players left.
+    """
+    outcomes = {((), supplies): Fraction(1)}
+    for flock in flocks:
+        after = {}
+        for (done, state_supplies), probability in outcomes.items():
+            for (after_flock, after_supplies), p in _player_rolls(flock, state_supplies, rolls, faces).items():
+                key = (done + (after_flock,), after_supplies)
+                after[key] = after.get(key, 0) + probability * p
+        outcomes = after
+    return Distribution(outcomes)
+
+
+def _table(flocks, supplies):
+    return tuple(flocks), Supplies(*supplies)
+
+
+def _single(outcomes):
+    """A single player's Distribution, keyed by table state like the rest of the module."""
+    return Distribution({((flock,), supplies): p for (flock, supplies), p in outcomes.items()})
+
+
+def roll_outcomes(flock, supplies=Supplies()):
+    """Distribution after Game.roll_chicken_die for a single player."""
+    return _single(_player_rolls(flock, Supplies(*supplies), 1, _ALL_FACES))
+
+
+def die_die_die_outcomes(flock, supplies=Supplies()):
+    """Distribution after Die-Die-Die! hits a single player: three rolls, only 4, 5 and 6 count."""
+    return _single(_player_rolls(flock, Supplies(*supplies), 3, _NEGATIVE_FACES))
+
+
+def fox_outcomes(flocks, supplies=Supplies()):
+    """Distribution after Fox on the Loose: two rolls for every player, in seat order.
+
+    This is the joint distribution over the whole table, which grows about 25
+    times with every player: about 12 thousand states and 0.2 seconds for an
+    opening table of 3 players, about 300 thousand states and 2 seconds for 4. Use
+    fox_seat_outcomes for one player's chances and sample_fox to draw outcomes
+    at larger tables.
+    """
+    flocks, supplies = _table(flocks, supplies)
+    return _table_rolls(flocks, supplies, 2, _ALL_FACES)
+
+
+def fox_seat_outcomes(flocks, supplies=Supplies(), seat=0):
+    """Distribution of one player's state after Fox on the Loose, without the rest of the table.
+
+    The earlier players only matter through the supplies they leave, so only
+    those are carried forward. Keyed like roll_outcomes, with the supplies as
+    they are right after this player's rolls.
+    """
+    flocks, supplies = _table(flocks, supplies)
+    before = {supplies: Fraction(1)}
+    for flock in flocks[:seat]:
+        after = {}
+        for state_supplies, probability in before.items():
+            for (_, after_supplies), p in _player_rolls(flock, state_supplies, 2, _ALL_FACES).items():
+                after[after_supplies] = after.get(after_supplies, 0) + probability * p
+        before = after
+    outcomes = Distribution()
+    for state_supplies, probability in before.items():
+        for (flock, after_supplies), p in _player_rolls(flocks[seat], state_supplies, 2, _ALL_FACES).items():
+            key = ((flock,), after_supplies)
+            outcomes[key] = outcomes.get(key, 0) + probability * p
+    return outcomes
+
+
+def sample_fox(flocks, supplies, rng):
+    """Draws a table state after Fox on the Loose with one rng.random() call per player.
+
+    Each player's outcome is drawn from their own two rolls given the supplies
+    the earlier players left, which has the law of fox_outcomes(...).sample()
+    at the cost of a cached lookup per player instead of the whole table.
+    """
+    flocks, supplies = _table(flocks, supplies)
+    after = []
+    for flock in flocks:
+        flock, supplies = _player_rolls(flock, supplies, 2, _ALL_FACES).sample(rng)
+        after.append(flock)
+    return tuple(after), supplies
+
+
+def survival_probability(distribution, seat=0):
+    """Probability that the player in seat still has a chicken afterwards."""
+    return sum((p for (flocks, _), p in distribution.items() if flocks[seat].total() > 0), Fraction(0))
+
+
+def expected_counts(distribution, seat=0):
+    """Expected flock counts of the player in seat afterwards, in FLOCK_KEYS order."""
+    expected = [Fraction(0)] * len(FLOCK_KEYS)
+    for (flocks, _), p in distribution.items():
+        for kind, count in enumerate(flocks[seat].counts):
+            expected[kind] += p * count
+    return tuple(expected)
+
+
+def from_game(game, players=None):
+    """The table state of a Game for the given players (all of them by default)."""
+    players = game.players if players is None else players
+    flocks = [FlockState(tuple(p.counts), p.egg_cards, p.hand.count(IMMUNITY))
+              for p in players]
+    return _table(flocks, (game.chick_supply, game.hen_supply, game.egg_supply))
+
+
+def apply_to_game(game, state, players=None):
+    """Writes a table state back into a Game: flocks, eggs, supplies, used Immunity cards and the graveyard."""
+    players = game.players if players is None else players
+    flocks, supplies = state
+    for player, flock in zip(players, flocks):
+        for kind, count in enumerate(flock.counts):
+            lost = player.counts[kind] - count
+            if SPECIALTY_NAMES[kind] is not None and lost > 0:
+                game.graveyard.extend([SPECIALTY_NAMES[kind]] * lost)
+            player.set_count(kind, count)
+        player.egg_cards = flock.eggs
+        for _ in range(player.hand.count(IMMUNITY) - flock.immunity):
+            player.hand.remove(IMMUNITY)
+            game.deck.discard_pile.append(IMMUNITY.id)
+    game.chick_supply, game.hen_supply, game.egg_supply = supplies